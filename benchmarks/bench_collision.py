@@ -0,0 +1,65 @@
+"""Micro-benchmark: bullet collision checks, all-pairs vs broadphase.
+
+Run with ``python -m benchmarks.bench_collision``. Compares testing every
+bullet against every shield and every alien (the AABB loops) with the
+spatial hash for shields and the formation lattice for aliens, at the
+bullet counts ``rapid_fire`` and ``bullet_hell`` reach.
+"""
+import random
+import timeit
+
+from tty_invaders.config import GAME_HEIGHT, GAME_WIDTH, PLAY_AREA_TOP
+from tty_invaders.entities.bullet import Bullet
+from tty_invaders.entities.formation import AlienFormation
+from tty_invaders.entities.shield import create_shields
+from tty_invaders.systems.collision import (
+    check_aabb_collision, check_bullet_alien_collisions, check_bullet_formation_collisions,
+    check_bullet_shield_collisions
+)
+
+BULLET_COUNTS = (20, 200, 1000)
+REPEAT = 5
+
+
+def all_pairs_shield_collisions(bullets: list, shields: list) -> list:
+    """Test every bullet against every shield (the check before the hash)."""
+    collisions = []
+    for bullet in bullets:
+        if not bullet.alive:
+            continue
+        bullet_bounds = bullet.get_bounds()
+        for shield in shields:
+            if shield.alive and check_aabb_collision(bullet_bounds, shield.get_bounds()):
+                collisions.append((bullet, shield))
+                break
+    return collisions
+
+
+def main() -> None:
+    """Time each check per call for several bullet counts."""
+    rng = random.Random(1)
+    shields = create_shields()
+    formation = AlienFormation(1)
+    aliens = formation.get_alive_aliens()
+
+    for count in BULLET_COUNTS:
+        bullets = [Bullet(rng.randrange(GAME_WIDTH), rng.randrange(PLAY_AREA_TOP, GAME_HEIGHT),
+                          is_player=rng.random() < 0.5) for _ in range(count)]
+        assert (all_pairs_shield_collisions(bullets, shields)
+                == check_bullet_shield_collisions(bullets, shields))
+        assert (check_bullet_alien_collisions(bullets, aliens)
+                == check_bullet_formation_collisions(bullets, formation))
+        number = max(1, 20_000 // count)
+        checks = (
+            ("shields all-pairs", lambda: all_pairs_shield_collisions(bullets, shields)),
+            ("shields hash", lambda: check_bullet_shield_collisions(bullets, shields)),
+            ("aliens all-pairs", lambda: check_bullet_alien_collisions(bullets, aliens)),
+            ("aliens lattice", lambda: check_bullet_formation_collisions(bullets, formation)),
+        )
+        for name, func in checks:
+            seconds = min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+            print(f"{count:5d} bullets  {name:18s} {seconds * 1e6:9.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
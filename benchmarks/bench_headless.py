@@ -0,0 +1,48 @@
+"""Benchmark: a scripted game session on the headless terminal.
+
+Run with ``python -m benchmarks.bench_headless``. Settings and high score
+files are written to a temporary directory.
+"""
+import os
+import tempfile
+import time
+
+from tty_invaders.game import Game
+from tty_invaders.renderer.headless import HeadlessTerminal
+
+FRAMES = 2000
+
+
+def session_keys() -> list:
+    """Build input that starts a game and keeps moving and firing."""
+    keys = [" "]
+    while len(keys) < FRAMES:
+        keys += ["KEY_LEFT", " ", None] * 15 + ["KEY_RIGHT", " ", None] * 15
+    return keys
+
+
+def main() -> None:
+    """Run the session and report render cost and output volume."""
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            term = HeadlessTerminal(keys=session_keys())
+            game = Game(term)
+            game.initialize()
+            start = time.perf_counter()
+            game.run(max_frames=FRAMES)
+            seconds = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+
+    frames = term.frames_written
+    print(f"frames           {frames:8d}")
+    print(f"time per frame   {seconds / frames * 1e6:8.1f} us")
+    print(f"bytes per frame  {term.bytes_written / frames:8.1f}")
+    print(f"cells per frame  {term.cells_written / frames:8.1f}")
+    print(f"culled per frame {term.compositor.cells_culled / frames:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
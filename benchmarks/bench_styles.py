@@ -0,0 +1,37 @@
+"""Micro-benchmark: cost of one styled write, blessed formatter vs StyleRegistry.
+
+Run with ``python -m benchmarks.bench_styles``.
+"""
+import io
+import timeit
+
+from blessed import Terminal as BlessedTerminal
+
+from tty_invaders.renderer.styles import StyleRegistry
+
+COLORS = ["red", "yellow", "cyan", "bright_white", "bright_yellow", "bright_black"]
+TEXT = " ▄▀▄ "
+NUMBER = 200_000
+
+
+def main() -> None:
+    """Time styled writes with and without the registry."""
+    term = BlessedTerminal(kind="xterm-256color", force_styling=True, stream=io.StringIO())
+    styles = StyleRegistry.for_terminal(term)
+
+    def blessed_write() -> None:
+        for color in COLORS:
+            getattr(term, color)(TEXT)
+
+    def registry_write() -> None:
+        for color in COLORS:
+            prefix, suffix = styles.resolve(color)
+            prefix + TEXT + suffix
+
+    for name, func in (("blessed getattr", blessed_write), ("StyleRegistry", registry_write)):
+        seconds = min(timeit.repeat(func, number=NUMBER // len(COLORS), repeat=5))
+        print(f"{name:16s} {seconds / NUMBER * 1e9:8.1f} ns/write")
+
+
+if __name__ == "__main__":
+    main()
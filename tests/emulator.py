@@ -0,0 +1,88 @@
+"""Minimal VT screen model for checking encoded output in tests."""
+import re
+from typing import List
+
+_CSI = re.compile(r"\x1b\[(\??)([\d;]*)([@-~])")
+
+
+class Screen:
+    """Applies the subset of VT sequences the renderer emits.
+
+    Attributes are ignored; only glyphs are tracked.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Create a blank screen."""
+        self.width = width
+        self.height = height
+        self.cells = [[" "] * width for _ in range(height)]
+        self.x = 0
+        self.y = 0
+        self.top = 0
+        self.bottom = height - 1
+
+    def lines(self) -> List[str]:
+        """Get the screen contents."""
+        return ["".join(row) for row in self.cells]
+
+    def feed(self, data: bytes) -> None:
+        """Apply terminal output."""
+        text = data.decode()
+        i = 0
+        while i < len(text):
+            ch = text[i]
+            if ch == "\x1b":
+                match = _CSI.match(text, i)
+                assert match, f"unsupported sequence {text[i:i + 10]!r}"
+                self._csi(match.group(1), match.group(2), match.group(3))
+                i = match.end()
+                continue
+            if ch == "\r":
+                self.x = 0
+            elif ch == "\b":
+                self.x = max(0, self.x - 1)
+            else:
+                assert self.x < self.width, "write past the right margin"
+                self.cells[self.y][self.x] = ch
+                self.x += 1
+            i += 1
+
+    def _csi(self, private: str, params: str, final: str) -> None:
+        """Apply one control sequence."""
+        if private or final == "m":
+            return
+        args = [int(p) if p else 0 for p in params.split(";")] if params else []
+        n = args[0] if args and args[0] else 1
+        if final == "H":
+            self.y = (args[0] if args else 1) - 1
+            self.x = (args[1] if len(args) > 1 else 1) - 1
+        elif final == "A":
+            self.y = max(0, self.y - n)
+        elif final == "B":
+            self.y = min(self.height - 1, self.y + n)
+        elif final == "C":
+            self.x = min(self.width - 1, self.x + n)
+        elif final == "D":
+            self.x = max(0, min(self.x, self.width - 1) - n)
+        elif final == "J":
+            self.cells = [[" "] * self.width for _ in range(self.height)]
+        elif final == "r":
+            self.top = (args[0] if args else 1) - 1
+            self.bottom = (args[1] if len(args) > 1 else self.height) - 1
+            self.x = self.y = 0
+        elif final == "L":
+            region = self.cells[self.y:self.bottom + 1]
+            region = [[" "] * self.width for _ in range(n)] + region
+            self.cells[self.y:self.bottom + 1] = region[:self.bottom + 1 - self.y]
+        elif final == "M":
+            region = self.cells[self.y:self.bottom + 1][n:]
+            region += [[" "] * self.width for _ in range(self.bottom + 1 - self.y - len(region))]
+            self.cells[self.y:self.bottom + 1] = region
+        elif final == "@":
+            row = self.cells[self.y]
+            row[self.x:] = ([" "] * n + row[self.x:])[:self.width - self.x]
+        elif final == "P":
+            row = self.cells[self.y]
+            row[self.x:] = (row[self.x + n:] + [" "] * n)[:self.width - self.x]
+        else:
+            raise AssertionError(f"unsupported sequence CSI {params}{final}")
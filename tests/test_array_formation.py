@@ -0,0 +1,103 @@
+"""Tests for the NumPy-backed alien formation."""
+import random
+import pytest
+
+pytest.importorskip("numpy")
+
+from tty_invaders.entities import array_formation
+from tty_invaders.entities.array_formation import (
+    ArrayAlienFormation, create_formation
+)
+from tty_invaders.entities.formation import AlienFormation
+from tty_invaders.entities.bullet import Bullet
+from tty_invaders.systems.collision import (
+    check_aliens_reached_bottom, check_bullet_alien_collisions, check_bullet_formation_collisions
+)
+
+
+def alien_state(formation: AlienFormation) -> list:
+    """Get what the game reads from each alive alien."""
+    return [(a.row, a.col, a.x, a.y, a.get_bounds(), a.sprite_id, a.frame, a.sprite,
+             a.color, a.get_score_value()) for a in formation.get_alive_aliens()]
+
+
+class TestArrayAlienFormation:
+    """Test the array formation against AlienFormation."""
+
+    def test_matches_object_formation(self) -> None:
+        """Test both formations march, descend and animate identically."""
+        rng = random.Random(7)
+        for level in (1, 6):
+            objects, arrays = AlienFormation(level), ArrayAlienFormation(level)
+            for step in range(1500):
+                dt = rng.choice((1 / 60, 0.05, 0.2))
+                objects.update(dt)
+                arrays.update(dt)
+                if step % 50 == 0:
+                    index = rng.randrange(len(objects.aliens))
+                    objects.aliens[index].alive = False
+                    arrays.aliens[index].alive = False
+                assert alien_state(arrays) == alien_state(objects)
+                assert (arrays.origin_x, arrays.origin_y, arrays.direction) == \
+                    (objects.origin_x, objects.origin_y, objects.direction)
+                assert arrays.get_lowest_y() == objects.get_lowest_y()
+                assert arrays.get_row_lines() == objects.get_row_lines()
+
+    def test_kill_writes_alive_mask(self) -> None:
+        """Test setting alive on a view updates the arrays."""
+        formation = ArrayAlienFormation(1)
+        formation.aliens[3].alive = False
+        assert not formation.alive[3]
+        assert formation.aliens[3] not in formation.get_alive_aliens()
+        for alien in formation.aliens:
+            alien.alive = False
+        assert formation.is_cleared()
+        assert formation.get_lowest_y() == 0
+
+    def test_view_position_writes_arrays(self) -> None:
+        """Test setting a view's position updates the arrays and its bounds."""
+        formation = ArrayAlienFormation(1)
+        view = formation.aliens[4]
+        view.x = 12.5
+        view.y = 9
+        assert (formation.x[4], formation.y[4]) == (12.5, 9)
+        assert view.get_bounds() == (12, 9, view.width, view.height)
+
+    def test_reached_bottom(self) -> None:
+        """Test the vectorized bottom check agrees with the per-alien one."""
+        formation = ArrayAlienFormation(1)
+        lowest = formation.get_lowest_y()
+        for bottom in (lowest - 1, lowest, lowest + 1):
+            assert formation.reached_bottom(bottom) == \
+                check_aliens_reached_bottom(formation.get_alive_aliens(), bottom)
+        for alien in formation.aliens[-11:]:
+            alien.alive = False
+        assert not formation.reached_bottom(lowest)
+
+    def test_reset_rebuilds_arrays(self) -> None:
+        """Test a new level resizes the arrays for its row count."""
+        formation = ArrayAlienFormation(1)
+        formation.aliens[0].alive = False
+        formation.update(0.5)
+        formation.reset(5)
+        assert len(formation.aliens) == formation.rows * 11 == len(formation.x)
+        assert formation.alive.all()
+        assert formation.origin_x == formation.x[0]
+
+    def test_lattice_hits_match_aabb(self) -> None:
+        """Test the lattice hit test works through the array views."""
+        formation = ArrayAlienFormation(1)
+        for alien in formation.aliens[::3]:
+            alien.alive = False
+        formation.update(0.7)
+        bullets = [Bullet(x, y) for y in range(24) for x in range(80)]
+        assert check_bullet_formation_collisions(bullets, formation) == \
+            check_bullet_alien_collisions(bullets, formation.get_alive_aliens())
+
+    def test_create_formation_fallback(self, monkeypatch) -> None:
+        """Test the factory uses the arrays only when enabled and numpy is present."""
+        monkeypatch.setattr(array_formation, "ARRAY_FORMATION", True)
+        assert isinstance(create_formation(1), ArrayAlienFormation)
+        monkeypatch.setattr(array_formation, "np", None)
+        formation = create_formation(1)
+        assert type(formation) is AlienFormation
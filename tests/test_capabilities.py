@@ -0,0 +1,66 @@
+"""Tests for terminal capability probing helpers."""
+import os
+import tempfile
+import pytest
+from tty_invaders.utils.capabilities import (
+    CapabilityCache, decrqm_query, parse_decrqm_reply, split_probe_reply, terminal_identity
+)
+
+
+class TestDecrqm:
+    """Test DECRQM query building and reply parsing."""
+
+    def test_query(self) -> None:
+        """Test the query sequence for a private mode."""
+        assert decrqm_query(2026) == b"\x1b[?2026$p"
+
+    def test_parse_reply(self) -> None:
+        """Test the status is extracted from surrounding input."""
+        assert parse_decrqm_reply(b"a\x1b[?2026;2$yb", 2026) == 2
+        assert parse_decrqm_reply(b"\x1b[?2026;0$y", 2026) == 0
+
+    def test_parse_incomplete_or_other_mode(self) -> None:
+        """Test partial replies and other modes are ignored."""
+        assert parse_decrqm_reply(b"\x1b[?2026;1", 2026) is None
+        assert parse_decrqm_reply(b"\x1b[?25;1$y", 2026) is None
+
+    def test_split_waits_for_da1(self) -> None:
+        """Test a DECRPM reply alone is not a result until DA1 arrives."""
+        assert split_probe_reply(b"\x1b[?2026;2$y", 2026) == (None, b"\x1b[?2026;2$y")
+        assert split_probe_reply(b"\x1b[?2026;2$y\x1b[?62;22", 2026)[0] is None
+
+    def test_split_removes_replies(self) -> None:
+        """Test both replies are consumed and typed keys are kept."""
+        data = b"a\x1b[?2026;1$yb\x1b[?62;1;4;22cq"
+        assert split_probe_reply(data, 2026) == (1, b"abq")
+
+    def test_split_da1_only_means_unsupported(self) -> None:
+        """Test a terminal that only answers DA1 reports the mode unrecognized."""
+        assert split_probe_reply(b"x\x1b[?1;2c", 2026) == (0, b"x")
+
+
+class TestCapabilityCache:
+    """Test probe result persistence."""
+
+    def test_identity_ignores_tmux_socket(self) -> None:
+        """Test identity depends on the terminal, not the session."""
+        env1 = {"TERM": "xterm-256color", "TMUX": "/tmp/tmux-1/default,1,0"}
+        env2 = {"TERM": "xterm-256color", "TMUX": "/tmp/tmux-1/other,2,0"}
+        assert terminal_identity(env1) == terminal_identity(env2)
+        assert terminal_identity(env1) != terminal_identity({"TERM": "xterm-256color"})
+
+    def test_persistence(self) -> None:
+        """Test results survive across instances."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_file = f.name
+
+        try:
+            cache = CapabilityCache(temp_file)
+            assert cache.get("xterm", "synchronized_output") is None
+            cache.set("xterm", "synchronized_output", True)
+            cache.save()
+
+            assert CapabilityCache(temp_file).get("xterm", "synchronized_output") is True
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
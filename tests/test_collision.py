@@ -1,6 +1,27 @@
 """Tests for collision detection system."""
+import random
+from typing import Any, List
 import pytest
-from tty_invaders.systems.collision import check_aabb_collision
+from tty_invaders.entities.bullet import Bullet
+from tty_invaders.entities.formation import AlienFormation
+from tty_invaders.entities.shield import create_shields
+from tty_invaders.systems.collision import (
+    SpatialHash, check_aabb_collision, check_bullet_alien_collisions,
+    check_bullet_formation_collisions, check_bullet_shield_collisions
+)
+from tty_invaders.config import GAME_WIDTH, GAME_HEIGHT
+
+
+def grid_bullets() -> List[Bullet]:
+    """Create a player bullet on every cell of the game area, plus one alien bullet."""
+    bullets = [Bullet(x, y) for y in range(GAME_HEIGHT) for x in range(-2, GAME_WIDTH + 2)]
+    return bullets + [Bullet(10, 6, is_player=False)]
+
+
+def assert_same_hits(formation: Any, bullets: List[Bullet]) -> None:
+    """Check the lattice lookup gives the same pairs as the AABB loop."""
+    expected = check_bullet_alien_collisions(bullets, formation.get_alive_aliens())
+    assert check_bullet_formation_collisions(bullets, formation) == expected
 
 
 class TestAABBCollision:
@@ -48,3 +69,74 @@ class TestAABBCollision:
         box1 = (0, 0, 10, 5)
         box2 = (2, 10, 5, 5)
         assert not check_aabb_collision(box1, box2)
+
+
+class TestFormationCollisions:
+    """Test the lattice hit test against the AABB loop."""
+
+    def test_matches_aabb_while_marching(self) -> None:
+        """Test every cell hits the same alien as the AABB loop as the formation moves."""
+        rng = random.Random(11)
+        bullets = grid_bullets()
+        for level in (1, 7):
+            formation = AlienFormation(level)
+            for _ in range(10):
+                formation.update(rng.choice((1 / 60, 0.37, 2.3)))
+                for _ in range(3):
+                    rng.choice(formation.aliens).alive = False
+                assert_same_hits(formation, bullets)
+
+    def test_fractional_origin(self) -> None:
+        """Test positions that round across a lattice boundary still match."""
+        bullets = grid_bullets()
+        formation = AlienFormation(1)
+        for origin in (2.9999999999999996, 3.0000000000000004, 0.5, 7.25):
+            formation.origin_x = origin
+            formation.update(0.0)
+            assert_same_hits(formation, bullets)
+
+    def test_hits_found(self) -> None:
+        """Test a bullet inside an alive alien hits it and a dead one is passed."""
+        formation = AlienFormation(1)
+        alien = formation.aliens[12]
+        bullet = Bullet(int(alien.x) + 4, alien.y + 1)
+        assert check_bullet_formation_collisions([bullet], formation) == [(bullet, alien)]
+        alien.alive = False
+        assert check_bullet_formation_collisions([bullet], formation) == []
+
+
+class TestSpatialHash:
+    """Test the broadphase grid."""
+
+    def test_first_at_matches_all_pairs(self) -> None:
+        """Test lookups find the first inserted box covering each cell."""
+        rng = random.Random(5)
+        boxes = [(rng.randint(-5, 80), rng.randint(-5, 24), rng.randint(1, 12), rng.randint(1, 6))
+                 for _ in range(60)]
+        grid = SpatialHash(bucket_size=4)
+        for i, box in enumerate(boxes):
+            grid.insert(i, box)
+        assert len(grid) == 60
+        for y in range(-6, 30):
+            for x in range(-6, 90):
+                expected = next((i for i, box in enumerate(boxes)
+                                 if check_aabb_collision((x, y, 1, 1), box)), None)
+                assert grid.first_at(x, y) == expected
+
+    def test_bullet_shield_collisions(self) -> None:
+        """Test shield hits match testing every bullet against every shield."""
+        shields = create_shields()
+        shields[1].alive = False
+        bullets = grid_bullets()
+        bullets[5].alive = False
+        expected = []
+        for bullet in bullets:
+            if not bullet.alive:
+                continue
+            for shield in shields:
+                if shield.alive and check_aabb_collision(bullet.get_bounds(),
+                                                         shield.get_bounds()):
+                    expected.append((bullet, shield))
+                    break
+        assert expected
+        assert check_bullet_shield_collisions(bullets, shields) == expected
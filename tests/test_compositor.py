@@ -0,0 +1,147 @@
+"""Tests for the layered compositor."""
+import pytest
+from tty_invaders.renderer.compositor import LAYER_EFFECTS, LAYER_PLAYFIELD, Compositor
+from tty_invaders.renderer.framebuffer import BLANK, FrameBuffer
+from tty_invaders.renderer.sprite_cache import SpriteCache
+
+
+def row_text(fb: FrameBuffer, y: int) -> str:
+    """Get the glyphs of a back grid row."""
+    return "".join(glyph for glyph, _ in fb.back[y])
+
+
+class TestLayer:
+    """Test layer content caching."""
+
+    def test_begin_only_when_key_changes(self) -> None:
+        """Test a layer is redrawn only for a new content key."""
+        layer = Compositor(SpriteCache()).layer("hud")
+        assert layer.begin((100, 3))
+        layer.write_at(0, 0, "100")
+        assert not layer.begin((100, 3))
+        assert len(layer.spans) == 1
+        assert layer.begin((200, 3))
+        assert layer.spans == []
+
+    def test_draw_records_spans(self) -> None:
+        """Test a draw list is stored as one span per command."""
+        layer = Compositor(SpriteCache()).layer("hud")
+        layer.draw([(0, 0, "ab", "red"), (4, 1, "c", None)])
+        assert layer.spans == [(0, 0, (("a", "red"), ("b", "red"))), (4, 1, (("c", None),))]
+        assert layer.dirty
+
+    def test_invalidate_forces_redraw(self) -> None:
+        """Test invalidate makes the same key redraw."""
+        layer = Compositor(SpriteCache()).layer("hud")
+        layer.begin("key")
+        layer.invalidate()
+        assert layer.begin("key")
+
+
+class TestCompositor:
+    """Test compositing layers into a framebuffer."""
+
+    def test_base_layers_start_frame(self) -> None:
+        """Test each frame starts from the background layer."""
+        compositor = Compositor(SpriteCache())
+        compositor.layer("background").write_at(1, 0, "##")
+        fb = FrameBuffer(6, 2)
+        compositor.compose_base(fb, x_offset=2)
+        assert row_text(fb, 0) == "   ## "
+
+        fb.put(0, 1, "x")
+        compositor.compose_base(fb, x_offset=2)
+        assert fb.back[1][0] == BLANK
+
+    def test_base_is_cached(self) -> None:
+        """Test the base grid is only recomposed when a layer is dirty."""
+        compositor = Compositor(SpriteCache())
+        background = compositor.layer("background")
+        background.write_at(0, 0, "ab")
+        fb = FrameBuffer(4, 1)
+        compositor.compose_base(fb, 0)
+        assert not background.dirty
+
+        # Tampering with spans is invisible until the layer is dirty again
+        background.spans[:] = [(0, 0, (("z", None),))]
+        compositor.compose_base(fb, 0)
+        assert row_text(fb, 0) == "ab  "
+        background.clear()
+        compositor.compose_base(fb, 0)
+        assert row_text(fb, 0) == "    "
+
+    def test_overlay_draws_on_top(self) -> None:
+        """Test the HUD overwrites immediate drawing."""
+        compositor = Compositor(SpriteCache())
+        compositor.layer("hud").write_at(0, 0, "HUD")
+        fb = FrameBuffer(5, 1)
+        fb.put(0, 0, "xxxxx")
+        compositor.compose_overlay(fb, 0)
+        assert row_text(fb, 0) == "HUDxx"
+
+    def test_resolve_in_z_order(self) -> None:
+        """Test higher lists win regardless of submission order."""
+        compositor = Compositor(SpriteCache())
+        compositor.submit([(0, 0, "ee", None)], LAYER_EFFECTS)
+        compositor.submit([(0, 0, "pppp", None), (3, 0, "q", None)], LAYER_PLAYFIELD)
+        fb = FrameBuffer(5, 1)
+        compositor.resolve(fb, 0)
+        assert row_text(fb, 0) == "eepq "
+        assert compositor.submitted == []
+
+    def test_resolve_culls_hidden_cells(self) -> None:
+        """Test cells under higher lists or the HUD are skipped and counted."""
+        compositor = Compositor(SpriteCache())
+        compositor.layer("hud").write_at(0, 0, "H")
+        compositor.submit([(0, 0, "abc", None), (1, 0, "xy", "red")])
+        fb = FrameBuffer(4, 1)
+        compositor.resolve(fb, 0)
+        compositor.compose_overlay(fb, 0)
+        assert row_text(fb, 0) == "Hxy "
+        assert fb.back[0][1] == ("x", "red")
+        assert (compositor.cells_drawn, compositor.cells_culled) == (2, 3)
+
+    def test_resolve_matches_painting(self) -> None:
+        """Test the result equals drawing every list bottom-up."""
+        lists = [
+            (LAYER_EFFECTS, [(2, 0, "**", None), (-1, 1, "***", "red")]),
+            (LAYER_PLAYFIELD, [(0, 0, "abcdef", None), (4, 1, "gh", "blue")]),
+            (LAYER_PLAYFIELD, [(1, 0, "z", None), (5, 1, "ijk", None)]),
+        ]
+        painted = FrameBuffer(7, 2)
+        for _, commands in sorted(lists, key=lambda entry: entry[0]):
+            painted.draw(commands, 1)
+        compositor = Compositor(SpriteCache())
+        for z, commands in lists:
+            compositor.submit(commands, z)
+        fb = FrameBuffer(7, 2)
+        compositor.resolve(fb, 1)
+        assert fb.back == painted.back
+
+    def test_resolve_mends_wide_glyphs(self) -> None:
+        """Test wide glyphs cut by draw-list entries match painting bottom-up."""
+        commands = [(0, 0, "a字b", "red"), (2, 0, "x", None), (1, 1, "y", None),
+                    (6, 1, "z", "blue"), (3, 1, "字", None)]
+        painted = FrameBuffer(9, 2)
+        painted.put(0, 0, "字字字字")
+        painted.put(0, 1, "字字字字")
+        painted.draw(commands)
+        compositor = Compositor(SpriteCache())
+        background = compositor.layer("background")
+        background.write_at(0, 0, "字字字字")
+        background.write_at(0, 1, "字字字字")
+        compositor.submit(commands)
+        fb = FrameBuffer(9, 2)
+        compositor.compose_base(fb, 0)
+        compositor.resolve(fb, 0)
+        assert fb.back == painted.back
+
+    def test_reset_clears_layers(self) -> None:
+        """Test reset empties and invalidates every layer."""
+        compositor = Compositor(SpriteCache())
+        hud = compositor.layer("hud")
+        hud.begin(1)
+        hud.write_at(0, 0, "x")
+        compositor.reset()
+        assert hud.spans == []
+        assert hud.begin(1)
@@ -0,0 +1,101 @@
+"""Tests for the curses terminal backend."""
+from typing import Any, List, Tuple
+import pytest
+
+curses = pytest.importorskip("curses")
+
+from tty_invaders.__main__ import parse_args  # noqa: E402
+from tty_invaders.renderer import curses_backend  # noqa: E402
+from tty_invaders.renderer.curses_backend import CursesTerminal, parse_style  # noqa: E402
+
+
+class FakeWindow:
+    """Records the calls a curses window receives."""
+
+    def __init__(self) -> None:
+        """Create an empty call log."""
+        self.calls: List[Tuple[Any, ...]] = []
+
+    def addstr(self, y: int, x: int, text: str, attr: int) -> None:
+        """Record a write."""
+        self.calls.append(("addstr", y, x, text))
+
+    def clear(self) -> None:
+        """Record a clear."""
+        self.calls.append(("clear",))
+
+    def noutrefresh(self) -> None:
+        """Record a refresh."""
+        self.calls.append(("noutrefresh",))
+
+
+@pytest.fixture
+def term(monkeypatch) -> CursesTerminal:
+    """Create a curses terminal drawing into a fake window."""
+    monkeypatch.setenv("TERM", "xterm-256color")
+    monkeypatch.setattr(curses_backend.curses, "doupdate", lambda: None)
+    term = CursesTerminal()
+    term._screen = FakeWindow()
+    return term
+
+
+class TestParseStyle:
+    """Test color names to curses colors."""
+
+    def test_plain_color(self) -> None:
+        """Test a base color maps to its curses number."""
+        assert parse_style("cyan", 256) == (curses.COLOR_CYAN, False)
+
+    def test_bright_color(self) -> None:
+        """Test bright colors use the upper eight where available."""
+        assert parse_style("bright_red", 256) == (curses.COLOR_RED + 8, False)
+        assert parse_style("bright_red", 8) == (curses.COLOR_RED, True)
+
+    def test_unknown_and_none(self) -> None:
+        """Test unknown names and None use the default color."""
+        assert parse_style(None, 256) == (-1, False)
+        assert parse_style("sparkly", 256) == (-1, False)
+
+
+class TestCursesTerminal:
+    """Test frames and keys through the curses backend."""
+
+    def test_writes_changed_runs(self, term: CursesTerminal) -> None:
+        """Test only changed runs reach the window, then curses refreshes."""
+        term._width, term._height = 10, 2
+        term.clear()
+        term.write_at(1, 1, "hi")
+        term.flush()
+        assert ("clear",) in term._screen.calls
+        assert ("addstr", 1, 1, "hi") in term._screen.calls
+
+        term._screen.calls.clear()
+        term.clear()
+        term.write_at(1, 1, "ho")
+        term.flush()
+        assert term._screen.calls == [("addstr", 1, 2, "o"), ("noutrefresh",)]
+        assert term.cells_written == 3
+
+    def test_special_keys_have_names(self, term: CursesTerminal) -> None:
+        """Test curses key codes and control characters get blessed names."""
+        assert term._keystroke(curses.KEY_LEFT).name == "KEY_LEFT"
+        assert term._keystroke("\n").name == "KEY_ENTER"
+        assert term._keystroke("\x1b").name == "KEY_ESCAPE"
+        key = term._keystroke("q")
+        assert key == "q" and not key.is_sequence
+
+    def test_resize_key(self, term: CursesTerminal) -> None:
+        """Test KEY_RESIZE flags a resize instead of returning a key."""
+        assert not term._keystroke(curses.KEY_RESIZE)
+        assert term._resize_pending
+
+
+class TestBackendOption:
+    """Test choosing the backend on the command line."""
+
+    def test_backend_argument(self) -> None:
+        """Test --backend accepts the known backends only."""
+        assert parse_args(["--backend", "curses"]).backend == "curses"
+        assert parse_args([]).backend is None
+        with pytest.raises(SystemExit):
+            parse_args(["--backend", "tk"])
@@ -0,0 +1,104 @@
+"""Tests for the cursor-motion planner."""
+from typing import List, Optional
+import pytest
+from tty_invaders.renderer.framebuffer import BLANK, Cell
+from tty_invaders.renderer.headless import HeadlessTerminal
+from tty_invaders.renderer.terminal import CursorPlanner
+
+
+def cup(x: int, y: int) -> str:
+    """Absolute move as an xterm would encode it."""
+    return f"\x1b[{y + 1};{x + 1}H"
+
+
+def relative(kind: str, n: int) -> str:
+    """Relative moves as ECMA-48 sequences."""
+    if kind == "cr":
+        return "\r"
+    return f"\x1b[{n}" + {"up": "A", "down": "B", "right": "C", "left": "D"}[kind]
+
+
+@pytest.fixture
+def planner() -> CursorPlanner:
+    """Create a planner for an 80x24 grid."""
+    planner = CursorPlanner(cup, relative)
+    planner.resize(80, 24)
+    return planner
+
+
+def blank_row() -> List[Cell]:
+    """Create a blank 80-cell row."""
+    return [BLANK] * 80
+
+
+class TestCursorPlanner:
+    """Test move selection."""
+
+    def move(self, planner: CursorPlanner, x: int, y: int,
+             current: Optional[str] = None, row: Optional[List[Cell]] = None) -> bytes:
+        """Move with plain-style rules and a fresh glyph cache."""
+        return planner.move(x, y, row or blank_row(), current,
+                            lambda style: style in (None, "red"), {})
+
+    def test_unknown_position_uses_cup(self, planner: CursorPlanner) -> None:
+        """Test the first move is absolute."""
+        assert self.move(planner, 10, 5) == b"\x1b[6;11H"
+
+    def test_no_move_needed(self, planner: CursorPlanner) -> None:
+        """Test writing continues where the cursor already is."""
+        self.move(planner, 10, 5)
+        planner.advance(3)
+        assert self.move(planner, 13, 5) == b""
+
+    def test_short_gap_is_overwritten(self, planner: CursorPlanner) -> None:
+        """Test unchanged cells are rewritten when cheaper than a move."""
+        row = blank_row()
+        row[12] = ("x", None)
+        self.move(planner, 10, 5)
+        planner.advance(1)
+        assert self.move(planner, 13, 5, row=row) == b" x"
+
+    def test_gap_with_other_style_is_not_overwritten(self, planner: CursorPlanner) -> None:
+        """Test a gap that would need a style change is moved over instead."""
+        row = blank_row()
+        row[12] = ("x", "blue")
+        self.move(planner, 10, 5)
+        planner.advance(1)
+        assert self.move(planner, 13, 5, row=row) == b"\x1b[2C"
+
+    def test_carriage_return(self, planner: CursorPlanner) -> None:
+        """Test moving to column 0 of the same row is a single CR."""
+        self.move(planner, 40, 5)
+        assert self.move(planner, 0, 5) == b"\r"
+
+    def test_vertical_move(self, planner: CursorPlanner) -> None:
+        """Test moving straight down uses a relative move."""
+        self.move(planner, 40, 5)
+        assert self.move(planner, 40, 6) == b"\x1b[1B"
+
+    def test_right_margin_forgets_position(self, planner: CursorPlanner) -> None:
+        """Test the position is unknown after writing the last column."""
+        self.move(planner, 78, 5)
+        planner.advance(2)
+        assert planner.x is None
+        assert self.move(planner, 0, 6) == b"\x1b[7;1H"
+
+
+class TestTerminalCursor:
+    """Test the planner inside the encoder."""
+
+    def test_fewer_bytes_than_absolute_moves(self) -> None:
+        """Test nearby spans are reached without absolute moves."""
+        term = HeadlessTerminal(40, 5)
+        term.clear()
+        term.flush()
+        moves, absolute = term.cursor.moves, term.cursor.absolute_moves
+
+        term.clear()
+        for y in range(1, 4):
+            term.write_at(0, y, "ab")
+            term.write_at(4, y, "cd")
+        term.flush()
+        assert term.cursor.moves - moves == 6
+        assert term.cursor.absolute_moves - absolute == 1
+        assert term.screen_lines()[2] == "ab  cd" + " " * 34
@@ -1,8 +1,11 @@
 """Tests for game entities."""
+import random
 import pytest
 from tty_invaders.entities.player import Player
 from tty_invaders.entities.bullet import Bullet
 from tty_invaders.entities.alien import Alien
+from tty_invaders.entities.formation import AlienFormation
+from tty_invaders.renderer.sprites import get_alien_sprite
 from tty_invaders.config import PLAYER_START_X, PLAYER_START_Y, GAME_WIDTH
 
 
@@ -141,3 +144,76 @@ class TestAlien:
 
         alien.update_animation(False)
         assert alien.sprite == initial_sprite
+
+
+class TestAlienFormation:
+    """Test the alien formation."""
+
+    def test_row_lines_match_sprites(self) -> None:
+        """Test each row line is the row's sprites side by side."""
+        formation = AlienFormation(1)
+        lines = formation.get_row_lines()
+        assert len(lines) == formation.rows * 2
+        dx, dy, text, _ = lines[0]
+        assert (dx, dy) == (0, 0)
+        assert text == get_alien_sprite(0)[0] * 11
+
+    def test_dead_aliens_are_blank(self) -> None:
+        """Test dead aliens leave blanks and trim the run at the ends."""
+        formation = AlienFormation(1)
+        row = [a for a in formation.aliens if a.row == 0]
+        row[0].alive = False
+        row[2].alive = False
+        dx, _, text, _ = formation.get_row_lines()[0]
+        sprite = get_alien_sprite(0)[0]
+        assert dx == row[1].col * 5
+        assert text == sprite + " " * 5 + sprite * 8
+
+    def test_row_lines_cached(self) -> None:
+        """Test lines are only rebuilt when the alive set or frame changes."""
+        formation = AlienFormation(1)
+        lines = formation.get_row_lines()
+        formation.update(0.1)
+        assert formation.get_row_lines() is lines
+        formation.aliens[0].alive = False
+        assert formation.get_row_lines() is not lines
+
+    def test_aliens_follow_origin(self) -> None:
+        """Test alien positions stay on the lattice as the formation moves."""
+        formation = AlienFormation(1)
+        for _ in range(200):
+            formation.update(0.05)
+        for alien in formation.get_alive_aliens():
+            assert alien.x == formation.origin_x + alien.col * 5
+            assert alien.y == formation.origin_y + alien.row * 2
+
+    def test_alive_index_matches_scan(self) -> None:
+        """Test the maintained counts and extents match a scan of the aliens."""
+        rng = random.Random(3)
+        formation = AlienFormation(3)
+        order = list(formation.aliens)
+        rng.shuffle(order)
+        for alien in order:
+            alien.alive = False
+            alive = [a for a in formation.aliens if a.alive]
+            assert formation.get_alive_aliens() == alive
+            assert formation.alive_count == len(alive)
+            assert formation.is_cleared() == (not alive)
+            assert formation.get_lowest_y() == max((a.y + a.height for a in alive), default=0)
+            for row in range(formation.rows):
+                assert formation.row_count(row) == sum(a.row == row for a in alive)
+            for col in range(11):
+                assert formation.column_count(col) == sum(a.col == col for a in alive)
+            formation.update(0.05)
+
+    def test_edge_uses_alive_columns(self) -> None:
+        """Test emptied edge columns let the formation march further."""
+        full, trimmed = AlienFormation(1), AlienFormation(1)
+        for alien in trimmed.aliens:
+            if alien.col == 10:
+                alien.alive = False
+        while full.direction == 1:
+            full.update(0.05)
+            trimmed.update(0.05)
+        assert trimmed.direction == 1
+        assert trimmed.origin_x > full.origin_x
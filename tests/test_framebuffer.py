@@ -0,0 +1,166 @@
+"""Tests for the cell framebuffer."""
+import pytest
+from tty_invaders.renderer.framebuffer import (
+    BLANK, CONTINUATION, FrameBuffer, clip_cells, glyph_width, text_cells
+)
+from tty_invaders.renderer.sprite_cache import SpriteCache
+
+
+class TestFrameBuffer:
+    """Test framebuffer drawing and diffing."""
+
+    def test_put_writes_cells(self) -> None:
+        """Test text is stored one cell per character."""
+        fb = FrameBuffer(10, 3)
+        fb.put(2, 1, "abc", "red")
+        assert fb.back[1][2:5] == [("a", "red"), ("b", "red"), ("c", "red")]
+        assert fb.back[1][1] == BLANK
+
+    def test_put_clips_at_edges(self) -> None:
+        """Test writes outside the grid are clipped."""
+        fb = FrameBuffer(5, 2)
+        fb.put(-2, 0, "abcd")
+        fb.put(3, 1, "xyz")
+        fb.put(0, 5, "off")
+        assert "".join(g for g, _ in fb.back[0]) == "cd   "
+        assert "".join(g for g, _ in fb.back[1]) == "   xy"
+
+    def test_draw_matches_put(self) -> None:
+        """Test a draw list gives the same cells as individual puts."""
+        commands = [(-2, 0, "abcd", "red"), (3, 1, "xyz", None), (0, 5, "off", None),
+                    (1, 0, "Q", "blue")]
+        expected = FrameBuffer(5, 2)
+        for x, y, text, style in commands:
+            expected.put(x, y, text, style)
+        fb = FrameBuffer(5, 2)
+        fb.draw(commands)
+        assert fb.back == expected.back
+
+        cache = SpriteCache()
+        fb = FrameBuffer(5, 2, cache.run)
+        fb.draw(commands)
+        fb.draw(commands)  # Second pass reuses cached runs
+        assert fb.back == expected.back
+        assert cache.hits == 3
+
+    def test_draw_offset(self) -> None:
+        """Test the offset shifts every command."""
+        fb = FrameBuffer(6, 1)
+        fb.draw([(0, 0, "ab", None), (3, 0, "c", None)], x_offset=2)
+        assert "".join(g for g, _ in fb.back[0]) == "  ab c"
+
+    def test_write_advances_cursor(self) -> None:
+        """Test write continues from the previous position."""
+        fb = FrameBuffer(10, 1)
+        fb.move(1, 0)
+        fb.write("ab")
+        fb.write("cd", "red")
+        assert "".join(g for g, _ in fb.back[0]) == " abcd     "
+        assert fb.back[0][3] == ("c", "red")
+
+    def test_diff_yields_only_changes(self) -> None:
+        """Test unchanged cells are not reported."""
+        fb = FrameBuffer(10, 2)
+        fb.put(0, 0, "hello")
+        assert list(fb.diff()) == [(0, 0, [(c, None) for c in "hello"])]
+
+        # Same frame again produces no output
+        fb.clear()
+        fb.put(0, 0, "hello")
+        assert list(fb.diff()) == []
+
+        # Only the changed character is sent
+        fb.clear()
+        fb.put(0, 0, "help")
+        assert list(fb.diff()) == [(0, 3, [("p", None), BLANK])]
+
+    def test_diff_detects_style_changes(self) -> None:
+        """Test a color change alone marks a cell dirty."""
+        fb = FrameBuffer(5, 1)
+        fb.put(0, 0, "x", "red")
+        list(fb.diff())
+        fb.clear()
+        fb.put(0, 0, "x", "blue")
+        assert list(fb.diff()) == [(0, 0, [("x", "blue")])]
+
+    def test_reset_front_repaints(self) -> None:
+        """Test resetting the front grid resends non-blank cells."""
+        fb = FrameBuffer(5, 1)
+        fb.put(1, 0, "ab")
+        list(fb.diff())
+        fb.reset_front()
+        assert list(fb.diff()) == [(0, 1, [("a", None), ("b", None)])]
+
+    def test_resize(self) -> None:
+        """Test resize reallocates the back grid and diff follows."""
+        fb = FrameBuffer(5, 1)
+        fb.resize(8, 3)
+        assert len(fb.back) == 3
+        assert all(len(row) == 8 for row in fb.back)
+
+        fb.put(7, 2, "x")
+        assert list(fb.diff()) == [(2, 7, [("x", None)])]
+        assert all(len(row) == 8 for row in fb.front)
+
+    def test_diff_snapshot(self) -> None:
+        """Test diffing a snapshot leaves the back grid free for drawing."""
+        fb = FrameBuffer(4, 1)
+        fb.put(0, 0, "ab")
+        rows = fb.snapshot()
+        fb.clear()
+        fb.put(0, 0, "zz")
+        assert list(fb.diff(rows)) == [(0, 0, [("a", None), ("b", None)])]
+        assert fb.front == rows
+
+
+class TestClipping:
+    """Test clipping and double-width glyphs."""
+
+    def test_text_cells(self) -> None:
+        """Test wide glyphs are followed by a continuation cell."""
+        assert glyph_width("a") == 1
+        assert glyph_width("▄") == 1
+        assert glyph_width("字") == 2
+        assert text_cells("a字", "red") == [("a", "red"), ("字", "red"), (CONTINUATION, "red")]
+
+    def test_clip_cells_blanks_cut_glyphs(self) -> None:
+        """Test a wide glyph cut by either edge leaves a blank."""
+        cells = text_cells("字a字")
+        assert clip_cells(cells, 1, 5) == [(" ", None), ("a", None), ("字", None), ("", None)]
+        assert clip_cells(cells, 0, 4) == [("字", None), ("", None), ("a", None), (" ", None)]
+
+    def test_clip_range(self) -> None:
+        """Test drawing is limited to the clip columns."""
+        fb = FrameBuffer(10, 1)
+        fb.set_clip(2, 7)
+        fb.put(0, 0, "abcd")
+        fb.draw([(5, 0, "wxyz", None)])
+        assert "".join(g for g, _ in fb.back[0]) == "  cd wx   "
+
+    def test_wide_glyph_at_clip_edges(self) -> None:
+        """Test wide glyphs straddling the clip edges are blanked, not split."""
+        fb = FrameBuffer(8, 2)
+        fb.set_clip(1, 7)
+        fb.put(0, 0, "字字")
+        fb.draw([(5, 1, "字字", None)])
+        assert fb.back[0][:5] == [BLANK, (" ", None), ("字", None), ("", None), BLANK]
+        assert fb.back[1][5:] == [("字", None), ("", None), BLANK]
+
+    def test_overwriting_half_a_wide_glyph(self) -> None:
+        """Test drawing over either half of a wide glyph blanks the other half."""
+        fb = FrameBuffer(6, 2)
+        fb.put(0, 0, "字字")
+        fb.put(1, 0, "x")
+        fb.put(0, 1, "字字")
+        fb.draw([(2, 1, "y", None)])
+        assert "".join(g for g, _ in fb.back[0]) == " x字  "
+        assert "".join(g for g, _ in fb.back[1]) == "字y   "
+
+    def test_diff_sends_whole_wide_glyphs(self) -> None:
+        """Test a change to one half of a wide glyph resends the whole glyph."""
+        fb = FrameBuffer(4, 1)
+        fb.put(0, 0, "字")
+        list(fb.diff())
+        fb.put(0, 0, "字", "red")
+        fb.back[0][0] = ("字", None)
+        assert list(fb.diff()) == [(0, 0, [("字", None), ("", "red")])]
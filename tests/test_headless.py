@@ -0,0 +1,262 @@
+"""Tests for the headless terminal backend."""
+import pytest
+from tty_invaders.config import GAME_WIDTH, MAX_CATCHUP_STEPS, SIM_STEP
+from tty_invaders.game import Game
+from tty_invaders.renderer.headless import HeadlessTerminal
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch) -> None:
+    """Keep settings and high score files out of the source tree."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestHeadlessTerminal:
+    """Test drawing into the in-memory screen."""
+
+    def test_flush_updates_screen(self) -> None:
+        """Test flushed text shows up on the simulated screen."""
+        term = HeadlessTerminal(10, 2)
+        term.clear()
+        term.write_at(1, 1, "hi", "red")
+        term.flush()
+        assert term.screen_lines() == [" " * 10, " hi       "]
+        assert term.frames_written == 1
+        assert term.cells_written == 2
+        assert term.bytes_written > 0
+
+    def test_immediate_draw_covers_submitted(self) -> None:
+        """Test text drawn after a submitted list lands on top of it."""
+        term = HeadlessTerminal(10, 1)
+        term.clear()
+        term.submit([(0, 0, "abcdef", None)])
+        term.write_at(2, 0, "XY")
+        term.flush()
+        assert term.screen_lines() == ["abXYef    "]
+
+    def test_clipped_to_game_area(self) -> None:
+        """Test sprites entering from off screen don't draw into the margins."""
+        term = HeadlessTerminal(GAME_WIDTH + 20, 3)
+        term.clear()
+        term.write_at(-3, 0, "<=>UFO")
+        term.draw([(GAME_WIDTH - 2, 1, "UFO<=>", None)])
+        term.flush()
+        lines = term.screen_lines()
+        assert lines[0][:13] == " " * 10 + "UFO"
+        assert lines[1][-12:] == "UF" + " " * 10
+
+    def test_unchanged_frame_writes_nothing(self) -> None:
+        """Test a repeated frame adds no bytes or cells."""
+        term = HeadlessTerminal(10, 2)
+        for _ in range(2):
+            term.clear()
+            term.write_at(0, 0, "same")
+            term.flush()
+        written = term.bytes_written
+        term.clear()
+        term.write_at(0, 0, "same")
+        term.flush()
+        assert term.bytes_written == written
+        assert term.frames_written == 3
+
+    def test_resize_repaints(self) -> None:
+        """Test a resize clears the screen and resizes the grid."""
+        term = HeadlessTerminal(10, 2)
+        term.clear()
+        term.flush()
+        term.resize(12, 3)
+        assert term.width == 10  # Cached until polled
+        assert term.poll_resize()
+        assert not term.poll_resize()
+        term.clear()
+        term.write_at(0, 2, "x")
+        term.flush()
+        assert len(term.screen_lines()) == 3
+        assert term.screen_lines()[2] == "x" + " " * 11
+
+    def test_scripted_keys(self) -> None:
+        """Test scripted keys come back as blessed keystrokes."""
+        term = HeadlessTerminal(keys=["q", None, "KEY_LEFT"])
+        assert term.inkey() == "q"
+        assert not term.inkey()
+        key = term.inkey()
+        assert key
+        assert key.name == "KEY_LEFT"
+        assert not term.inkey()
+
+
+class TestHeadlessGame:
+    """Test running whole sessions without a tty."""
+
+    def test_menu_quit(self) -> None:
+        """Test quitting from the menu ends the loop."""
+        term = HeadlessTerminal(keys=["q"])
+        game = Game(term)
+        assert game.initialize()
+        game.run()
+        assert not game.running
+        assert term.frames_written == 1
+        assert any("Start Game" in line for line in term.screen_lines())
+
+    def test_play_session(self) -> None:
+        """Test a scripted game session renders frames unpaced."""
+        keys = [" "] + ["KEY_LEFT", " ", None] * 20 + ["KEY_RIGHT", " ", None] * 20
+        term = HeadlessTerminal(keys=keys)
+        game = Game(term)
+        assert game.initialize()
+        game.run(max_frames=300)
+        assert term.frames_written == 300
+        assert game.state_manager.current_state is game.state_manager.states["playing"]
+        assert any("SCORE" in line.upper() for line in term.screen_lines())
+
+    def test_resize_during_session(self) -> None:
+        """Test a resize reflows the menu to the new size."""
+        term = HeadlessTerminal(keys=[None] * 3)
+        game = Game(term)
+        assert game.initialize()
+        game.run(max_frames=2)
+        term.resize(100, 30)
+        game.run(max_frames=1)
+        lines = term.screen_lines()
+        assert (len(lines[0]), len(lines)) == (100, 30)
+        assert term.x_offset == 10
+        # The cached border was redrawn for the new height
+        assert lines[29].strip() and not lines[23].strip("║ ")
+
+    def test_static_state_renders_on_demand(self) -> None:
+        """Test an idle menu sends no frames until input arrives."""
+        term = HeadlessTerminal(keys=[None] * 50 + ["s"] + [None] * 50)
+        game = Game(term)
+        assert game.initialize()
+        game.run(max_frames=50)
+        assert term.frames_written == 1
+        written = term.bytes_written
+
+        game.run(max_frames=51)
+        assert term.frames_written == 2
+        assert term.bytes_written > written
+
+    def test_game_over_wakes_for_prompt(self) -> None:
+        """Test the game over screen schedules the continue prompt."""
+        game = Game(HeadlessTerminal())
+        assert game.initialize()
+        state = game.state_manager.states["game_over"]
+        state.enter()
+        state.entering_name = False
+        assert state.next_wakeup() == pytest.approx(2.0)
+
+        game.state_manager.repaint_requested = False
+        state.update(2.5)
+        assert state.next_wakeup() is None
+        assert game.state_manager.repaint_requested
+
+    def test_leaderboard_shows_scores(self) -> None:
+        """Test the leaderboard lists saved scores and redraws after a change."""
+        term = HeadlessTerminal(keys=["s", "s", " "] + [None] * 3)
+        game = Game(term)
+        assert game.initialize()
+        game.scores.add_score("ABC", 1234, 2)
+        game.run(max_frames=5)
+        assert any("ABC" in line and "1234" in line for line in term.screen_lines())
+
+        frames = term.frames_written
+        game.run(max_frames=1)
+        assert term.frames_written == frames  # Static and unchanged
+
+        game.scores.add_score("XYZ", 5678, 4)
+        game.state_manager.request_repaint()
+        game.run(max_frames=1)
+        assert any("XYZ" in line and "5678" in line for line in term.screen_lines())
+
+
+class TestFormationDrawing:
+    """Test the drawn formation against the aliens' bounds."""
+
+    def test_negative_origin_matches_bounds(self) -> None:
+        """Test rows are drawn where the hitboxes are when the origin is below 0."""
+        term = HeadlessTerminal()
+        term.feed(" ")
+        game = Game(term)
+        assert game.initialize()
+        game.run(max_frames=1)
+        state = game.state_manager.current_state
+        state.bullets.clear()
+        formation = state.formation
+        for alien in formation.aliens:
+            if alien.col < 2:
+                alien.alive = False
+        formation.origin_x = -0.083
+        formation.update(0.0)
+
+        term.clear()
+        state.render(term)
+        term.flush()
+        lines = term.screen_lines()
+        for alien in formation.get_alive_aliens():
+            x, y, width, height = alien.get_bounds()
+            for j in range(height):
+                assert lines[y + j][x:x + width] == alien.sprite[j]
+
+
+class TestFixedTimestep:
+    """Test the fixed-step simulation loop."""
+
+    def playing_game(self, term: HeadlessTerminal) -> Game:
+        """Start a game and stop on its first gameplay frame."""
+        term.feed(" ")
+        game = Game(term)
+        assert game.initialize()
+        game.run(max_frames=1)
+        assert game.state_manager.current_state is game.state_manager.states["playing"]
+        return game
+
+    def test_slow_frame_catches_up_in_fixed_steps(self) -> None:
+        """Test a long frame runs capped fixed steps and renders once."""
+        term = HeadlessTerminal()
+        game = self.playing_game(term)
+        steps, frames = game.sim_steps, term.frames_written
+        game.step(SIM_STEP * (MAX_CATCHUP_STEPS + 2.5))
+        assert game.sim_steps - steps == MAX_CATCHUP_STEPS
+        assert game.dropped_steps == 2
+        assert term.frames_written - frames == 1
+
+    def test_short_frames_accumulate(self) -> None:
+        """Test frames shorter than a step simulate nothing until time adds up."""
+        term = HeadlessTerminal()
+        game = self.playing_game(term)
+        steps = game.sim_steps
+        game.step(SIM_STEP * 0.6)
+        assert game.sim_steps == steps
+        game.step(SIM_STEP * 0.6)
+        assert game.sim_steps == steps + 1
+
+    def test_keys_wait_for_a_step(self) -> None:
+        """Test a key read on a frame without a step is used by the next step."""
+        term = HeadlessTerminal()
+        game = self.playing_game(term)
+        x = game.state_manager.current_state.player.x
+        term.feed("KEY_LEFT")
+        game.step(SIM_STEP * 0.5)
+        assert game.state_manager.current_state.player.x == x
+        game.step(SIM_STEP * 0.5)
+        assert game.state_manager.current_state.player.x < x
+
+    def test_queued_key_skips_static_wait(self, monkeypatch) -> None:
+        """Test a key queued across a switch to a static state is used without waiting."""
+        term = HeadlessTerminal()
+        game = self.playing_game(term)
+        term.feed("p")
+        game.step(SIM_STEP * 0.5)  # Read, but no step consumes it yet
+        term.feed("p")
+        game.step(SIM_STEP)  # The first "p" pauses; the second stays queued
+        states = game.state_manager.states
+        assert game.state_manager.current_state is states["paused"]
+        assert len(game._pending_keys) == 1
+
+        waits = []
+        monkeypatch.setattr(term, "realtime", True)
+        monkeypatch.setattr(term, "wait_for_input", lambda timeout=None: waits.append(timeout))
+        game.state_manager.repaint_requested = False
+        game.run(max_frames=1)
+        assert waits == []
+        assert game.state_manager.current_state is states["playing"]
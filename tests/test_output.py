@@ -0,0 +1,73 @@
+"""Tests for the background frame writer."""
+import threading
+import pytest
+from tty_invaders.renderer.output import Frame, FrameWriter
+
+
+class TestFrameWriter:
+    """Test frame hand-off and dropping."""
+
+    def test_writes_frames(self) -> None:
+        """Test submitted frames reach the write callback."""
+        written = []
+        writer = FrameWriter(written.append)
+        writer.start()
+        try:
+            writer.submit(Frame([], False))
+            assert writer.wait_idle(timeout=5)
+        finally:
+            writer.stop()
+        assert len(written) == 1
+        assert writer.frames_written == 1
+        assert writer.frames_dropped == 0
+
+    def test_slow_writer_supersedes_stale_frames(self) -> None:
+        """Test frames pile up as drops instead of a queue."""
+        release = threading.Event()
+        started = threading.Event()
+        written = []
+
+        def write_frame(frame: Frame) -> None:
+            started.set()
+            release.wait(timeout=5)
+            written.append(frame)
+
+        writer = FrameWriter(write_frame)
+        writer.start()
+        try:
+            writer.submit(Frame([["first"]], False))
+            assert started.wait(timeout=5)
+            # The writer is blocked; these replace each other
+            writer.submit(Frame([["a"]], True))
+            writer.submit(Frame([["b"]], False))
+            writer.submit(Frame([["c"]], False))
+            release.set()
+            assert writer.wait_idle(timeout=5)
+        finally:
+            writer.stop()
+
+        assert [frame.rows[0][0] for frame in written] == ["first", "c"]
+        assert writer.frames_dropped == 2
+        # A superseded clear request is carried over to the newer frame
+        assert written[1].clear is True
+
+    def test_stop_drains_pending_frame(self) -> None:
+        """Test the last frame is written before the thread exits."""
+        written = []
+        writer = FrameWriter(written.append)
+        writer.start()
+        writer.submit(Frame([["last"]], False))
+        writer.stop()
+        assert written and written[-1].rows == [["last"]]
+        assert not writer.running
+
+    def test_error_stops_writer(self) -> None:
+        """Test a failing write is recorded for the game thread."""
+        def write_frame(frame: Frame) -> None:
+            raise OSError("broken pipe")
+
+        writer = FrameWriter(write_frame)
+        writer.start()
+        writer.submit(Frame([], False))
+        writer.stop()
+        assert isinstance(writer.error, OSError)
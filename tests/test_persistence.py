@@ -2,7 +2,7 @@
 import os
 import tempfile
 import pytest
-from tty_invaders.utils.persistence import HighScoreEntry, HighScoreManager
+from tty_invaders.utils.persistence import HighScoreEntry, HighScoreManager, ScoreService
 
 
 class TestHighScoreEntry:
@@ -150,3 +150,40 @@ class TestHighScoreManager:
         finally:
             if os.path.exists(temp_file):
                 os.remove(temp_file)
+
+
+class TestScoreService:
+    """Test the in-memory score service."""
+
+    def test_reads_from_memory(self, tmp_path, monkeypatch) -> None:
+        """Test reads don't reopen the file while it is unchanged."""
+        path = str(tmp_path / "scores.json")
+        HighScoreManager(path).add_score("ABC", 1000, 5)
+        service = ScoreService(path)
+
+        loads = []
+        monkeypatch.setattr(HighScoreManager, "load",
+                            lambda self: loads.append(self.filename))
+        for _ in range(10):
+            assert service.get_top_score() == 1000
+            assert len(service.get_entries()) == 1
+        assert loads == []
+        assert service.version == 0
+
+    def test_own_write_does_not_reload(self, tmp_path) -> None:
+        """Test adding a score updates memory and the version."""
+        service = ScoreService(str(tmp_path / "scores.json"))
+        service.add_score("ABC", 1000, 5)
+        assert service.version == 1
+        assert not service.refresh()
+        assert service.get_top_score() == 1000
+
+    def test_external_change_reloads(self, tmp_path) -> None:
+        """Test a score saved by another session is picked up."""
+        path = str(tmp_path / "scores.json")
+        service = ScoreService(path)
+        assert service.get_top_score() == 0
+
+        HighScoreManager(path).add_score("XYZ", 2000, 3)
+        assert service.get_top_score() == 2000
+        assert service.version == 1
@@ -0,0 +1,98 @@
+"""Tests for the asciicast recorder."""
+import gzip
+import json
+from typing import Any, List
+import pytest
+from tty_invaders.renderer.headless import HeadlessTerminal
+from tty_invaders.renderer.recorder import AsciicastRecorder
+
+
+def read_cast(path: str) -> List[Any]:
+    """Read an asciicast file into a header and a list of events."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestAsciicastRecorder:
+    """Test recording, compression and rotation."""
+
+    def test_records_events(self, tmp_path) -> None:
+        """Test output is written as timestamped events after a header."""
+        path = str(tmp_path / "session.cast")
+        recorder = AsciicastRecorder(path, 80, 24)
+        recorder.start()
+        recorder.record(b"\x1b[2Jhello", keyframe=True)
+        recorder.record("▄▀".encode())
+        recorder.stop()
+
+        header, *events = read_cast(path)
+        assert header["version"] == 2
+        assert (header["width"], header["height"]) == (80, 24)
+        assert [e[1:] for e in events] == [["o", "\x1b[2Jhello"], ["o", "▄▀"]]
+        assert events[0][0] <= events[1][0]
+
+    def test_gzip(self, tmp_path) -> None:
+        """Test .gz recordings are compressed."""
+        path = str(tmp_path / "session.cast.gz")
+        recorder = AsciicastRecorder(path, 80, 24)
+        recorder.start()
+        recorder.record(b"abc", keyframe=True)
+        recorder.stop()
+        assert read_cast(path)[1][1:] == ["o", "abc"]
+
+    def test_rotates_at_keyframe(self, tmp_path) -> None:
+        """Test a full file asks for a keyframe and rotates at it."""
+        path = str(tmp_path / "session.cast")
+        recorder = AsciicastRecorder(path, 80, 24, max_bytes=10)
+        recorder.start()
+        recorder.record(b"first", keyframe=True)
+        recorder.record(b"diff")
+        recorder.record(b"diff")
+        recorder.record(b"repaint", keyframe=True)
+        recorder.stop()
+
+        assert recorder.keyframe_wanted
+        assert recorder.files == 2
+        first = read_cast(path)
+        second = read_cast(recorder.file_path(1))
+        assert [e[2] for e in first[1:]] == ["first", "diff", "diff"]
+        assert second[0]["version"] == 2
+        assert [e[2] for e in second[1:]] == ["repaint"]
+        assert second[1][0] == 0
+
+    def test_file_path(self) -> None:
+        """Test rotated files are numbered before the extension."""
+        recorder = AsciicastRecorder("run.cast.gz", 80, 24)
+        assert recorder.file_path(0) == "run.cast.gz"
+        assert recorder.file_path(2) == "run.2.cast.gz"
+
+    def test_resize_event(self, tmp_path) -> None:
+        """Test resizes are recorded and used by later headers."""
+        path = str(tmp_path / "session.cast")
+        recorder = AsciicastRecorder(path, 80, 24)
+        recorder.start()
+        recorder.resize(100, 30)
+        recorder.stop()
+        assert read_cast(path)[1][1:] == ["r", "100x30"]
+        assert (recorder.width, recorder.height) == (100, 30)
+
+
+class TestTerminalRecording:
+    """Test teeing terminal output into a recording."""
+
+    def test_records_flushed_bytes(self, tmp_path) -> None:
+        """Test the recording holds exactly the bytes sent by flush."""
+        path = str(tmp_path / "session.cast")
+        term = HeadlessTerminal(20, 4)
+        with term.recording(path):
+            for text in ("one", "two", "two"):
+                term.clear()
+                term.write_at(0, 0, text, "red")
+                term.flush()
+
+        events = read_cast(path)[1:]
+        assert len(events) == 2  # The unchanged frame sends nothing
+        recorded = "".join(e[2] for e in events).encode()
+        assert len(recorded) == term.bytes_written
+        assert term.recorder is None
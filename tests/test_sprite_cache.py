@@ -0,0 +1,59 @@
+"""Tests for the compiled sprite cache."""
+import pytest
+from tty_invaders.renderer.framebuffer import FrameBuffer
+from tty_invaders.renderer.sprite_cache import SpriteCache
+from tty_invaders.renderer.sprites import PLAYER_SPRITE, SPRITE_FRAMES
+
+
+class TestSpriteCache:
+    """Test sprite compilation and LRU eviction."""
+
+    def test_compiles_cells(self) -> None:
+        """Test sprite lines become styled cells."""
+        cache = SpriteCache()
+        sprite = cache.get("player", 0, "green")
+        assert sprite.height == len(PLAYER_SPRITE)
+        assert sprite.width == 3
+        assert sprite.rows[1] == (("█", "green"),) * 3
+
+    def test_reuses_compiled_sprite(self) -> None:
+        """Test the same key is compiled only once."""
+        cache = SpriteCache()
+        first = cache.get("alien_top", 1, "red")
+        assert cache.get("alien_top", 1, "red") is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test cycling styles cannot grow the cache without bound."""
+        cache = SpriteCache(maxsize=2)
+        cache.get("player", 0, "red")
+        cache.get("player", 0, "green")
+        cache.get("player", 0, "red")  # Refresh red
+        cache.get("player", 0, "blue")
+        assert len(cache) == 2
+        cache.get("player", 0, "red")
+        assert cache.misses == 3  # Red was kept, green was evicted
+
+    def test_runs_share_the_lru(self) -> None:
+        """Test text runs are cached and evicted alongside sprites."""
+        cache = SpriteCache(maxsize=2)
+        first = cache.run("SCORE", "white")
+        assert first == (("S", "white"), ("C", "white"), ("O", "white"), ("R", "white"),
+                         ("E", "white"))
+        assert cache.run("SCORE", "white") is first
+        cache.get("player", 0, "red")
+        cache.run("HI", None)
+        assert len(cache) == 2
+        assert cache.run("SCORE", "white") is not first  # Oldest entry was evicted
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    def test_blit_matches_put(self) -> None:
+        """Test blitting a compiled sprite draws the same cells as put."""
+        cache = SpriteCache()
+        expected = FrameBuffer(10, 4)
+        for j, line in enumerate(SPRITE_FRAMES["shield"][2]):
+            expected.put(-3, 1 + j, line, "blue")
+
+        fb = FrameBuffer(10, 4)
+        fb.blit(-3, 1, cache.get("shield", 2, "blue").rows)
+        assert fb.back == expected.back
@@ -0,0 +1,51 @@
+"""Tests for the style registry."""
+import io
+import pytest
+from blessed import Terminal as BlessedTerminal
+from tty_invaders.renderer.styles import StyleRegistry
+
+
+@pytest.fixture
+def term() -> BlessedTerminal:
+    """Create a styling blessed terminal that writes to memory."""
+    return BlessedTerminal(kind="xterm-256color", force_styling=True, stream=io.StringIO())
+
+
+class TestStyleRegistry:
+    """Test style resolution and caching."""
+
+    def test_resolve_matches_blessed(self, term: BlessedTerminal) -> None:
+        """Test wrapped text matches the blessed formatter output."""
+        styles = StyleRegistry(term)
+        for name in ("red", "bright_yellow", "bright_black"):
+            assert styles.wrap("abc", name) == getattr(term, name)("abc")
+
+    def test_no_style(self, term: BlessedTerminal) -> None:
+        """Test None leaves text unstyled."""
+        styles = StyleRegistry(term)
+        assert styles.resolve(None) == ("", "")
+        assert styles.wrap("abc", None) == "abc"
+
+    def test_resolve_is_cached(self, term: BlessedTerminal) -> None:
+        """Test a name is only resolved once."""
+        styles = StyleRegistry(term)
+        assert styles.resolve("red") is styles.resolve("red")
+
+    def test_shared_per_capability_set(self, term: BlessedTerminal) -> None:
+        """Test terminals with the same capabilities share a registry."""
+        other = BlessedTerminal(kind="xterm-256color", force_styling=True, stream=io.StringIO())
+        assert StyleRegistry.for_terminal(term) is StyleRegistry.for_terminal(other)
+
+    def test_transition_between_plain_colors(self, term: BlessedTerminal) -> None:
+        """Test switching foreground colors needs no reset."""
+        styles = StyleRegistry(term)
+        assert styles.transition("red", "cyan") == str(term.cyan)
+        assert styles.transition(None, "red") == str(term.red)
+        assert styles.transition("red", None) == term.normal
+        assert styles.transition("red", "red") == ""
+
+    def test_transition_resets_attributes(self, term: BlessedTerminal) -> None:
+        """Test leaving a compound style resets before the new color."""
+        styles = StyleRegistry(term)
+        assert not styles.is_plain("bold_red")
+        assert styles.transition("bold_red", "cyan") == term.normal + str(term.cyan)
@@ -0,0 +1,119 @@
+"""Tests for block translation detection and encoding."""
+from typing import List
+import pytest
+from tty_invaders.game import Game
+from tty_invaders.renderer.framebuffer import BLANK, Cell
+from tty_invaders.renderer.headless import HeadlessTerminal
+from tty_invaders.renderer.translation import (
+    apply_scroll, apply_shift, plan_scroll, plan_shift
+)
+from .emulator import Screen
+
+
+def row(text: str, width: int = 40) -> List[Cell]:
+    """Build a row of cells from text."""
+    return [(ch, None) if ch != " " else BLANK for ch in text.ljust(width)]
+
+
+def capture(term: HeadlessTerminal, screen: Screen) -> None:
+    """Feed everything the terminal writes into a screen model."""
+    term._write_bytes = lambda data: screen.feed(bytes(data))
+
+
+class TestPlanning:
+    """Test detection of rigid moves."""
+
+    def test_scroll_down(self) -> None:
+        """Test a block moving down one row becomes a scroll."""
+        block = [row(" <o> <o> <o> <o> <o> <o> <o>"), row(""),
+                 row(" /^\\ /^\\ /^\\ /^\\ /^\\ /^\\")]
+        front = [row("HUD")] + block + [row(""), row(""), row("player")]
+        rows = [row("HUD"), row("")] + block + [row(""), row("player")]
+        scroll = plan_scroll(front, rows)
+        assert scroll is not None and (scroll.top, scroll.n) == (1, 1)
+
+        apply_scroll(front, scroll)
+        assert front == rows
+
+    def test_scroll_up(self) -> None:
+        """Test a block moving up is found as a negative scroll."""
+        block = [row("x" * 30), row("y" * 30)]
+        front = [row(""), row("")] + block + [row("")]
+        rows = [row("")] + block + [row(""), row("")]
+        scroll = plan_scroll(front, rows)
+        assert scroll is not None and scroll.n == -1
+        apply_scroll(front, scroll)
+        assert front == rows
+
+    def test_small_change_is_not_scrolled(self) -> None:
+        """Test a few changed cells are cheaper to rewrite."""
+        front = [row("a"), row(""), row("")]
+        rows = [row(""), row("a"), row("")]
+        assert plan_scroll(front, rows) is None
+
+    @pytest.mark.parametrize("n", [1, 2, -1, -2])
+    def test_shift(self, n: int) -> None:
+        """Test a row whose content moved sideways becomes a shift."""
+        text = "<o> /^\\ <o> /^\\ <o>"
+        old = row("|" + " " * 5 + text + "      |")
+        new = row("|" + " " * (5 + n) + text + " " * (6 - n) + "|")
+        shift = plan_shift(3, old, new)
+        assert shift is not None and shift.n == n and shift.y == 3
+
+        apply_shift(old, shift)
+        assert old == new
+
+    def test_unrelated_change_is_not_shifted(self) -> None:
+        """Test a changed row that did not move is left to the diff."""
+        assert plan_shift(0, row("abcdefgh"), row("zyxwvuts")) is None
+
+
+class TestEncoding:
+    """Test the terminal output reproduces the frame."""
+
+    def test_translated_frames_match_screen(self) -> None:
+        """Test scrolls and shifts leave the screen showing the frame."""
+        term = HeadlessTerminal(40, 8)
+        screen = Screen(40, 8)
+        capture(term, screen)
+        block = ["<o> <o> <o> <o>", "/^\\ /^\\ /^\\ /^\\"]
+
+        frames = [(2, 1), (3, 1), (4, 1), (4, 2), (3, 2), (3, 3)]
+        for x, y in frames:
+            term.clear()
+            term.write_at(0, 0, "SCORE 100", "white")
+            for j, text in enumerate(block):
+                term.write_at(x, y + j * 2, text, "red")
+            term.write_at(0, 7, "=" * 40, "green")
+            term.flush()
+            assert screen.lines() == term.screen_lines()
+
+        assert term.scrolls == 2
+        assert term.shifts >= 4
+
+    def test_fallback_without_capabilities(self) -> None:
+        """Test nothing is translated when the device lacks the sequences."""
+        term = HeadlessTerminal(40, 8)
+        term._edit_sequence = lambda kind, *params: None
+        screen = Screen(40, 8)
+        capture(term, screen)
+        for x in (2, 3):
+            term.clear()
+            term.write_at(x, 3, "<o> <o> <o> <o> <o>", "red")
+            term.flush()
+        assert screen.lines() == term.screen_lines()
+        assert term.scrolls == term.shifts == 0
+
+    def test_game_session_matches_screen(self, tmp_path, monkeypatch) -> None:
+        """Test a played session renders identically on the screen model."""
+        monkeypatch.chdir(tmp_path)
+        keys = [" "] + ["KEY_LEFT", " ", None] * 40 + ["KEY_RIGHT", " ", None] * 40
+        term = HeadlessTerminal(keys=keys)
+        screen = Screen(term.width, term.height)
+        capture(term, screen)
+        game = Game(term)
+        assert game.initialize()
+        for _ in range(400):
+            game.step(1 / 60)
+            assert screen.lines() == term.screen_lines()
+        assert term.shifts > 0
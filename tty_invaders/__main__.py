@@ -1,25 +1,92 @@
 """Entry point for TTY Invaders."""
+import argparse
 import sys
+from contextlib import nullcontext
+from typing import List, Optional
 
 # Handle both direct execution and module execution
 try:
     from .game import Game
+    from .renderer.terminal import Terminal, TerminalBackend
+    from .utils.settings import GameSettings
 except ImportError:
     from tty_invaders.game import Game
+    from tty_invaders.renderer.terminal import Terminal, TerminalBackend
+    from tty_invaders.utils.settings import GameSettings
 
+# Renderer backends selectable with --backend or the render_backend setting
+BACKENDS = ("blessed", "curses")
 
-def main() -> int:
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Arguments (defaults to sys.argv)
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(prog="tty-invaders",
+                                     description="A terminal-based Space Invaders game")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the session as an asciicast v2 file "
+                             "(compressed if FILE ends in .gz)")
+    parser.add_argument("--backend", choices=BACKENDS,
+                        help="terminal renderer (defaults to the render_backend setting)")
+    return parser.parse_args(argv)
+
+
+def create_terminal(backend: str) -> TerminalBackend:
+    """Create the terminal for a renderer backend.
+
+    Args:
+        backend: "blessed" or "curses"
+
+    Returns:
+        Terminal backend instance
+
+    Raises:
+        RuntimeError: If the backend is not available
+    """
+    if backend == "curses":
+        try:
+            from .renderer.curses_backend import CursesTerminal
+        except ImportError:
+            from tty_invaders.renderer.curses_backend import CursesTerminal
+        return CursesTerminal()
+    return Terminal()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point.
 
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
     Returns:
         Exit code
     """
-    game = Game()
+    args = parse_args(argv)
+    backend = args.backend or GameSettings().get("render_backend", "blessed")
+    if backend not in BACKENDS:
+        backend = "blessed"
+    if args.record and backend != "blessed":
+        print("--record needs the blessed backend")
+        return 1
+    try:
+        terminal = create_terminal(backend)
+    except RuntimeError as exc:
+        print(exc)
+        return 1
+    game = Game(terminal)
 
     if not game.initialize():
         return 1
 
-    game.run()
+    recording = game.terminal.recording(args.record) if args.record else nullcontext()
+    with recording:
+        game.run()
     return 0
 
 
@@ -3,8 +3,15 @@
 # Display settings
 MIN_TERMINAL_WIDTH = 80
 MIN_TERMINAL_HEIGHT = 24
-FPS = 60
+FPS = 60  # Render rate: frames drawn per second at most
 FRAME_TIME = 1.0 / FPS
+SIM_RATE = 60  # Fixed simulation steps per second, independent of FPS
+SIM_STEP = 1.0 / SIM_RATE
+MAX_CATCHUP_STEPS = 5  # Simulation steps run per frame at most; older backlog is dropped
+SPRITE_CACHE_SIZE = 1024  # Compiled (sprite, frame, color) and (text, color) run entries kept
+THREADED_OUTPUT = True  # Write frames from a background thread
+SYNC_PROBE_TIMEOUT = 0.2  # Seconds to wait for a synchronized-output reply
+SCROLL_ACCELERATION = True  # Move shifted blocks with scroll regions / insert-delete
 
 # Game area
 GAME_WIDTH = 80
@@ -36,6 +43,8 @@ ALIEN_SPEED_INCREMENT = 1.5  # Speed increase per level
 ALIEN_DESCENT = 1  # Rows to move down when hitting edge
 ALIEN_BASE_SHOOT_FREQ = 2.5  # Seconds between shots (increased for easier start)
 ALIEN_SHOOT_FREQ_DECREMENT = 0.15  # Decrease per level
+# Keep the formation in NumPy arrays (needs numpy; pays off for large formations)
+ARRAY_FORMATION = False
 
 # Scoring (Classic Space Invaders)
 SCORE_ALIEN_TOP = 30  # Top row aliens (small/squid)
@@ -49,6 +58,9 @@ SHIELD_WIDTH = 8
 SHIELD_HEIGHT = 3
 SHIELD_HEALTH = 10  # Hits before destruction
 
+# Collision broadphase
+COLLISION_BUCKET_SIZE = 8  # Cells per side of a spatial hash bucket
+
 # Difficulty progression
 MAX_ALIEN_ROWS = 7
 MIN_SHOOT_FREQUENCY = 0.5
@@ -57,6 +69,12 @@ MIN_SHOOT_FREQUENCY = 0.5
 MAX_HIGH_SCORES = 10
 HIGH_SCORE_FILE = "scores.json"
 
+# Terminal capability probes
+TERMINAL_CAPS_FILE = "terminal_caps.json"
+
+# Session recording (--record)
+RECORD_ROTATE_BYTES = 64 * 1024 * 1024  # Start a new recording file after this size
+
 # Colors (blessed color names)
 COLOR_PLAYER = "green"
 COLOR_ALIEN_TOP = "red"
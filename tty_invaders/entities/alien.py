@@ -1,8 +1,42 @@
 """Alien entity."""
-from typing import List, Optional
+from typing import Callable, List, Optional, Protocol
 
 from ..config import COLOR_ALIEN_TOP, COLOR_ALIEN_MID, COLOR_ALIEN_BOT
-from ..renderer.sprites import get_alien_sprite, get_sprite_width
+from ..renderer.sprites import get_alien_sprite, get_alien_sprite_id, get_sprite_width
+
+
+class AlienLike(Protocol):
+    """What the formation, collision and render code use of an alien.
+
+    Implemented by Alien and by the array formation's AlienView.
+    """
+
+    x: float
+    y: int
+    alive: bool
+    row: int
+    col: int
+    width: int
+    height: int
+    color: str
+    sprite_id: str
+
+    @property
+    def frame(self) -> int:
+        """Animation frame index."""
+
+    @property
+    def sprite(self) -> List[str]:
+        """Sprite lines for the current animation frame."""
+
+    def update_animation(self, animated: bool) -> None:
+        """Show the normal or alternate animation frame."""
+
+    def get_bounds(self) -> tuple[int, int, int, int]:
+        """Get bounding box for collision detection."""
+
+    def get_score_value(self) -> int:
+        """Get point value for destroying this alien."""
 
 
 class Alien:
@@ -21,10 +55,15 @@ class Alien:
         self.y = y
         self.row = row
         self.col = col
-        self.alive = True
+        self._alive = True
         self.animated = False
 
+        # Called with (alien, alive) when alive changes, e.g. by the formation
+        self.on_alive_change: Optional[Callable[["Alien", bool], None]] = None
+
         # Set sprite and color based on row
+        self.sprite_id = get_alien_sprite_id(row)
+        self.frame = 0
         self.sprite = get_alien_sprite(row, self.animated)
         self.width = get_sprite_width(self.sprite)
         self.height = len(self.sprite)
@@ -37,6 +76,18 @@ class Alien:
         else:
             self.color = COLOR_ALIEN_BOT
 
+    @property
+    def alive(self) -> bool:
+        """Whether the alien is alive."""
+        return self._alive
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        if value != self._alive:
+            self._alive = value
+            if self.on_alive_change is not None:
+                self.on_alive_change(self, value)
+
     def update_animation(self, animated: bool) -> None:
         """Update animation frame.
 
@@ -45,6 +96,7 @@ class Alien:
         """
         if self.animated != animated:
             self.animated = animated
+            self.frame = int(animated)
             self.sprite = get_alien_sprite(self.row, self.animated)
 
     def get_bounds(self) -> tuple[int, int, int, int]:
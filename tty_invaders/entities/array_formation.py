@@ -0,0 +1,236 @@
+"""Alien formation stored as NumPy arrays."""
+from typing import List, Tuple
+
+from .alien import Alien
+from .formation import AlienFormation
+from ..renderer.sprites import get_alien_sprite
+from ..config import (
+    ALIEN_COLS, ALIEN_SPACING_X, ALIEN_SPACING_Y, ALIEN_START_X, ALIEN_START_Y, ALIEN_DESCENT,
+    ARRAY_FORMATION
+)
+
+try:
+    import numpy as np
+except ImportError:  # Optional; AlienFormation is used instead
+    np = None  # type: ignore[assignment]
+
+
+class AlienView:
+    """Alien-like view of one slot of an ArrayAlienFormation.
+
+    Collision and render code read positions, sprites and scores through
+    it exactly as they would from an Alien; setting alive writes the
+    formation's alive mask.
+    """
+
+    __slots__ = ("_formation", "index", "row", "col", "sprite_id", "width", "height",
+                 "color", "_score")
+
+    def __init__(self, formation: "ArrayAlienFormation", index: int, kind: Alien) -> None:
+        """Initialize the view.
+
+        Args:
+            formation: Formation holding the arrays
+            index: Slot in the formation arrays
+            kind: Alien of the same row, providing sprite, size, color and score
+        """
+        self._formation = formation
+        self.index = index
+        self.row = kind.row
+        self.col = index % ALIEN_COLS
+        self.sprite_id = kind.sprite_id
+        self.width = kind.width
+        self.height = kind.height
+        self.color = kind.color
+        self._score = kind.get_score_value()
+
+    @property
+    def x(self) -> float:
+        """X position."""
+        return self._formation.positions[0][self.index]
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._formation.x[self.index] = value
+        self._formation._sync_positions()
+
+    @property
+    def y(self) -> int:
+        """Y position."""
+        return self._formation.positions[1][self.index]
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._formation.y[self.index] = value
+        self._formation._sync_positions()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the alien is alive."""
+        return bool(self._formation.alive[self.index])
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        if value != self.alive:
+            self._formation._set_alive(self, bool(value))
+
+    @property
+    def animated(self) -> bool:
+        """Whether the alternate animation frame is shown."""
+        return self._formation.animation_state
+
+    @property
+    def frame(self) -> int:
+        """Animation frame index."""
+        return int(self._formation.animation_state)
+
+    @property
+    def sprite(self) -> List[str]:
+        """Sprite lines for the current animation frame."""
+        return get_alien_sprite(self.row, self._formation.animation_state)
+
+    def update_animation(self, animated: bool) -> None:
+        """Do nothing; views follow the formation's shared animation phase.
+
+        Args:
+            animated: Whether to show alternate animation frame
+        """
+
+    def get_bounds(self) -> tuple[int, int, int, int]:
+        """Get bounding box for collision detection.
+
+        Returns:
+            Tuple of (x, y, width, height)
+        """
+        return self._formation.bounds[self.index]
+
+    def get_score_value(self) -> int:
+        """Get point value for destroying this alien.
+
+        Returns:
+            Score points
+        """
+        return self._score
+
+
+class ArrayAlienFormation(AlienFormation):
+    """Alien formation kept as a struct of NumPy arrays.
+
+    Positions, rows, the alive mask and each alien's type index are
+    arrays, and every alien shares the formation's animation phase, so
+    moving the formation is a single vectorized operation instead of a
+    Python loop over Alien objects; edge, lowest-alien and cleared checks
+    come from the alive index the base class keeps. The aliens list holds
+    AlienView proxies for the code that works per alien.
+    """
+
+    def __init__(self, level: int = 1) -> None:
+        """Initialize formation.
+
+        Args:
+            level: Current game level
+
+        Raises:
+            RuntimeError: If numpy is not installed
+        """
+        if np is None:
+            raise RuntimeError("ArrayAlienFormation needs numpy")
+        super().__init__(level)
+
+    def _create_formation(self) -> None:
+        """Create the initial alien formation."""
+        self.origin_x = float(ALIEN_START_X)
+        self.origin_y = ALIEN_START_Y
+        self._generation += 1
+
+        # One Alien per row describes the row; the type index selects its size
+        row_kinds = [Alien(0, 0, row, 0) for row in range(self.rows)]
+        sprite_ids = list(dict.fromkeys(kind.sprite_id for kind in row_kinds))
+        types = [next(k for k in row_kinds if k.sprite_id == sprite_id)
+                 for sprite_id in sprite_ids]
+        row_type = np.array([sprite_ids.index(kind.sprite_id) for kind in row_kinds],
+                            dtype=np.int8)
+
+        self.row = np.repeat(np.arange(self.rows), ALIEN_COLS)
+        self.kind = row_type[self.row]
+        self.width = np.array([t.width for t in types])[self.kind]
+        self.height = np.array([t.height for t in types])[self.kind]
+        self._dx = np.tile(np.arange(ALIEN_COLS), self.rows) * ALIEN_SPACING_X
+        self._dy = self.row * ALIEN_SPACING_Y
+        self.x = self._dx + self.origin_x
+        self.y = self._dy + self.origin_y
+        self.alive = np.ones(len(self.row), dtype=bool)
+        self._sync_positions()
+
+        self.aliens = [AlienView(self, i, row_kinds[i // ALIEN_COLS])
+                       for i in range(len(self.row))]
+        self._build_index()
+
+    def update(self, dt: float) -> None:
+        """Update formation position and state.
+
+        Args:
+            dt: Delta time in seconds
+        """
+        if not self.aliens:
+            return
+
+        # Update animation (one phase for the whole formation)
+        self.animation_timer += dt
+        if self.animation_timer >= 0.5:  # Toggle every 0.5 seconds
+            self.animation_timer = 0.0
+            self.animation_state = not self.animation_state
+
+        # Move formation
+        move_amount = self.speed * dt * self.direction
+
+        # Check if any alien hit the edge
+        if self._hits_edge(move_amount):
+            # Reverse direction and descend
+            self.direction *= -1
+            self.origin_y += ALIEN_DESCENT
+            np.add(self._dy, self.origin_y, out=self.y)
+        else:
+            # Normal horizontal movement
+            self.origin_x += move_amount
+            np.add(self._dx, self.origin_x, out=self.x)
+        self._sync_positions()
+
+        # Update shoot timer
+        self.shoot_timer += dt
+
+    def _sync_positions(self) -> None:
+        """Copy positions and bounds into Python lists for the views' reads.
+
+        Reading single elements of a NumPy array is slow compared to a
+        list, and collision code reads each alien's position every frame.
+        """
+        self.positions: Tuple[List[float], List[int]] = (self.x.tolist(), self.y.tolist())
+        self.bounds: List[Tuple[int, int, int, int]] = list(zip(
+            self.x.astype(int).tolist(), self.positions[1],
+            self.width.tolist(), self.height.tolist()))
+
+    def _set_alive(self, view: AlienView, alive: bool) -> None:
+        """Write the alive mask, then update the alive index.
+
+        Args:
+            view: AlienView whose alive flag changed
+            alive: New alive flag
+        """
+        self.alive[view.index] = alive
+        self._on_alive_change(view, alive)
+
+
+def create_formation(level: int = 1) -> AlienFormation:
+    """Create the alien formation, array-backed when numpy is available.
+
+    Args:
+        level: Current game level
+
+    Returns:
+        ArrayAlienFormation if ARRAY_FORMATION is set and numpy is installed,
+        else AlienFormation
+    """
+    if ARRAY_FORMATION and np is not None:
+        return ArrayAlienFormation(level)
+    return AlienFormation(level)
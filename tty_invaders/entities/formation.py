@@ -1,9 +1,10 @@
 """Alien formation manager."""
 import random
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
-from .alien import Alien
+from .alien import Alien, AlienLike
 from .bullet import Bullet
+from ..renderer.sprites import get_alien_sprite
 from ..config import (
     ALIEN_COLS, ALIEN_ROWS, ALIEN_SPACING_X, ALIEN_SPACING_Y,
     ALIEN_START_X, ALIEN_START_Y, ALIEN_BASE_SPEED, ALIEN_SPEED_INCREMENT,
@@ -22,7 +23,7 @@ class AlienFormation:
             level: Current game level
         """
         self.level = level
-        self.aliens: List[Alien] = []
+        self.aliens: List[AlienLike] = []
         self.direction = 1  # 1 = right, -1 = left
         self.speed = ALIEN_BASE_SPEED + (level - 1) * ALIEN_SPEED_INCREMENT
         self.shoot_timer = 0.0
@@ -33,6 +34,27 @@ class AlienFormation:
         self.animation_timer = 0.0
         self.animation_state = False
 
+        # Top-left corner of the lattice; aliens sit at fixed offsets from it
+        self.origin_x = float(ALIEN_START_X)
+        self.origin_y = ALIEN_START_Y
+
+        # Alive index, kept up to date as aliens die (see _on_alive_change)
+        self._alive_list: Optional[List[AlienLike]] = []
+        self._alive_count = 0
+        self._row_counts: List[int] = []
+        self._col_counts: List[int] = []
+        self._left_col = 0
+        self._right_col = 0
+        self._low_row = 0
+        self._alien_width = 0
+        self._row_heights: List[int] = []
+        self._row_masks: List[int] = []  # Bit col is set while that alien is alive
+
+        # Composed sprite lines and what they were built from
+        self._row_lines: List[Tuple[int, int, str, str]] = []
+        self._row_lines_key: Any = None
+        self._generation = 0
+
         # Calculate rows for this level
         self.rows = min(ALIEN_ROWS + (level - 1) // 2, MAX_ALIEN_ROWS)
 
@@ -41,14 +63,87 @@ class AlienFormation:
     def _create_formation(self) -> None:
         """Create the initial alien formation."""
         self.aliens.clear()
+        self.origin_x = float(ALIEN_START_X)
+        self.origin_y = ALIEN_START_Y
+        self._generation += 1
 
         for row in range(self.rows):
             for col in range(ALIEN_COLS):
                 x = ALIEN_START_X + col * ALIEN_SPACING_X
                 y = ALIEN_START_Y + row * ALIEN_SPACING_Y
                 alien = Alien(x, y, row, col)
+                alien.on_alive_change = self._on_alive_change
                 self.aliens.append(alien)
 
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Count the aliens per row and column and find the formation's extents."""
+        self._alive_list = None
+        self._alive_count = 0
+        self._row_counts = [0] * self.rows
+        self._col_counts = [0] * ALIEN_COLS
+        self._row_heights = [0] * self.rows
+        self._row_masks = [0] * self.rows
+        self._alien_width = 0
+        for alien in self.aliens:
+            self._row_heights[alien.row] = max(self._row_heights[alien.row], alien.height)
+            self._alien_width = max(self._alien_width, alien.width)
+            if alien.alive:
+                self._alive_count += 1
+                self._row_counts[alien.row] += 1
+                self._col_counts[alien.col] += 1
+                self._row_masks[alien.row] |= 1 << alien.col
+        self._update_extents()
+
+    def _update_extents(self) -> None:
+        """Find the leftmost and rightmost columns and lowest row with aliens."""
+        cols = [col for col, count in enumerate(self._col_counts) if count]
+        rows = [row for row, count in enumerate(self._row_counts) if count]
+        self._left_col = cols[0] if cols else 0
+        self._right_col = cols[-1] if cols else 0
+        self._low_row = rows[-1] if rows else 0
+
+    def _on_alive_change(self, alien: AlienLike, alive: bool) -> None:
+        """Update the alive index when an alien dies (or is revived).
+
+        Counts change in O(1); the extents are only searched again when a
+        boundary row or column empties, at most rows + columns times per
+        formation, and the alive list is rebuilt on its next use.
+
+        Args:
+            alien: Alien whose alive flag changed
+            alive: New alive flag
+        """
+        delta = 1 if alive else -1
+        self._alive_count += delta
+        self._row_counts[alien.row] += delta
+        self._col_counts[alien.col] += delta
+        if alive:
+            self._row_masks[alien.row] |= 1 << alien.col
+        else:
+            self._row_masks[alien.row] &= ~(1 << alien.col)
+        self._alive_list = None
+        if alive or (not self._col_counts[alien.col]
+                     and alien.col in (self._left_col, self._right_col)) \
+                or (not self._row_counts[alien.row] and alien.row == self._low_row):
+            self._update_extents()
+
+    def _hits_edge(self, move_amount: float) -> bool:
+        """Check if moving the formation would take an alive alien off the play area.
+
+        Args:
+            move_amount: Horizontal move in characters
+
+        Returns:
+            True if the leftmost or rightmost alive column would leave the screen
+        """
+        if not self._alive_count:
+            return False
+        left_x = self.origin_x + self._left_col * ALIEN_SPACING_X + move_amount
+        right_x = self.origin_x + self._right_col * ALIEN_SPACING_X + move_amount
+        return left_x < 0 or right_x + self._alien_width >= GAME_WIDTH
+
     def update(self, dt: float) -> None:
         """Update formation position and state.
 
@@ -63,35 +158,24 @@ class AlienFormation:
         if self.animation_timer >= 0.5:  # Toggle every 0.5 seconds
             self.animation_timer = 0.0
             self.animation_state = not self.animation_state
-            for alien in self.aliens:
-                if alien.alive:
-                    alien.update_animation(self.animation_state)
+            for alien in self.get_alive_aliens():
+                alien.update_animation(self.animation_state)
 
         # Move formation
         move_amount = self.speed * dt * self.direction
 
         # Check if any alien hit the edge
-        should_descend = False
-        for alien in self.aliens:
-            if not alien.alive:
-                continue
-
-            new_x = alien.x + move_amount
-            if new_x < 0 or new_x + alien.width >= GAME_WIDTH:
-                should_descend = True
-                break
-
-        if should_descend:
+        if self._hits_edge(move_amount):
             # Reverse direction and descend
             self.direction *= -1
-            for alien in self.aliens:
-                if alien.alive:
-                    alien.y += ALIEN_DESCENT
+            self.origin_y += ALIEN_DESCENT
+            for alien in self.get_alive_aliens():
+                alien.y = self.origin_y + alien.row * ALIEN_SPACING_Y
         else:
             # Normal horizontal movement
-            for alien in self.aliens:
-                if alien.alive:
-                    alien.x += move_amount
+            self.origin_x += move_amount
+            for alien in self.get_alive_aliens():
+                alien.x = self.origin_x + alien.col * ALIEN_SPACING_X
 
         # Update shoot timer
         self.shoot_timer += dt
@@ -109,7 +193,7 @@ class AlienFormation:
         self.shoot_timer = 0.0
 
         # Get alive aliens
-        alive_aliens = [a for a in self.aliens if a.alive]
+        alive_aliens = self.get_alive_aliens()
         if not alive_aliens:
             return None
 
@@ -121,13 +205,76 @@ class AlienFormation:
         bullet_y = shooter.y + shooter.height
         return Bullet(bullet_x, bullet_y, is_player=False)
 
-    def get_alive_aliens(self) -> List[Alien]:
+    def get_alive_aliens(self) -> List[AlienLike]:
         """Get list of alive aliens.
 
+        The list is shared until the next alien dies; don't modify it.
+
         Returns:
             List of alive Alien instances
         """
-        return [a for a in self.aliens if a.alive]
+        if self._alive_list is None:
+            self._alive_list = [a for a in self.aliens if a.alive]
+        return self._alive_list
+
+    @property
+    def alive_count(self) -> int:
+        """Number of alive aliens."""
+        return self._alive_count
+
+    def row_count(self, row: int) -> int:
+        """Get the number of alive aliens in a formation row.
+
+        Args:
+            row: Row in formation (0-indexed from top)
+
+        Returns:
+            Alive aliens in the row
+        """
+        return self._row_counts[row]
+
+    def column_count(self, col: int) -> int:
+        """Get the number of alive aliens in a formation column.
+
+        Args:
+            col: Column in formation
+
+        Returns:
+            Alive aliens in the column
+        """
+        return self._col_counts[col]
+
+    def alien_at(self, x: int, y: int) -> Optional[AlienLike]:
+        """Find the alive alien covering a cell, using the lattice.
+
+        The cell is mapped to a formation row and column with integer
+        arithmetic from the origin and checked against that row's alive
+        bitmask, so the cost doesn't depend on the formation size. The
+        neighbouring columns are checked too, against the aliens' own
+        bounds, because truncating fractional positions can move an
+        alien's left edge across a lattice boundary.
+
+        Args:
+            x: Cell column
+            y: Cell row
+
+        Returns:
+            The alive alien whose bounds contain the cell, or None
+        """
+        row, line = divmod(y - self.origin_y, ALIEN_SPACING_Y)
+        if not 0 <= row < self.rows or line >= self._row_heights[row]:
+            return None
+        mask = self._row_masks[row]
+        if not mask:
+            return None
+        col = int((x - self.origin_x) // ALIEN_SPACING_X)
+        for c in range(max(col - 1, 0), min(col + 2, ALIEN_COLS)):
+            if mask >> c & 1:
+                alien = self.aliens[row * ALIEN_COLS + c]
+                left = int(alien.x)
+                if left <= x < left + alien.width:
+                    return alien
+        return None
 
     def is_cleared(self) -> bool:
         """Check if all aliens are destroyed.
@@ -135,7 +282,7 @@ class AlienFormation:
         Returns:
             True if no aliens remain
         """
-        return len(self.get_alive_aliens()) == 0
+        return self._alive_count == 0
 
     def get_lowest_y(self) -> int:
         """Get the Y position of the lowest alien.
@@ -143,10 +290,59 @@ class AlienFormation:
         Returns:
             Lowest Y position, or 0 if no aliens
         """
-        alive = self.get_alive_aliens()
-        if not alive:
+        if not self._alive_count:
             return 0
-        return max(a.y + a.height for a in alive)
+        row = self._low_row
+        return self.origin_y + row * ALIEN_SPACING_Y + self._row_heights[row]
+
+    def reached_bottom(self, bottom_y: int) -> bool:
+        """Check if any alive alien has reached a row.
+
+        Args:
+            bottom_y: Y coordinate of bottom boundary
+
+        Returns:
+            True if the bottom of any alive alien is at or below bottom_y
+        """
+        return bool(self._alive_count) and self.get_lowest_y() >= bottom_y
+
+    def get_row_lines(self) -> List[Tuple[int, int, str, str]]:
+        """Get the formation composed into one string per sprite line.
+
+        Each line spans a formation row from its first to its last alive
+        alien, with dead aliens as blank cells, so it can be drawn as a
+        single colored run. Lines are only rebuilt when an alien dies or
+        the animation frame changes.
+
+        Returns:
+            List of (dx, dy, text, color), offsets from (origin_x, origin_y)
+        """
+        key = (self._generation, self._alive_count, self.animation_state)
+        if key == self._row_lines_key:
+            return self._row_lines
+        alive = self.get_alive_aliens()
+
+        by_row: dict[int, List[AlienLike]] = {}
+        for alien in alive:
+            by_row.setdefault(alien.row, []).append(alien)
+
+        lines = []
+        for row, row_aliens in sorted(by_row.items()):
+            cols = {alien.col for alien in row_aliens}
+            first, last = min(cols), max(cols)
+            sprite = get_alien_sprite(row, self.animation_state)
+            width = row_aliens[0].width
+            gap = " " * (ALIEN_SPACING_X - width)
+            blank = " " * width
+            for j, sprite_line in enumerate(sprite):
+                text = gap.join(sprite_line if col in cols else blank
+                                for col in range(first, last + 1))
+                lines.append((first * ALIEN_SPACING_X, row * ALIEN_SPACING_Y + j,
+                              text, row_aliens[0].color))
+
+        self._row_lines = lines
+        self._row_lines_key = key
+        return lines
 
     def reset(self, level: int) -> None:
         """Reset formation for new level.
@@ -1,12 +1,7 @@
 """Mystery ship (UFO) entity."""
 from typing import Tuple
 from ..config import GAME_WIDTH, PLAY_AREA_TOP
-
-
-# Mystery ship sprite
-MYSTERY_SHIP_SPRITE = [
-    " <-O-> "
-]
+from ..renderer.sprites import MYSTERY_SHIP_SPRITE
 
 
 class MysteryShip:
@@ -21,6 +16,7 @@ class MysteryShip:
         self.direction = direction
         self.alive = True
         self.sprite = MYSTERY_SHIP_SPRITE
+        self.sprite_id = "mystery_ship"
         self.width = len(self.sprite[0])
         self.height = len(self.sprite)
         self.color = "red"
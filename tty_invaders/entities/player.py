@@ -16,6 +16,7 @@ class Player:
         self.x = PLAYER_START_X
         self.y = PLAYER_START_Y
         self.sprite = PLAYER_SPRITE
+        self.sprite_id = "player"
         self.width = get_sprite_width(self.sprite)
         self.height = len(self.sprite)
         self.alive = True
@@ -5,7 +5,7 @@ from ..config import (
     SHIELD_WIDTH, SHIELD_HEIGHT, SHIELD_HEALTH, SHIELD_Y,
     GAME_WIDTH, SHIELD_COUNT, COLOR_SHIELD
 )
-from ..renderer.sprites import get_shield_sprite
+from ..renderer.sprites import get_shield_frame, get_shield_sprite
 
 
 class Shield:
@@ -26,6 +26,7 @@ class Shield:
         self.max_health = SHIELD_HEALTH
         self.alive = True
         self.color = COLOR_SHIELD
+        self.sprite_id = "shield"
 
     def take_damage(self, amount: int = 1) -> None:
         """Take damage to the shield.
@@ -53,6 +54,14 @@ class Shield:
         """
         return get_shield_sprite(self.get_health_percent())
 
+    def get_frame(self) -> int:
+        """Get current damage frame for the sprite cache.
+
+        Returns:
+            Frame index of the shield sprite
+        """
+        return get_shield_frame(self.get_health_percent())
+
     def get_bounds(self) -> tuple[int, int, int, int]:
         """Get bounding box for collision detection.
 
@@ -1,8 +1,10 @@
 """Main game class and loop orchestration."""
-from typing import Any
+from collections import deque
+from typing import Any, Deque, Optional
+from blessed.keyboard import Keystroke
 
-from .config import FPS
-from .renderer.terminal import Terminal
+from .config import FPS, MAX_CATCHUP_STEPS, SIM_STEP
+from .renderer.terminal import Terminal, TerminalBackend
 from .utils.timer import GameTimer
 from .states.base import StateManager
 from .states.menu import MenuState
@@ -12,13 +14,24 @@ from .audio.sound import SoundManager
 class Game:
     """Main game orchestrator."""
 
-    def __init__(self) -> None:
-        """Initialize the game."""
-        self.terminal = Terminal()
+    def __init__(self, terminal: Optional[TerminalBackend] = None) -> None:
+        """Initialize the game.
+
+        Args:
+            terminal: Terminal backend (defaults to the real terminal)
+        """
+        self.terminal = terminal if terminal is not None else Terminal()
         self.timer = GameTimer(FPS)
         self.state_manager = StateManager(self)
         self.sound_manager = SoundManager()
         self.running = False
+
+        # Fixed-timestep simulation: unsimulated time and keys not yet consumed
+        self._accumulator = 0.0
+        self._pending_keys: Deque[Any] = deque()
+        self.sim_steps = 0
+        self.dropped_steps = 0
+
         self.score = 0
         self.high_score = 0
         self.lives = 0
@@ -50,12 +63,12 @@ class Game:
         from .states.game_over import GameOverState
         from .states.leaderboard import LeaderboardState
         from .states.options import OptionsState
-        from .utils.persistence import HighScoreManager
+        from .utils.persistence import ScoreService
         from .utils.settings import GameSettings
 
-        # Load high scores
-        hsm = HighScoreManager()
-        self.high_score = hsm.get_top_score()
+        # Load high scores (kept in memory for the whole session)
+        self.scores = ScoreService()
+        self.high_score = self.scores.get_top_score()
 
         # Load settings
         self.settings = GameSettings()
@@ -75,47 +88,119 @@ class Game:
         # Start with menu
         self.state_manager.change_state("menu")
 
-    def run(self) -> None:
-        """Run the main game loop."""
+    def run(self, max_frames: Optional[int] = None) -> None:
+        """Run the main game loop.
+
+        Animated states are simulated in fixed SIM_STEP increments and drawn
+        at most FPS times a second; a slow frame is made up with extra
+        simulation steps, not a longer one. Backends that are not realtime
+        (e.g. HeadlessTerminal) run unpaced with one simulation step per
+        frame, as fast as frames can be produced.
+
+        Args:
+            max_frames: Stop after this many frames (None runs until quit)
+        """
         self.running = True
-        last_width = self.terminal.width
-        last_height = self.terminal.height
+        realtime = getattr(self.terminal, "realtime", True)
+        frames = 0
 
         try:
             with self.terminal.fullscreen(), \
                  self.terminal.cbreak(), \
-                 self.terminal.hidden_cursor():
+                 self.terminal.hidden_cursor(), \
+                 self.terminal.watch_resize(), \
+                 self.terminal.output_stage():
 
-                while self.running:
-                    # Calculate delta time
-                    dt = self.timer.tick()
+                # Wrap frames in synchronized updates where supported
+                self.terminal.probe_synchronized_output()
 
-                    # Check for terminal resize
-                    if self.terminal.width != last_width or self.terminal.height != last_height:
-                        last_width = self.terminal.width
-                        last_height = self.terminal.height
-                        # Terminal was resized, clear screen for clean redraw
-                        self.terminal.clear()
+                while self.running:
+                    # Static screens sleep until input, a resize or their next timer
+                    # (unless keys read by an earlier frame are still queued)
+                    if realtime and not self.state_manager.animated \
+                            and not self.state_manager.repaint_requested \
+                            and not self._pending_keys:
+                        self.terminal.wait_for_input(self.state_manager.next_wakeup())
 
-                    # Handle input (non-blocking)
-                    key = self.terminal.inkey(timeout=0)
-                    self.state_manager.handle_input(key)
+                    # Calculate delta time
+                    dt = self.timer.tick() if realtime else SIM_STEP
 
-                    # Update game state
-                    self.state_manager.update(dt)
+                    self.step(dt)
 
-                    # Render
-                    self.terminal.clear()
-                    self.state_manager.render(self.terminal)
-                    self.terminal.flush()
+                    frames += 1
+                    if max_frames is not None and frames >= max_frames:
+                        break
 
                     # Wait for next frame
-                    self.timer.wait_for_next_frame()
+                    if realtime and self.state_manager.animated:
+                        self.timer.wait_for_next_frame()
 
         except KeyboardInterrupt:
             # Clean exit on Ctrl+C
             pass
 
+    def step(self, dt: float) -> None:
+        """Run one frame: input, simulation and at most one render.
+
+        Args:
+            dt: Wall-clock seconds since the previous frame
+        """
+        # Pick up a resize reported since the last frame
+        if self.terminal.poll_resize():
+            self.state_manager.resize(self.terminal.width, self.terminal.height)
+
+        # Keys wait for the simulation step that consumes them
+        key = self.terminal.inkey(timeout=0)
+        if key:
+            self._pending_keys.append(key)
+
+        if self.state_manager.animated:
+            self._accumulator += dt
+            steps = 0
+            while self._accumulator >= SIM_STEP:
+                if steps == MAX_CATCHUP_STEPS:
+                    # Too far behind to catch up; let the game slow down instead
+                    dropped = int(self._accumulator / SIM_STEP)
+                    self.dropped_steps += dropped
+                    self._accumulator -= dropped * SIM_STEP
+                    break
+                self._accumulator -= SIM_STEP
+                steps += 1
+                if self._simulate(SIM_STEP):
+                    # A state entered now must not inherit the previous one's backlog
+                    self._accumulator = 0.0
+                    break
+        else:
+            # Static states only run timers; they get the real elapsed time
+            self._accumulator = 0.0
+            self._simulate(dt)
+
+        # Render (clear() starts a new frame and reallocates after a resize)
+        if self.state_manager.needs_render():
+            self.terminal.clear()
+            self.state_manager.render(self.terminal)
+            self.terminal.flush()
+
+    def _simulate(self, dt: float) -> bool:
+        """Feed the next pending key to the current state and update it.
+
+        Args:
+            dt: Seconds to simulate
+
+        Returns:
+            True if the input changed the state
+        """
+        state = self.state_manager.current_state
+        key = self._pending_keys.popleft() if self._pending_keys else Keystroke("")
+        self.state_manager.handle_input(key)
+        changed = self.state_manager.current_state is not state
+        if changed:
+            # A state entered now must not inherit time spent idle in the previous one
+            dt = min(dt, SIM_STEP)
+        self.state_manager.update(dt)
+        self.sim_steps += 1
+        return changed
+
     def reset_game(self) -> None:
         """Reset game to initial state for new game."""
         from .config import PLAYER_LIVES
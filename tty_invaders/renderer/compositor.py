@@ -0,0 +1,345 @@
+"""Layered compositor with cached static layers."""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .framebuffer import CONTINUATION, Cell, DrawCommand, FrameBuffer, clip_cells, text_cells
+from .sprite_cache import SpriteCache
+
+# Layer z-order. Playfield and effects are submitted as draw lists each
+# frame (or drawn immediately in call order); cached layers sit below or
+# above them.
+LAYER_BACKGROUND = 0
+LAYER_PLAYFIELD = 10
+LAYER_EFFECTS = 20
+LAYER_HUD = 30
+
+# Content key of a layer that must be redrawn
+_STALE = object()
+
+Span = Tuple[int, int, Tuple[Cell, ...]]
+
+# Covered columns of a row as sorted, disjoint [start, end) intervals
+Coverage = List[Tuple[int, int]]
+
+
+def _uncovered(coverage: Coverage, start: int, end: int) -> Coverage:
+    """Get the parts of a span that are not covered yet.
+
+    Args:
+        coverage: Covered intervals of the row
+        start: First column of the span
+        end: Column after the span
+
+    Returns:
+        Visible [start, end) pieces, left to right
+    """
+    pieces = []
+    x = start
+    for a, b in coverage:
+        if b <= x:
+            continue
+        if a >= end:
+            break
+        if a > x:
+            pieces.append((x, a))
+        x = b
+        if x >= end:
+            break
+    if x < end:
+        pieces.append((x, end))
+    return pieces
+
+
+def _cover(coverage: Coverage, start: int, end: int) -> None:
+    """Mark a span of a row as covered.
+
+    Args:
+        coverage: Covered intervals of the row (modified in place)
+        start: First column of the span
+        end: Column after the span
+    """
+    merged = []
+    placed = False
+    for a, b in coverage:
+        if b < start:
+            merged.append((a, b))
+        elif a > end:
+            if not placed:
+                merged.append((start, end))
+                placed = True
+            merged.append((a, b))
+        else:
+            start, end = min(a, start), max(b, end)
+    if not placed:
+        merged.append((start, end))
+    coverage[:] = merged
+
+
+class Layer:
+    """Cached drawing layer.
+
+    A layer records what was drawn into it as spans of cells in game
+    coordinates. It is only redrawn when its content key changes or it is
+    invalidated, and only re-composited when it is dirty.
+    """
+
+    def __init__(self, compositor: "Compositor", name: str, z: int) -> None:
+        """Initialize the layer.
+
+        Args:
+            compositor: Owning compositor
+            name: Layer name
+            z: Z-order (higher is drawn on top)
+        """
+        self.compositor = compositor
+        self.name = name
+        self.z = z
+        self.spans: List[Span] = []
+        self.dirty = True
+        self._key: Any = _STALE
+
+    def begin(self, key: Any) -> bool:
+        """Start redrawing the layer if its content key changed.
+
+        Args:
+            key: Hashable value describing the layer content (e.g. the score)
+
+        Returns:
+            True if the layer was cleared and must be drawn again
+        """
+        if key == self._key:
+            return False
+        self._key = key
+        self.clear()
+        return True
+
+    def invalidate(self) -> None:
+        """Force the layer to be redrawn on the next begin()."""
+        self._key = _STALE
+
+    def clear(self) -> None:
+        """Remove everything drawn into the layer."""
+        self.spans.clear()
+        self.dirty = True
+
+    def write_at(self, x: int, y: int, text: str, color: Optional[str] = None) -> None:
+        """Draw text into the layer.
+
+        Args:
+            x: Column position (game coordinates)
+            y: Row position
+            text: Text to draw
+            color: Optional color name
+        """
+        self.spans.append((x, y, tuple(text_cells(text, color))))
+        self.dirty = True
+
+    def draw(self, commands: Iterable[DrawCommand]) -> None:
+        """Draw a list of text runs into the layer.
+
+        Args:
+            commands: (x, y, text, color) entries in game coordinates
+        """
+        run = self.compositor.sprites.run
+        self.spans.extend((x, y, run(text, color)) for x, y, text, color in commands)
+        self.dirty = True
+
+    def draw_sprite(self, x: int, y: int, sprite_id: str, frame: int,
+                    color: Optional[str] = None) -> None:
+        """Draw a cached sprite frame into the layer.
+
+        Args:
+            x: Column position (game coordinates)
+            y: Row position of the top line
+            sprite_id: Key in SPRITE_FRAMES
+            frame: Animation frame index
+            color: Optional color name
+        """
+        sprite = self.compositor.sprites.get(sprite_id, frame, color)
+        for j, row in enumerate(sprite.rows):
+            self.spans.append((x, y + j, row))
+        self.dirty = True
+
+
+class Compositor:
+    """Composites cached layers around the immediately drawn playfield.
+
+    Layers below the playfield are composed once into a base grid that each
+    frame starts from; layers above it are blitted over the frame at flush.
+    """
+
+    def __init__(self, sprites: SpriteCache) -> None:
+        """Initialize the compositor.
+
+        Args:
+            sprites: Sprite cache used by layers
+        """
+        self.sprites = sprites
+        self.layers: Dict[str, Layer] = {}
+        self._base: Optional[FrameBuffer] = None
+        self._base_key: Any = None
+        self.submitted: List[Tuple[int, int, Sequence[DrawCommand]]] = []
+
+        # Cells written by resolve() and cells it skipped as hidden
+        self.cells_drawn = 0
+        self.cells_culled = 0
+
+        self.add_layer("background", LAYER_BACKGROUND)
+        self.add_layer("hud", LAYER_HUD)
+
+    def add_layer(self, name: str, z: int) -> Layer:
+        """Add a cached layer.
+
+        Args:
+            name: Layer name
+            z: Z-order, must not equal LAYER_PLAYFIELD
+
+        Returns:
+            The new layer
+        """
+        layer = Layer(self, name, z)
+        self.layers[name] = layer
+        return layer
+
+    def layer(self, name: str) -> Layer:
+        """Get a layer by name.
+
+        Args:
+            name: Layer name
+
+        Returns:
+            Layer instance
+        """
+        return self.layers[name]
+
+    def reset(self) -> None:
+        """Clear and invalidate all layers (e.g. on state change)."""
+        for layer in self.layers.values():
+            layer.invalidate()
+            layer.clear()
+
+    def _sorted(self, below: bool) -> List[Layer]:
+        """Get layers below or above the playfield in z-order.
+
+        Args:
+            below: True for layers under the playfield
+
+        Returns:
+            Layers sorted bottom to top
+        """
+        layers = sorted(self.layers.values(), key=lambda layer: layer.z)
+        return [layer for layer in layers if (layer.z < LAYER_PLAYFIELD) == below]
+
+    def compose_base(self, fb: FrameBuffer, x_offset: int) -> None:
+        """Start a frame from the cached composition of the lower layers.
+
+        Args:
+            fb: Framebuffer whose back grid is reset
+            x_offset: Horizontal offset applied to game coordinates
+        """
+        layers = self._sorted(below=True)
+        if not any(layer.spans for layer in layers):
+            fb.clear()
+            return
+
+        key = (fb.width, fb.height, x_offset)
+        base = self._base
+        if base is None or key != self._base_key or any(layer.dirty for layer in layers):
+            if base is None or (base.width, base.height) != (fb.width, fb.height):
+                base = self._base = FrameBuffer(fb.width, fb.height)
+            else:
+                base.clear()
+            for layer in layers:
+                for x, y, cells in layer.spans:
+                    base.blit(x + x_offset, y, (cells,))
+                layer.dirty = False
+            self._base_key = key
+
+        fb.load(base.back)
+
+    def compose_overlay(self, fb: FrameBuffer, x_offset: int) -> None:
+        """Draw the upper layers over the current frame.
+
+        Args:
+            fb: Framebuffer to draw into
+            x_offset: Horizontal offset applied to game coordinates
+        """
+        for layer in self._sorted(below=False):
+            for x, y, cells in layer.spans:
+                fb.blit(x + x_offset, y, (cells,))
+            layer.dirty = False
+
+    def submit(self, commands: Sequence[DrawCommand], z: int = LAYER_PLAYFIELD) -> None:
+        """Queue a draw list for this frame.
+
+        Lists are resolved in z-order (submission order within a z) by
+        resolve(), which draws them top-down and skips hidden cells.
+
+        Args:
+            commands: (x, y, text, color) entries in game coordinates
+            z: Z-order of the list
+        """
+        self.submitted.append((z, len(self.submitted), commands))
+
+    def discard(self) -> None:
+        """Drop draw lists queued for an unfinished frame."""
+        self.submitted.clear()
+
+    def resolve(self, fb: FrameBuffer, x_offset: int) -> None:
+        """Draw the queued lists so each visible cell is written once.
+
+        Lists are walked from the top of the z-order down, and within a
+        list from the last entry to the first, keeping the covered columns
+        of each row. Cells already covered, including those under the upper
+        cached layers, are skipped and counted in cells_culled; the result
+        is the same as painting everything bottom-up.
+
+        Args:
+            fb: Framebuffer to draw into
+            x_offset: Horizontal offset applied to game coordinates
+        """
+        submitted = self.submitted
+        if not submitted:
+            return
+        submitted.sort(key=lambda entry: entry[:2], reverse=True)
+
+        left = fb.clip_left
+        right = fb.clip_right
+        height = fb.height
+        covered: Dict[int, Coverage] = {}
+        for layer in self._sorted(below=False):
+            for x, y, cells in layer.spans:
+                x += x_offset
+                _cover(covered.setdefault(y, []), x, x + len(cells))
+
+        back = fb.back
+        runs = self.sprites.run
+        drawn = culled = 0
+        for _, _, commands in submitted:
+            for x, y, text, style in reversed(commands):
+                if y < 0 or y >= height:
+                    continue
+                run = runs(text, style)
+                x += x_offset
+                start = x if x > left else left
+                end = min(x + len(run), right)
+                if start >= end:
+                    continue
+                coverage = covered.setdefault(y, [])
+                visible = _uncovered(coverage, start, end) if coverage else [(start, end)]
+                row = back[y]
+                for a, b in visible:
+                    # Cells next to an uncovered piece still hold the base; a
+                    # wide glyph there losing half to the piece is blanked
+                    if row[a][0] == CONTINUATION and a > 0 and a == start \
+                            and _uncovered(coverage, a - 1, a):
+                        row[a - 1] = (" ", row[a - 1][1])
+                    if b < len(row) and row[b][0] == CONTINUATION:
+                        row[b] = (" ", row[b][1])
+                    row[a:b] = clip_cells(run, a - x, b - x)
+                    drawn += b - a
+                culled += end - start
+                _cover(coverage, start, end)
+        culled -= drawn
+        self.cells_drawn += drawn
+        self.cells_culled += culled
+        submitted.clear()
@@ -0,0 +1,310 @@
+"""Terminal backend built on the standard library curses module."""
+import io
+import itertools
+import locale
+import shutil
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+from blessed import Terminal as BlessedTerminal
+from blessed.keyboard import Keystroke
+
+from .output import Frame
+from .styles import StyleRegistry
+from .terminal import TerminalBackend
+from ..config import GAME_WIDTH, GAME_HEIGHT
+
+try:
+    import curses
+except ImportError:  # e.g. Windows without windows-curses
+    curses = None  # type: ignore[assignment]
+
+# Base color names understood in style names ("red", "bright_red", "bold_red")
+_COLOR_NAMES = ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white")
+
+# Milliseconds curses waits after ESC for the rest of a key sequence
+ESCAPE_DELAY = 25
+
+
+def parse_style(name: Optional[str], colors: int) -> Tuple[int, bool]:
+    """Split a color name into a curses color number and a bold flag.
+
+    Args:
+        name: Color name (e.g. "cyan", "bright_red", "bold_yellow"), or None
+        colors: Number of colors the terminal supports
+
+    Returns:
+        Tuple of (color number or -1 for the default color, bold)
+    """
+    if not name:
+        return -1, False
+    bold = False
+    bright = False
+    parts = name.split("_")
+    while len(parts) > 1 and parts[0] in ("bold", "bright"):
+        if parts.pop(0) == "bold":
+            bold = True
+        else:
+            bright = True
+    base = "_".join(parts)
+    if base not in _COLOR_NAMES:
+        return -1, bold
+    color = _COLOR_NAMES.index(base)
+    if bright:
+        if colors >= 16:
+            color += 8
+        else:
+            bold = True  # Eight-color terminals show bright colors as bold
+    return color, bold
+
+
+class CursesTerminal(TerminalBackend):
+    """Terminal backend that draws through curses windows.
+
+    Frames are still composed in the shared FrameBuffer, but changed runs
+    are handed to a curses window and sent with noutrefresh()/doupdate(),
+    so curses' own screen optimization (including hardware insert/delete
+    line via idlok) decides what goes to the terminal. Keys are returned
+    as blessed Keystrokes so states can't tell the backends apart.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the curses terminal (curses starts in fullscreen()).
+
+        Raises:
+            RuntimeError: If the curses module is not available
+        """
+        if curses is None:
+            raise RuntimeError("The curses backend is not available on this platform")
+        # Only used to name colors and keys; curses does all of the output
+        self.term = BlessedTerminal(stream=io.StringIO(), force_styling=True)
+        size = shutil.get_terminal_size((GAME_WIDTH, GAME_HEIGHT))
+        super().__init__(StyleRegistry.for_terminal(self.term), size.columns, size.lines, "")
+        # curses is not thread-safe, and buffers output itself
+        self.threaded_output = False
+        self.scroll_acceleration = False
+        self._screen: Any = None
+        self._attrs: Dict[Optional[str], int] = {}
+        self._pairs: Dict[Tuple[int, int], int] = {}
+
+        # Key code -> the sequence the terminal would send for it
+        self._key_sequences: Dict[int, str] = {}
+        for seq, code in self.term._keymap.items():
+            self._key_sequences.setdefault(code, seq)
+
+    @contextmanager
+    def fullscreen(self) -> Iterator[None]:
+        """Start curses for the duration of the block.
+
+        Sets up the screen the way the game needs it: no echo, cbreak,
+        keypad decoding, hidden cursor, colors and insert/delete line.
+        """
+        locale.setlocale(locale.LC_ALL, "")
+        screen = curses.initscr()
+        try:
+            curses.noecho()
+            curses.cbreak()
+            screen.keypad(True)
+            screen.idlok(True)
+            screen.leaveok(True)
+            if hasattr(curses, "set_escdelay"):
+                curses.set_escdelay(ESCAPE_DELAY)
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass  # Terminal can't hide the cursor
+            if curses.has_colors():
+                curses.start_color()
+                curses.use_default_colors()
+            self._screen = screen
+            self._attrs = {}
+            self._pairs = {}
+            self._clear_pending = True
+            self._resize_pending = True
+            yield
+        finally:
+            self._screen = None
+            screen.keypad(False)
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+
+    def _query_size(self) -> Tuple[int, int]:
+        """Get the size of the curses screen.
+
+        Returns:
+            Tuple of (width, height)
+        """
+        if self._screen is None:
+            size = shutil.get_terminal_size((self._width, self._height))
+            return size.columns, size.lines
+        height, width = self._screen.getmaxyx()
+        return width, height
+
+    def _attr(self, style: Optional[str]) -> int:
+        """Get the curses attributes for a color name, allocating a pair once.
+
+        Args:
+            style: Color name, or None
+
+        Returns:
+            curses attribute bits
+        """
+        try:
+            return self._attrs[style]
+        except KeyError:
+            pass
+
+        attr = curses.A_NORMAL
+        if style and curses.has_colors():
+            color, bold = parse_style(style, curses.COLORS)
+            if bold:
+                attr |= curses.A_BOLD
+            if color >= 0:
+                pair = self._pairs.get((color, -1))
+                if pair is None and len(self._pairs) + 1 < curses.COLOR_PAIRS:
+                    pair = len(self._pairs) + 1
+                    curses.init_pair(pair, color, -1)
+                    self._pairs[(color, -1)] = pair
+                if pair is not None:
+                    attr |= curses.color_pair(pair)
+        self._attrs[style] = attr
+        return attr
+
+    def _write_frame(self, frame: Frame) -> None:
+        """Copy changed runs into the curses screen and let curses update.
+
+        Args:
+            frame: Finished frame
+        """
+        screen = self._screen
+        if screen is None:
+            return
+        fb = self.framebuffer
+        rows = frame.rows
+        if frame.clear:
+            # Repaint everything on the next doupdate()
+            screen.clear()
+            fb.reset_front(len(rows[0]) if rows else 0, len(rows))
+
+        cells_written = 0
+        for y, x, cells in fb.diff(rows):
+            cells_written += len(cells)
+            for style, group in itertools.groupby(cells, key=lambda cell: cell[1]):
+                run = list(group)
+                text = "".join(glyph for glyph, _ in run)
+                try:
+                    screen.addstr(y, x, text, self._attr(style))
+                except curses.error:
+                    pass  # Writing the bottom-right cell can't advance the cursor
+                x += len(run)
+
+        screen.noutrefresh()
+        curses.doupdate()
+        self.frames_written += 1
+        self.cells_written += cells_written
+
+    def _move_sequence(self, x: int, y: int) -> str:
+        """Get the cursor address sequence (curses moves the cursor itself).
+
+        Args:
+            x: Column position (0-indexed)
+            y: Row position (0-indexed)
+
+        Returns:
+            Cursor movement sequence
+        """
+        return self.term.move_xy(x, y)
+
+    def _write_bytes(self, data: memoryview) -> None:
+        """Discard raw output; curses owns the terminal.
+
+        Args:
+            data: Encoded output
+        """
+
+    def recording(self, path: str) -> Any:
+        """Recording needs the raw output, which curses never exposes.
+
+        Args:
+            path: Recording file
+
+        Raises:
+            RuntimeError: Always
+        """
+        raise RuntimeError("Recording is only supported by the blessed backend")
+
+    def _keystroke(self, ch: Any) -> Any:
+        """Convert a get_wch() result into a blessed Keystroke.
+
+        Args:
+            ch: Character (str) or curses key code (int)
+
+        Returns:
+            Keystroke object, or an empty Keystroke for no key
+        """
+        if isinstance(ch, int):
+            if ch == curses.KEY_RESIZE:
+                self._resize_pending = True
+                return Keystroke("")
+            # blessed key codes are the curses ones
+            name = self.term._keycodes.get(ch)
+            if name is None:
+                return Keystroke("")
+            return Keystroke(self._key_sequences.get(ch, name), code=ch, name=name)
+        code = self.term._keymap.get(ch)
+        if code is not None:
+            return Keystroke(ch, code=code, name=self.term._keycodes.get(code))
+        return Keystroke(ch)
+
+    def _read(self, timeout: Optional[float]) -> Any:
+        """Read one key or key code from curses.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            get_wch() result, or None on timeout
+        """
+        screen = self._screen
+        if screen is None:
+            return None
+        screen.timeout(-1 if timeout is None else int(timeout * 1000))
+        try:
+            return screen.get_wch()
+        except curses.error:
+            return None
+
+    def inkey(self, timeout: float = 0) -> Any:
+        """Read a keystroke with optional timeout.
+
+        Args:
+            timeout: Timeout in seconds (0 for non-blocking)
+
+        Returns:
+            Keystroke object or empty Keystroke if no input
+        """
+        ch = self._read(timeout)
+        if ch is None:
+            return Keystroke("")
+        return self._keystroke(ch)
+
+    def wait_for_input(self, timeout: Optional[float] = None) -> bool:
+        """Block until a key is available, the terminal resizes, or timeout.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a key may be available
+        """
+        ch = self._read(timeout)
+        if ch is None:
+            return False
+        if ch == curses.KEY_RESIZE:
+            self._resize_pending = True
+            return False
+        if isinstance(ch, int):
+            curses.ungetch(ch)
+        else:
+            curses.unget_wch(ch)
+        return True
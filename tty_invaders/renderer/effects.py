@@ -19,6 +19,7 @@ class Explosion:
         self.y = y
         self.frame = 0
         self.frames = EXPLOSION_FRAMES
+        self.sprite_id = "explosion"
         self.frame_time = 0.0
         self.frame_duration = 0.1  # Seconds per frame
         self.alive = True
@@ -0,0 +1,319 @@
+"""Cell framebuffer used to send only changed screen cells to the terminal.
+
+A double-width glyph (East Asian wide or fullwidth) takes two cells: the
+glyph followed by a continuation cell with an empty glyph, which encodes to
+nothing. Drawing is clipped to the grid and to an optional column range
+(the game area); a clip edge or a later draw that cuts such a glyph in half
+leaves a blank in the remaining half.
+"""
+import unicodedata
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# A screen cell is a (glyph, style) pair; style is a blessed color name or None
+Cell = Tuple[str, Optional[str]]
+
+# A draw-list entry: text drawn at (x, y) in one style
+DrawCommand = Tuple[int, int, str, Optional[str]]
+
+BLANK: Cell = (" ", None)
+
+# Glyph of the cell under the right half of a double-width glyph
+CONTINUATION = ""
+
+# Converts a (text, style) run to cells, e.g. text_cells or SpriteCache.run
+RunSource = Callable[[str, Optional[str]], Sequence[Cell]]
+
+
+def glyph_width(ch: str) -> int:
+    """Get the number of screen cells a character takes.
+
+    Args:
+        ch: Single character
+
+    Returns:
+        2 for wide and fullwidth characters, otherwise 1
+    """
+    if ch < "\u1100":
+        return 1  # Nothing below the Hangul Jamo block is wide
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+def text_cells(text: str, style: Optional[str] = None) -> List[Cell]:
+    """Convert text to styled cells.
+
+    Args:
+        text: Text to convert
+        style: Optional color name
+
+    Returns:
+        One cell per character, plus a continuation cell after each wide one
+    """
+    cells: List[Cell] = []
+    for ch in text:
+        cells.append((ch, style))
+        if glyph_width(ch) == 2:
+            cells.append((CONTINUATION, style))
+    return cells
+
+
+def clip_cells(cells: Sequence[Cell], start: int, end: int) -> List[Cell]:
+    """Slice a run of cells, blanking wide glyphs cut by either edge.
+
+    Args:
+        cells: Run of cells
+        start: First cell kept
+        end: Cell after the last one kept
+
+    Returns:
+        Cells start..end-1
+    """
+    piece = list(cells[start:end])
+    if piece:
+        if piece[0][0] == CONTINUATION:
+            piece[0] = (" ", piece[0][1])
+        if end < len(cells) and cells[end][0] == CONTINUATION:
+            piece[-1] = (" ", piece[-1][1])
+    return piece
+
+
+class FrameBuffer:
+    """Front and back grids of (glyph, style) cells.
+
+    The back grid is what the current frame wants on screen. The front grid
+    mirrors what the terminal is currently showing, so only cells that differ
+    between the two need to be sent.
+    """
+
+    def __init__(self, width: int, height: int, runs: Optional[RunSource] = None) -> None:
+        """Initialize the framebuffer.
+
+        Args:
+            width: Grid width in cells
+            height: Grid height in cells
+            runs: Source of text run cells (defaults to text_cells, uncached)
+        """
+        self.width = width
+        self.height = height
+        self.back: List[List[Cell]] = self._blank_grid()
+        self.front: List[List[Cell]] = self._blank_grid()
+        self.cursor_x = 0
+        self.cursor_y = 0
+        self.clip_left = 0
+        self.clip_right = width
+        self.run: RunSource = runs if runs is not None else text_cells
+
+    def _blank_grid(self) -> List[List[Cell]]:
+        """Create a grid of blank cells.
+
+        Returns:
+            List of rows filled with blank cells
+        """
+        return [[BLANK] * self.width for _ in range(self.height)]
+
+    def resize(self, width: int, height: int) -> None:
+        """Reallocate the back grid for a new terminal size.
+
+        The front grid is reallocated by the next diff, so callers must clear
+        the physical screen before it. The clip is reset to the whole grid.
+
+        Args:
+            width: New width in cells
+            height: New height in cells
+        """
+        self.width = width
+        self.height = height
+        self.back = self._blank_grid()
+        self.set_clip(0, width)
+
+    def clear(self) -> None:
+        """Blank the back grid for a new frame."""
+        blank_row = [BLANK] * self.width
+        for row in self.back:
+            row[:] = blank_row
+
+    def load(self, rows: Sequence[Sequence[Cell]]) -> None:
+        """Replace the back grid with a copy of prebuilt rows.
+
+        Args:
+            rows: Rows of cells with the same size as the grid
+        """
+        for row, src in zip(self.back, rows):
+            row[:] = src
+
+    def snapshot(self) -> List[List[Cell]]:
+        """Copy the back grid so it can be diffed while the next frame is drawn.
+
+        Returns:
+            Copy of the back grid rows
+        """
+        return [row[:] for row in self.back]
+
+    def reset_front(self, width: Optional[int] = None, height: Optional[int] = None) -> None:
+        """Mark the front grid as blank after the physical screen was cleared.
+
+        Args:
+            width: Screen width (defaults to the grid width)
+            height: Screen height (defaults to the grid height)
+        """
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        self.front = [[BLANK] * width for _ in range(height)]
+
+    def move(self, x: int, y: int) -> None:
+        """Move the drawing cursor.
+
+        Args:
+            x: Column position (0-indexed)
+            y: Row position (0-indexed)
+        """
+        self.cursor_x = x
+        self.cursor_y = y
+
+    def set_clip(self, left: int, right: int) -> None:
+        """Limit drawing to a range of columns (clamped to the grid).
+
+        Args:
+            left: First visible column
+            right: Column after the last visible one
+        """
+        self.clip_left = max(0, min(left, self.width))
+        self.clip_right = max(self.clip_left, min(right, self.width))
+
+    def _place(self, row: List[Cell], x: int, cells: Sequence[Cell]) -> None:
+        """Copy a run of cells into a row, clipping and mending wide glyphs.
+
+        Args:
+            row: Back grid row
+            x: Column of the first cell
+            cells: Run of cells
+        """
+        left = self.clip_left
+        right = self.clip_right
+        end = x + len(cells)
+        if x < left or end > right:
+            if x >= right or end <= left:
+                return
+            start = left - x if x < left else 0
+            cells = clip_cells(cells, start, min(end, right) - x)
+            x += start
+            end = x + len(cells)
+        if not cells:
+            return
+        # A wide glyph losing either half to this run is blanked
+        if row[x][0] == CONTINUATION and x > 0:
+            row[x - 1] = (" ", row[x - 1][1])
+        row[x:end] = cells
+        if end < len(row) and row[end][0] == CONTINUATION:
+            row[end] = (" ", row[end][1])
+
+    def put(self, x: int, y: int, text: str, style: Optional[str] = None) -> None:
+        """Draw text into the back grid, clipping at the grid and clip edges.
+
+        Args:
+            x: Column position (0-indexed)
+            y: Row position (0-indexed)
+            text: Text to draw (wide characters take two cells)
+            style: Optional color name
+        """
+        cells = self.run(text, style)
+        self.cursor_x = x + len(cells)
+        self.cursor_y = y
+
+        if 0 <= y < self.height:
+            self._place(self.back[y], x, cells)
+
+    def blit(self, x: int, y: int, rows: Sequence[Sequence[Cell]]) -> None:
+        """Copy prebuilt rows of cells into the back grid.
+
+        Args:
+            x: Column of the top-left corner
+            y: Row of the top-left corner
+            rows: Rows of cells, e.g. from a compiled sprite
+        """
+        back = self.back
+        for row_y, cells in enumerate(rows, y):
+            if 0 <= row_y < self.height:
+                self._place(back[row_y], x, cells)
+
+    def draw(self, commands: Iterable[DrawCommand], x_offset: int = 0) -> None:
+        """Draw a list of text runs into the back grid in one pass.
+
+        Runs are converted to cells by the run source, which can cache them
+        across frames, so redrawing the same strings is a slice assignment;
+        only runs crossing a clip edge or a wide glyph are sliced. The
+        drawing cursor is not moved.
+
+        Args:
+            commands: (x, y, text, style) entries, drawn in order
+            x_offset: Horizontal offset added to every x
+        """
+        back = self.back
+        height = self.height
+        left = self.clip_left
+        right = self.clip_right
+        run = self.run
+        place = self._place
+        for x, y, text, style in commands:
+            if y < 0 or y >= height or not text:
+                continue
+            cells = run(text, style)
+            x += x_offset
+            end = x + len(cells)
+            row = back[y]
+            if x >= left and end < right and row[x][0] and row[end][0]:
+                # Inside the clip and not cutting a wide glyph
+                row[x:end] = cells
+            else:
+                place(row, x, cells)
+
+    def write(self, text: str, style: Optional[str] = None) -> None:
+        """Draw text at the drawing cursor and advance it.
+
+        Args:
+            text: Text to draw
+            style: Optional color name
+        """
+        self.put(self.cursor_x, self.cursor_y, text, style)
+
+    def diff(self, rows: Optional[List[List[Cell]]] = None
+             ) -> Iterator[Tuple[int, int, List[Cell]]]:
+        """Yield changed spans and commit them to the front grid.
+
+        The front grid is only touched here (and in reset_front), so diffing
+        a snapshot may run on another thread while the next frame is drawn.
+
+        Args:
+            rows: Grid to diff against the front grid (defaults to the back grid)
+
+        Yields:
+            Tuples of (y, x, cells) for each contiguous run of changed cells
+        """
+        if rows is None:
+            rows = self.back
+        front = self.front
+        if len(front) != len(rows) or (rows and len(front[0]) != len(rows[0])):
+            self.reset_front(len(rows[0]) if rows else 0, len(rows))
+            front = self.front
+
+        for y, back_row in enumerate(rows):
+            front_row = front[y]
+            if back_row == front_row:
+                continue
+
+            x = 0
+            width = len(back_row)
+            while x < width:
+                if back_row[x] == front_row[x]:
+                    x += 1
+                    continue
+                start = x
+                while x < width and back_row[x] != front_row[x]:
+                    x += 1
+                # Always send whole wide glyphs
+                if start and back_row[start][0] == CONTINUATION:
+                    start -= 1
+                while x < width and back_row[x][0] == CONTINUATION:
+                    x += 1
+                yield y, start, back_row[start:x]
+
+            front[y] = back_row[:]
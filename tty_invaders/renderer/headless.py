@@ -0,0 +1,127 @@
+"""In-memory terminal backend for benchmarks and tests."""
+import io
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Tuple, Union
+from blessed import Terminal as BlessedTerminal
+from blessed.keyboard import Keystroke
+
+from .styles import StyleRegistry
+from .terminal import TerminalBackend
+from ..config import GAME_WIDTH, GAME_HEIGHT
+
+# Terminal description used to resolve colors and cursor moves, so encoded
+# output matches what a typical real terminal would receive
+HEADLESS_KIND = "xterm-256color"
+
+# A scripted key is a character ("q", " ") or a blessed key name ("KEY_LEFT");
+# None stands for a frame without input
+ScriptedKey = Union[str, None]
+
+
+class HeadlessTerminal(TerminalBackend):
+    """Terminal backend that never touches a tty.
+
+    Frames go through the same diff and encoder as the real terminal, but
+    the encoded bytes are only counted. The front grid holds what a real
+    screen would show. Input comes from a script of keys, one per inkey().
+    Frames are written inline by default so every frame is counted.
+    """
+
+    # Frames are not paced to wall-clock time
+    realtime = False
+
+    def __init__(self, width: int = GAME_WIDTH, height: int = GAME_HEIGHT,
+                 keys: Iterable[ScriptedKey] = (), threaded: bool = False) -> None:
+        """Initialize the headless terminal.
+
+        Args:
+            width: Screen width in cells
+            height: Screen height in cells
+            keys: Scripted input
+            threaded: Write frames on the background writer thread
+        """
+        self.term = BlessedTerminal(kind=HEADLESS_KIND, stream=io.StringIO(),
+                                    force_styling=True)
+        self._screen_size = (width, height)
+        super().__init__(StyleRegistry.for_terminal(self.term), width, height,
+                         self.term.normal + self.term.clear)
+        self.threaded_output = threaded
+        self.keys: Deque[ScriptedKey] = deque()
+        self.feed(*keys)
+
+        # Key code -> the sequence this terminal would send for it
+        self._key_sequences: Dict[int, str] = {}
+        for seq, code in self.term._keymap.items():
+            self._key_sequences.setdefault(code, seq)
+
+    def resize(self, width: int, height: int) -> None:
+        """Change the simulated screen size, like a SIGWINCH would.
+
+        Args:
+            width: New width in cells
+            height: New height in cells
+        """
+        self._screen_size = (width, height)
+        self._resize_pending = True
+
+    def _query_size(self) -> Tuple[int, int]:
+        """Get the simulated screen size.
+
+        Returns:
+            Tuple of (width, height)
+        """
+        return self._screen_size
+
+    def feed(self, *keys: ScriptedKey) -> None:
+        """Append keys to the input script.
+
+        Args:
+            keys: Characters, blessed key names, or None for no input
+        """
+        self.keys.extend(keys)
+
+    def inkey(self, timeout: float = 0) -> Any:
+        """Read the next scripted key.
+
+        Args:
+            timeout: Ignored; the script never blocks
+
+        Returns:
+            Keystroke object, or an empty Keystroke once the script runs out
+        """
+        if not self.keys:
+            return Keystroke("")
+        key = self.keys.popleft()
+        if key is None:
+            return Keystroke("")
+        if key.startswith("KEY_"):
+            code = getattr(self.term, key)
+            return Keystroke(self._key_sequences.get(code, key), code=code, name=key)
+        return Keystroke(key)
+
+    def screen_lines(self) -> List[str]:
+        """Get the text currently shown on the simulated screen.
+
+        Returns:
+            One string per screen row
+        """
+        return ["".join(glyph for glyph, _ in row) for row in self.framebuffer.front]
+
+    def _move_sequence(self, x: int, y: int) -> str:
+        """Get the cursor address sequence.
+
+        Args:
+            x: Column position (0-indexed)
+            y: Row position (0-indexed)
+
+        Returns:
+            Cursor movement sequence
+        """
+        return self.term.move_xy(x, y)
+
+    def _write_bytes(self, data: memoryview) -> None:
+        """Discard encoded output (it is counted in bytes_written).
+
+        Args:
+            data: Encoded output
+        """
@@ -0,0 +1,121 @@
+"""Background output stage for finished frames."""
+import threading
+from typing import Callable, List, NamedTuple, Optional
+
+from .framebuffer import Cell
+
+
+class Frame(NamedTuple):
+    """Snapshot of a finished back grid."""
+
+    rows: List[List[Cell]]
+    clear: bool  # Clear the physical screen before drawing
+
+
+class FrameWriter:
+    """Writer thread that encodes and writes frames to the terminal.
+
+    At most one frame is in flight and one is pending. If the terminal
+    drains slower than the game renders, a newer frame supersedes the
+    pending one instead of queueing behind it, so the game loop never waits
+    on the TTY. A frame is always diffed against what was actually written,
+    so dropping intermediate frames never leaves stale cells on screen.
+    """
+
+    def __init__(self, write_frame: Callable[[Frame], None]) -> None:
+        """Initialize the writer.
+
+        Args:
+            write_frame: Encodes and writes one frame (runs on the writer thread)
+        """
+        self._write_frame = write_frame
+        self._cond = threading.Condition()
+        self._pending: Optional[Frame] = None
+        self._busy = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+
+        # Counters
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+
+    @property
+    def running(self) -> bool:
+        """Check if the writer thread is running."""
+        return self._running
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="tty-invaders-writer",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write any pending frame and stop the writer thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, frame: Frame) -> None:
+        """Queue a frame, superseding a pending one that was not written yet.
+
+        Args:
+            frame: Finished frame
+        """
+        with self._cond:
+            self.frames_submitted += 1
+            pending = self._pending
+            if pending is not None:
+                self.frames_dropped += 1
+                if pending.clear and not frame.clear:
+                    frame = Frame(frame.rows, True)
+            self._pending = frame
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted frame has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if the writer is idle
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout)
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or not self._running)
+                frame = self._pending
+                if frame is None:
+                    return
+                self._pending = None
+                self._busy = True
+
+            try:
+                self._write_frame(frame)
+            except Exception as exc:  # Surface on the game thread
+                self.error = exc
+                with self._cond:
+                    self._running = False
+                    self._busy = False
+                    self._pending = None
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self.frames_written += 1
+                self._busy = False
+                self._cond.notify_all()
@@ -0,0 +1,188 @@
+"""Streaming asciicast v2 recorder for terminal output."""
+import gzip
+import io
+import json
+import os
+import queue
+import threading
+import time
+from typing import IO, Any, Optional, Tuple
+
+from ..config import RECORD_ROTATE_BYTES
+
+# Queued event: (seconds since start, event type, data, starts from a cleared screen)
+Event = Tuple[float, str, str, bool]
+
+
+class AsciicastRecorder:
+    """Records terminal output to asciicast v2 files.
+
+    record() only timestamps the output and queues it; a background thread
+    encodes events and writes them through a buffered file, so recording
+    never waits on the disk. Once a file reaches max_bytes the recorder
+    asks for a full repaint (keyframe_wanted) and continues in a new
+    numbered file with its own header from that repaint on, so every file
+    plays back on its own. Files ending in ".gz" are gzip-compressed as
+    they are written.
+    """
+
+    def __init__(self, path: str, width: int, height: int,
+                 max_bytes: int = RECORD_ROTATE_BYTES) -> None:
+        """Initialize the recorder.
+
+        Args:
+            path: Recording file (e.g. "session.cast" or "session.cast.gz")
+            width: Terminal width in cells
+            height: Terminal height in cells
+            max_bytes: Size at which a new file is started (0 never rotates)
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.max_bytes = max_bytes
+        self.files = 0
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.SimpleQueue[Optional[Event]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start = 0.0
+        self._raw: Optional[IO[bytes]] = None
+        self._out: Optional[io.BufferedIOBase] = None  # _raw, or a GzipFile over it
+        self._offset = 0.0
+        self.keyframe_wanted = False
+        self._keyframe_requested = False
+
+    @property
+    def running(self) -> bool:
+        """Check if the recorder thread is running."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start recording."""
+        if self._thread is not None:
+            return
+        self._start = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="tty-invaders-recorder",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write all queued events and close the recording."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def record(self, data: bytes, keyframe: bool = False) -> None:
+        """Queue output that was sent to the terminal.
+
+        Args:
+            data: Bytes written to the terminal
+            keyframe: True if the output starts by clearing the screen
+        """
+        if self._thread is not None:
+            elapsed = time.monotonic() - self._start
+            self._queue.put((elapsed, "o", data.decode(errors="replace"), keyframe))
+
+    def resize(self, width: int, height: int) -> None:
+        """Queue a terminal resize.
+
+        Args:
+            width: New width in cells
+            height: New height in cells
+        """
+        if self._thread is not None:
+            elapsed = time.monotonic() - self._start
+            self._queue.put((elapsed, "r", f"{width}x{height}", False))
+
+    def file_path(self, index: int) -> str:
+        """Get the path of a recording file.
+
+        Args:
+            index: File number (0 is the path given to the recorder)
+
+        Returns:
+            Path with the file number inserted before the extension
+        """
+        if index == 0:
+            return self.path
+        base, ext = self.path, ""
+        if base.endswith(".gz"):
+            base, ext = base[:-3], ".gz"
+        base, cast_ext = os.path.splitext(base)
+        return f"{base}.{index}{cast_ext}{ext}"
+
+    def _open(self, elapsed: float) -> io.BufferedIOBase:
+        """Start the next recording file.
+
+        Args:
+            elapsed: Timestamp of the first event in the file
+
+        Returns:
+            Stream to write events to
+        """
+        path = self.file_path(self.files)
+        self.files += 1
+        # Stays open across writes; _close() closes it on rotation or when the thread stops
+        raw = open(path, "wb")  # noqa: SIM115
+        out: io.BufferedIOBase = gzip.GzipFile(fileobj=raw, mode="wb") \
+            if path.endswith(".gz") else raw
+        self._raw = raw
+        self._out = out
+        self._offset = elapsed
+        self._keyframe_requested = False
+        header = {
+            "version": 2,
+            "width": self.width,
+            "height": self.height,
+            "timestamp": int(time.time()),
+            "env": {"TERM": os.environ.get("TERM", "")},
+        }
+        out.write(json.dumps(header).encode() + b"\n")
+        return out
+
+    def _close(self) -> None:
+        """Close the current recording file."""
+        if self._out is not None and self._out is not self._raw:
+            self._out.close()
+        if self._raw is not None:
+            self._raw.close()
+        self._raw = None
+        self._out = None
+
+    def _write(self, event: Event) -> None:
+        """Append one event, rotating to a new file at a keyframe once full.
+
+        Args:
+            event: Queued event
+        """
+        elapsed, kind, data, keyframe = event
+        if kind == "r":
+            self.width, self.height = (int(n) for n in data.split("x"))
+        if self._raw is not None and self.max_bytes and self._raw.tell() >= self.max_bytes:
+            if keyframe:
+                self._close()
+            elif not self._keyframe_requested:
+                self._keyframe_requested = True
+                self.keyframe_wanted = True
+        out = self._out if self._out is not None else self._open(elapsed)
+        line: Any = [round(elapsed - self._offset, 6), kind, data]
+        out.write(json.dumps(line).encode() + b"\n")
+
+    def _run(self) -> None:
+        """Recorder thread main loop."""
+        try:
+            while True:
+                event = self._queue.get()
+                if event is None:
+                    break
+                if self.error is None:
+                    try:
+                        self._write(event)
+                    except (IOError, OSError) as exc:
+                        self.error = exc  # Keep playing without the recording
+        finally:
+            try:
+                self._close()
+            except (IOError, OSError) as exc:
+                self.error = exc
@@ -0,0 +1,117 @@
+"""Precompiled sprite cache."""
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple, Union
+
+from .framebuffer import Cell, text_cells
+from .sprites import SPRITE_FRAMES
+from ..config import SPRITE_CACHE_SIZE
+
+SpriteKey = Tuple[str, int, Optional[str]]
+
+# Key of a text run drawn by a draw list: (text, style)
+RunKey = Tuple[str, Optional[str]]
+
+
+class CompiledSprite(NamedTuple):
+    """Sprite frame converted to framebuffer cells in a single style."""
+
+    rows: Tuple[Tuple[Cell, ...], ...]
+    width: int
+    height: int
+
+
+def compile_sprite(lines: list[str], style: Optional[str]) -> CompiledSprite:
+    """Convert sprite lines to rows of styled cells.
+
+    Args:
+        lines: Sprite lines
+        style: Color name, or None
+
+    Returns:
+        CompiledSprite ready to blit into a framebuffer
+    """
+    rows = tuple(tuple(text_cells(line, style)) for line in lines)
+    width = max((len(row) for row in rows), default=0)
+    return CompiledSprite(rows, width, len(rows))
+
+
+CacheEntry = Union[CompiledSprite, Tuple[Cell, ...]]
+
+
+class SpriteCache:
+    """LRU cache of compiled sprites and draw-list text runs.
+
+    Sprites are keyed by (sprite id, frame, style) and runs by (text,
+    style). Color modes that cycle styles and changing HUD text keep
+    producing new keys, so the cache is bounded and drops the least
+    recently used entries.
+    """
+
+    def __init__(self, maxsize: int = SPRITE_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of compiled sprites and runs to keep
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Union[SpriteKey, RunKey], CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached sprites and runs."""
+        return len(self._entries)
+
+    def get(self, sprite_id: str, frame: int, style: Optional[str]) -> CompiledSprite:
+        """Get a compiled sprite, compiling it on first use.
+
+        Args:
+            sprite_id: Key in SPRITE_FRAMES
+            frame: Animation frame index
+            style: Color name, or None
+
+        Returns:
+            CompiledSprite for the requested frame and style
+        """
+        key = (sprite_id, frame, style)
+        entries = self._entries
+        compiled = entries.get(key)
+        if isinstance(compiled, CompiledSprite):
+            entries.move_to_end(key)
+            self.hits += 1
+            return compiled
+
+        self.misses += 1
+        compiled = compile_sprite(SPRITE_FRAMES[sprite_id][frame], style)
+        entries[key] = compiled
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return compiled
+
+    def run(self, text: str, style: Optional[str] = None) -> Tuple[Cell, ...]:
+        """Get the cells of a draw-list text run, converting it on first use.
+
+        Args:
+            text: Text (wide characters take two cells)
+            style: Color name, or None
+
+        Returns:
+            Cells of the run
+        """
+        key = (text, style)
+        entries = self._entries
+        cells = entries.get(key)
+        if cells is not None and not isinstance(cells, CompiledSprite):
+            entries.move_to_end(key)
+            self.hits += 1
+            return cells
+
+        self.misses += 1
+        cells = entries[key] = tuple(text_cells(text, style))
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return cells
+
+    def clear(self) -> None:
+        """Drop all compiled sprites and runs."""
+        self._entries.clear()
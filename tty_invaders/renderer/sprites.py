@@ -1,5 +1,7 @@
 """ASCII sprites for game entities."""
-from typing import List
+from typing import Dict, List, Optional
+
+from .framebuffer import DrawCommand
 
 # Player sprite
 PLAYER_SPRITE = [
@@ -75,10 +77,48 @@ EXPLOSION_FRAMES = [
     ["   "],
 ]
 
+# Mystery ship sprite
+MYSTERY_SHIP_SPRITE = [
+    " <-O-> "
+]
+
 # Simple bullet sprites (single char)
 BULLET_PLAYER = "|"
 BULLET_ALIEN = "!"
 
+# Animation frames for each sprite id (used by the sprite cache)
+SPRITE_FRAMES: Dict[str, List[List[str]]] = {
+    "player": [PLAYER_SPRITE],
+    "alien_top": [ALIEN_SPRITE_TOP, ALIEN_SPRITE_TOP_ALT],
+    "alien_mid": [ALIEN_SPRITE_MID, ALIEN_SPRITE_MID_ALT],
+    "alien_bot": [ALIEN_SPRITE_BOT, ALIEN_SPRITE_BOT_ALT],
+    "shield": [
+        SHIELD_SPRITE,
+        SHIELD_SPRITE_DAMAGED_1,
+        SHIELD_SPRITE_DAMAGED_2,
+        SHIELD_SPRITE_DAMAGED_3,
+    ],
+    "explosion": EXPLOSION_FRAMES,
+    "mystery_ship": [MYSTERY_SHIP_SPRITE],
+}
+
+
+def get_alien_sprite_id(row: int) -> str:
+    """Get alien sprite id based on row position.
+
+    Args:
+        row: Row number (0-indexed from top)
+
+    Returns:
+        Sprite id in SPRITE_FRAMES
+    """
+    if row == 0:
+        return "alien_top"
+    elif row <= 2:
+        return "alien_mid"
+    else:
+        return "alien_bot"
+
 
 def get_alien_sprite(row: int, animated: bool = False) -> List[str]:
     """Get alien sprite based on row position.
@@ -90,12 +130,7 @@ def get_alien_sprite(row: int, animated: bool = False) -> List[str]:
     Returns:
         List of sprite lines
     """
-    if row == 0:
-        return ALIEN_SPRITE_TOP_ALT if animated else ALIEN_SPRITE_TOP
-    elif row <= 2:
-        return ALIEN_SPRITE_MID_ALT if animated else ALIEN_SPRITE_MID
-    else:
-        return ALIEN_SPRITE_BOT_ALT if animated else ALIEN_SPRITE_BOT
+    return SPRITE_FRAMES[get_alien_sprite_id(row)][int(animated)]
 
 
 def get_shield_sprite(health_percent: float) -> List[str]:
@@ -107,14 +142,26 @@ def get_shield_sprite(health_percent: float) -> List[str]:
     Returns:
         List of sprite lines
     """
+    return SPRITE_FRAMES["shield"][get_shield_frame(health_percent)]
+
+
+def get_shield_frame(health_percent: float) -> int:
+    """Get shield damage frame based on health percentage.
+
+    Args:
+        health_percent: Health as percentage (0.0 - 1.0)
+
+    Returns:
+        Frame index in SPRITE_FRAMES["shield"]
+    """
     if health_percent > 0.75:
-        return SHIELD_SPRITE
+        return 0
     elif health_percent > 0.5:
-        return SHIELD_SPRITE_DAMAGED_1
+        return 1
     elif health_percent > 0.25:
-        return SHIELD_SPRITE_DAMAGED_2
+        return 2
     else:
-        return SHIELD_SPRITE_DAMAGED_3
+        return 3
 
 
 def get_sprite_width(sprite: List[str]) -> int:
@@ -139,3 +186,20 @@ def get_sprite_height(sprite: List[str]) -> int:
         Number of lines in sprite
     """
     return len(sprite)
+
+
+def sprite_commands(x: int, y: int, sprite_id: str, frame: int,
+                    color: Optional[str] = None) -> List[DrawCommand]:
+    """Get the draw-list entries for a sprite frame.
+
+    Args:
+        x: Column position (game coordinates)
+        y: Row position of the top line
+        sprite_id: Key in SPRITE_FRAMES
+        frame: Animation frame index
+        color: Optional color name
+
+    Returns:
+        One (x, y, text, color) entry per sprite line
+    """
+    return [(x, y + j, line, color) for j, line in enumerate(SPRITE_FRAMES[sprite_id][frame])]
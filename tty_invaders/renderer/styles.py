@@ -0,0 +1,168 @@
+"""Resolved escape sequences for color names."""
+import re
+from typing import Any, Dict, Optional, Tuple
+
+# (terminal kind, number of colors, does styling) -> registry
+_REGISTRIES: Dict[Tuple[Any, ...], "StyleRegistry"] = {}
+
+# SGR sequences that only set a foreground color and can replace each other
+_FOREGROUND_ONLY = re.compile(r"\x1b\[(?:3[0-7]|9[0-7]|38;5;\d+|38;2;\d+;\d+;\d+)m")
+
+
+class StyleRegistry:
+    """Resolves color names to raw SGR prefix/suffix strings once.
+
+    blessed builds a formatter and wraps text on every call; the registry
+    looks each name up once per terminal capability set so writing styled
+    text is just string concatenation.
+    """
+
+    def __init__(self, term: Any) -> None:
+        """Initialize the registry.
+
+        Args:
+            term: blessed Terminal used to resolve names
+        """
+        self.term = term
+        self.normal: str = term.normal
+        self._styles: Dict[Optional[str], Tuple[str, str]] = {None: ("", "")}
+        self._formatters: Dict[str, Any] = {}
+        self._plain: Dict[Optional[str], bool] = {None: True}
+        self._transitions: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        self._encoded: Dict[Tuple[Optional[str], Optional[str]], bytes] = {}
+
+    @classmethod
+    def for_terminal(cls, term: Any) -> "StyleRegistry":
+        """Get the shared registry for a terminal's capability set.
+
+        Args:
+            term: blessed Terminal
+
+        Returns:
+            StyleRegistry for terminals with the same capabilities
+        """
+        key = (term.kind, term.number_of_colors, term.does_styling)
+        registry = _REGISTRIES.get(key)
+        if registry is None:
+            registry = _REGISTRIES[key] = cls(term)
+        return registry
+
+    def resolve(self, name: Optional[str]) -> Tuple[str, str]:
+        """Get the escape sequences that start and end a style.
+
+        Args:
+            name: Color name (blessed color), or None for no style
+
+        Returns:
+            Tuple of (prefix, suffix); both empty for unknown names
+        """
+        try:
+            return self._styles[name]
+        except KeyError:
+            pass
+
+        prefix = str(self.formatter(name)) if name else ""
+        style = (prefix, self.normal if prefix else "")
+        self._styles[name] = style
+        return style
+
+    def formatter(self, name: str) -> Any:
+        """Get the blessed formatter for a color name.
+
+        Args:
+            name: Color name
+
+        Returns:
+            Blessed formatter, or term.normal for unknown names
+        """
+        try:
+            return self._formatters[name]
+        except KeyError:
+            pass
+
+        try:
+            fmt = getattr(self.term, name)
+        except AttributeError:
+            fmt = self.term.normal
+        self._formatters[name] = fmt
+        return fmt
+
+    def wrap(self, text: str, name: Optional[str]) -> str:
+        """Wrap text in a style.
+
+        Args:
+            text: Text to wrap
+            name: Color name, or None
+
+        Returns:
+            Styled text
+        """
+        prefix, suffix = self.resolve(name)
+        return prefix + text + suffix
+
+    def is_plain(self, name: Optional[str]) -> bool:
+        """Check whether a style only sets the foreground color.
+
+        A blank cell looks the same in any plain style, and one plain style
+        can replace another without a reset.
+
+        Args:
+            name: Color name, or None
+
+        Returns:
+            True if the style has no attributes besides a foreground color
+        """
+        try:
+            return self._plain[name]
+        except KeyError:
+            prefix = self.resolve(name)[0]
+            plain = not prefix or _FOREGROUND_ONLY.fullmatch(prefix) is not None
+            self._plain[name] = plain
+            return plain
+
+    def transition(self, current: Optional[str], new: Optional[str]) -> str:
+        """Get the shortest sequence that switches from one style to another.
+
+        Args:
+            current: Style currently active on the terminal
+            new: Style to switch to
+
+        Returns:
+            Escape sequence (empty if nothing needs to change)
+        """
+        key = (current, new)
+        try:
+            return self._transitions[key]
+        except KeyError:
+            pass
+
+        current_prefix = self.resolve(current)[0]
+        new_prefix = self.resolve(new)[0]
+        if current_prefix == new_prefix:
+            seq = ""
+        elif not current_prefix:
+            seq = new_prefix
+        elif not new_prefix:
+            seq = self.normal
+        elif self.is_plain(current) and self.is_plain(new):
+            seq = new_prefix
+        else:
+            seq = self.normal + new_prefix
+        self._transitions[key] = seq
+        return seq
+
+    def encoded_transition(self, current: Optional[str], new: Optional[str]) -> bytes:
+        """Get transition() pre-encoded as UTF-8.
+
+        Args:
+            current: Style currently active on the terminal
+            new: Style to switch to
+
+        Returns:
+            Encoded escape sequence (empty if nothing needs to change)
+        """
+        try:
+            return self._encoded[(current, new)]
+        except KeyError:
+            seq = self._encoded[(current, new)] = self.transition(current, new).encode()
+            return seq
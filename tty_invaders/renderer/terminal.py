@@ -1,17 +1,414 @@
 """Terminal wrapper using blessed for cross-platform terminal control."""
-from typing import Any, Optional
+import io
+import os
+import select
+import signal
+import sys
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from blessed import Terminal as BlessedTerminal
 
-from ..config import MIN_TERMINAL_WIDTH, MIN_TERMINAL_HEIGHT
+from .compositor import LAYER_PLAYFIELD, Compositor, Layer
+from .framebuffer import Cell, DrawCommand, FrameBuffer
+from .output import Frame, FrameWriter
+from .recorder import AsciicastRecorder
+from .sprite_cache import SpriteCache
+from .styles import StyleRegistry
+from .translation import apply_scroll, apply_shift, plan_scroll, plan_shift
+from ..config import (
+    GAME_WIDTH, MIN_TERMINAL_WIDTH, MIN_TERMINAL_HEIGHT, THREADED_OUTPUT, SYNC_PROBE_TIMEOUT,
+    SCROLL_ACCELERATION
+)
+from ..utils.capabilities import (
+    DA1_QUERY, CapabilityCache, decrqm_query, split_probe_reply, terminal_identity
+)
 
+# Synchronized output (DEC private mode 2026): the terminal holds repaints
+# between begin and end so a frame is never shown half drawn
+SYNC_OUTPUT_MODE = 2026
+SYNC_BEGIN = b"\x1b[?2026h"
+SYNC_END = b"\x1b[?2026l"
 
-class Terminal:
-    """Wrapper around blessed Terminal with game-specific functionality."""
 
-    def __init__(self) -> None:
-        """Initialize the terminal."""
-        self.term = BlessedTerminal()
-        self._buffer: list[str] = []
+class CursorPlanner:
+    """Tracks the terminal cursor and picks the shortest move to each span.
+
+    Candidates are an absolute CUP (precomputed for the whole grid), CR
+    plus a forward move, relative CUU/CUD/CUB/CUF moves, and rewriting the
+    unchanged cells in between when they already have the active style.
+    The position is unknown after a clear, a resize, or a write that
+    reaches the right margin (terminals differ on the pending wrap).
+    """
+
+    def __init__(self, absolute: Callable[[int, int], str],
+                 relative: Callable[[str, int], str]) -> None:
+        """Initialize the planner.
+
+        Args:
+            absolute: Builds the absolute move to (x, y)
+            relative: Builds a relative move ("up", "down", "left", "right", "cr") by n
+        """
+        self._absolute = absolute
+        self._relative = relative
+        self._cup: List[List[Optional[bytes]]] = []
+        self._rel: Dict[Tuple[str, int], bytes] = {}
+        self.width = 0
+        self.height = 0
+        self.x: Optional[int] = None
+        self.y = 0
+
+        # Counters
+        self.moves = 0
+        self.absolute_moves = 0
+
+    def resize(self, width: int, height: int) -> None:
+        """Precompute absolute moves for a new grid size.
+
+        terminfo expansion is slow, so the table is generated from the
+        standard CUP format when the terminal uses it, and otherwise filled
+        in as cells are first visited.
+
+        Args:
+            width: Grid width in cells
+            height: Grid height in cells
+        """
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            absolute = self._absolute
+            if absolute(0, 0) == "\x1b[1;1H" and absolute(7, 3) == "\x1b[4;8H":
+                self._cup = [[f"\x1b[{y + 1};{x + 1}H".encode() for x in range(width)]
+                             for y in range(height)]
+            else:
+                self._cup = [[None] * width for _ in range(height)]
+        self.x = None
+
+    def forget(self) -> None:
+        """Mark the cursor position as unknown."""
+        self.x = None
+
+    def advance(self, n: int) -> None:
+        """Account for n cells written at the cursor.
+
+        Args:
+            n: Number of cells written
+        """
+        if self.x is not None:
+            self.x += n
+            if self.x >= self.width:
+                self.x = None
+
+    def _rel_bytes(self, kind: str, n: int) -> bytes:
+        """Get a cached relative move.
+
+        Args:
+            kind: Move kind
+            n: Distance in cells
+
+        Returns:
+            Encoded sequence
+        """
+        try:
+            return self._rel[(kind, n)]
+        except KeyError:
+            seq = self._rel[(kind, n)] = self._relative(kind, n).encode()
+            return seq
+
+    def move(self, x: int, y: int, row: Sequence[Cell], current: Optional[str],
+             is_plain: Callable[[Optional[str]], bool],
+             glyph_bytes: Dict[str, bytes]) -> bytes:
+        """Get the shortest sequence that moves the cursor to (x, y).
+
+        Args:
+            x: Target column
+            y: Target row
+            row: Cells of the target row as they will be on screen
+            current: Style active on the terminal
+            is_plain: Style registry's is_plain
+            glyph_bytes: Encoded glyph cache
+
+        Returns:
+            Encoded move (empty if the cursor is already there)
+        """
+        self.moves += 1
+        cx, cy = self.x, self.y
+        self.x, self.y = x, y
+        best = self._cup[y][x]
+        if best is None:
+            best = self._cup[y][x] = self._absolute(x, y).encode()
+        if cx is None:
+            self.absolute_moves += 1
+            return best
+
+        if cy == y and cx == x:
+            return b""
+
+        vertical = b""
+        if cy > y:
+            vertical = self._rel_bytes("up", cy - y)
+        elif cy < y:
+            vertical = self._rel_bytes("down", y - cy)
+
+        if x > cx:
+            seq = vertical + self._rel_bytes("right", x - cx)
+            if cy == y and x - cx < len(seq) and x - cx < len(best):
+                seq = self._overwrite(row, cx, x, current, is_plain, glyph_bytes, seq)
+        else:
+            seq = vertical
+            if x < cx:
+                seq += self._rel_bytes("left", cx - x)
+                via_cr = self._rel_bytes("cr", 1) + vertical
+                if x:
+                    via_cr += self._rel_bytes("right", x)
+                if len(via_cr) < len(seq):
+                    seq = via_cr
+
+        if len(seq) < len(best):
+            return seq
+        self.absolute_moves += 1
+        return best
+
+    @staticmethod
+    def _overwrite(row: Sequence[Cell], start: int, end: int, current: Optional[str],
+                   is_plain: Callable[[Optional[str]], bool],
+                   glyph_bytes: Dict[str, bytes], limit: bytes) -> bytes:
+        """Rewrite unchanged cells instead of moving over them.
+
+        Args:
+            row: Cells of the row
+            start: Cursor column
+            end: Target column
+            current: Style active on the terminal
+            is_plain: Style registry's is_plain
+            glyph_bytes: Encoded glyph cache
+            limit: Cheapest move found so far
+
+        Returns:
+            The rewritten cells if shorter and possible without a style change,
+            otherwise limit
+        """
+        data = b""
+        for glyph, style in row[start:end]:
+            if style != current and not (glyph == " " and is_plain(style) and is_plain(current)):
+                return limit
+            encoded = glyph_bytes.get(glyph)
+            if encoded is None:
+                encoded = glyph_bytes[glyph] = glyph.encode()
+            data += encoded
+            if len(data) >= len(limit):
+                return limit
+        return data
+
+
+class TerminalBackend(ABC):
+    """Drawing surface shared by all terminal backends.
+
+    Drawing calls go into the back grid of a FrameBuffer; flush() only sends
+    the cells that changed since the previous frame. Subclasses provide the
+    device: its size, cursor-move sequences, byte output and keyboard input.
+    """
+
+    # Frames are paced to wall-clock time by the game loop
+    realtime = True
+
+    def __init__(self, styles: StyleRegistry, width: int, height: int, clear_seq: str) -> None:
+        """Initialize the backend.
+
+        Args:
+            styles: Style registry for the device
+            width: Initial width in cells
+            height: Initial height in cells
+            clear_seq: Sequence that resets attributes and clears the screen
+        """
+        self.styles = styles
+        self._width = width
+        self._height = height
+        self._x_offset = self._centered_offset(width)
+        self._resize_pending = False
+        self.sprites = SpriteCache()
+        self.framebuffer = FrameBuffer(width, height, self.sprites.run)
+        self._clip_to_game()
+        self.compositor = Compositor(self.sprites)
+        self.writer = FrameWriter(self._write_frame)
+        self.threaded_output = THREADED_OUTPUT
+        self.recorder: Optional[AsciicastRecorder] = None
+
+        # Bytes output path: everything the encoder emits is pre-encoded
+        self._arena = bytearray()
+        self._glyph_bytes: Dict[str, bytes] = {}
+        self.cursor = CursorPlanner(self._move_sequence, self._relative_sequence)
+        self._clear_bytes = clear_seq.encode()
+        self.sync_output = False
+        self._clear_pending = True
+        self._frame_open = False
+
+        # Block moves (scroll regions, insert/delete line and character)
+        self.scroll_acceleration = SCROLL_ACCELERATION
+        self._edit_bytes: Dict[Tuple[Any, ...], bytes] = {}
+
+        # Output counters
+        self.frames_written = 0
+        self.cells_written = 0
+        self.bytes_written = 0
+        self.scrolls = 0
+        self.shifts = 0
+
+    @property
+    def width(self) -> int:
+        """Get terminal width (cached until the next resize)."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Get terminal height (cached until the next resize)."""
+        return self._height
+
+    @abstractmethod
+    def _query_size(self) -> Tuple[int, int]:
+        """Ask the device for its current size.
+
+        Returns:
+            Tuple of (width, height)
+        """
+
+    @staticmethod
+    def _centered_offset(width: int) -> int:
+        """Calculate the offset that centers the game area.
+
+        Args:
+            width: Terminal width
+
+        Returns:
+            Horizontal offset in characters
+        """
+        if width > GAME_WIDTH:
+            return (width - GAME_WIDTH) // 2
+        return 0
+
+    def poll_resize(self, force: bool = False) -> bool:
+        """Refresh the cached geometry if the terminal reported a resize.
+
+        Args:
+            force: Query the size even without a resize notification
+
+        Returns:
+            True if the size changed
+        """
+        if not (self._resize_pending or force):
+            return False
+        self._resize_pending = False
+        width, height = self._query_size()
+        if (width, height) == (self._width, self._height):
+            return False
+        self._width = width
+        self._height = height
+        self._x_offset = self._centered_offset(width)
+        return True
+
+    def watch_resize(self) -> Any:
+        """Return context manager that listens for resize notifications."""
+        return nullcontext()
+
+    def wait_for_input(self, timeout: Optional[float] = None) -> bool:
+        """Block until a key is available, the terminal resizes, or timeout.
+
+        Devices without a keyboard return immediately.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a key may be available
+        """
+        return True
+
+    @abstractmethod
+    def inkey(self, timeout: float = 0) -> Any:
+        """Read a keystroke with optional timeout.
+
+        Args:
+            timeout: Timeout in seconds (0 for non-blocking)
+
+        Returns:
+            Keystroke object or empty string if no input
+        """
+
+    @abstractmethod
+    def _move_sequence(self, x: int, y: int) -> str:
+        """Get the sequence that moves the cursor to an absolute position.
+
+        Args:
+            x: Column position (0-indexed)
+            y: Row position (0-indexed)
+
+        Returns:
+            Cursor movement sequence
+        """
+
+    def _relative_sequence(self, kind: str, n: int) -> str:
+        """Get a relative cursor move (ECMA-48 sequences by default).
+
+        Args:
+            kind: "up", "down", "left", "right", or "cr" (to column 0)
+            n: Distance in cells (ignored for "cr")
+
+        Returns:
+            Cursor movement sequence
+        """
+        if kind == "cr":
+            return "\r"
+        if kind == "left" and n == 1:
+            return "\b"
+        final = {"up": "A", "down": "B", "right": "C", "left": "D"}[kind]
+        return f"\x1b[{n}{final}" if n > 1 else f"\x1b[{final}"
+
+    def _edit_sequence(self, kind: str, *params: int) -> Optional[str]:
+        """Get a scroll-region or insert/delete sequence (ECMA-48 by default).
+
+        Args:
+            kind: "region" (top, bottom), "reset_region" (height),
+                "insert_lines", "delete_lines", "insert_chars" or
+                "delete_chars" (count)
+            params: Sequence parameters (0-indexed rows)
+
+        Returns:
+            Escape sequence, or None if the device lacks the capability
+        """
+        if kind == "region":
+            return f"\x1b[{params[0] + 1};{params[1] + 1}r"
+        if kind == "reset_region":
+            return "\x1b[r"
+        final = {"insert_lines": "L", "delete_lines": "M",
+                 "insert_chars": "@", "delete_chars": "P"}[kind]
+        return f"\x1b[{params[0]}{final}"
+
+    def _edit(self, kind: str, *params: int) -> bytes:
+        """Get a cached, encoded edit sequence.
+
+        Args:
+            kind: Sequence kind (see _edit_sequence)
+            params: Sequence parameters
+
+        Returns:
+            Encoded sequence, or b"" if unsupported
+        """
+        key = (kind,) + params
+        try:
+            return self._edit_bytes[key]
+        except KeyError:
+            seq = self._edit_sequence(kind, *params)
+            data = self._edit_bytes[key] = seq.encode() if seq else b""
+            return data
+
+    @abstractmethod
+    def _write_bytes(self, data: memoryview) -> None:
+        """Send encoded output to the device.
+
+        Args:
+            data: Encoded output
+        """
 
     @property
     def x_offset(self) -> int:
@@ -20,10 +417,7 @@ class Terminal:
         Returns:
             Horizontal offset in characters to center the game area
         """
-        from ..config import GAME_WIDTH
-        if self.term.width > GAME_WIDTH:
-            return (self.term.width - GAME_WIDTH) // 2
-        return 0
+        return self._x_offset
 
     def check_size(self) -> tuple[bool, str]:
         """Check if terminal meets minimum size requirements.
@@ -31,16 +425,62 @@ class Terminal:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if self.term.width < MIN_TERMINAL_WIDTH or self.term.height < MIN_TERMINAL_HEIGHT:
+        if self.width < MIN_TERMINAL_WIDTH or self.height < MIN_TERMINAL_HEIGHT:
             return False, (
                 f"Terminal too small! Need {MIN_TERMINAL_WIDTH}x{MIN_TERMINAL_HEIGHT}, "
-                f"got {self.term.width}x{self.term.height}"
+                f"got {self.width}x{self.height}"
             )
         return True, ""
 
     def clear(self) -> None:
-        """Clear the entire screen."""
-        self._buffer.append(self.term.clear)
+        """Start a new frame.
+
+        Nothing is sent to the terminal; the physical screen is only cleared
+        on resize or after invalidate(). The back grid is reset to the cached
+        background layers just before the first immediate draw, so layers
+        updated earlier in the same frame are already included.
+        """
+        width, height = self._width, self._height
+        fb = self.framebuffer
+        if width != fb.width or height != fb.height:
+            fb.resize(width, height)
+            self._clip_to_game()
+            self._clear_pending = True
+            if self.recorder is not None:
+                self.recorder.resize(width, height)
+        self.compositor.discard()
+        self._frame_open = False
+
+    def _clip_to_game(self) -> None:
+        """Limit drawing to the centered game area of the screen."""
+        self.framebuffer.set_clip(self._x_offset, self._x_offset + GAME_WIDTH)
+
+    def _open_frame(self) -> None:
+        """Reset the back grid to the composed background layers."""
+        self.compositor.compose_base(self.framebuffer, self.x_offset)
+        self._frame_open = True
+
+    def _prepare_draw(self) -> None:
+        """Open the frame and settle queued draw lists before drawing over them."""
+        if not self._frame_open:
+            self._open_frame()
+        if self.compositor.submitted:
+            self.compositor.resolve(self.framebuffer, self.x_offset)
+
+    def layer(self, name: str) -> Layer:
+        """Get a cached compositor layer.
+
+        Args:
+            name: Layer name ("background" or "hud")
+
+        Returns:
+            Layer instance
+        """
+        return self.compositor.layer(name)
+
+    def invalidate(self) -> None:
+        """Force a full screen clear and repaint on the next flush."""
+        self._clear_pending = True
 
     def move(self, x: int, y: int) -> None:
         """Move cursor to position.
@@ -49,7 +489,8 @@ class Terminal:
             x: Column position (0-indexed)
             y: Row position (0-indexed)
         """
-        self._buffer.append(self.term.move_xy(x, y))
+        self._prepare_draw()
+        self.framebuffer.move(x, y)
 
     def write(self, text: str, color: Optional[str] = None) -> None:
         """Write text at current cursor position.
@@ -58,11 +499,8 @@ class Terminal:
             text: Text to write
             color: Optional color name (blessed color)
         """
-        if color:
-            colored_text = getattr(self.term, color)(text)
-            self._buffer.append(colored_text)
-        else:
-            self._buffer.append(text)
+        self._prepare_draw()
+        self.framebuffer.write(text, color)
 
     def write_at(self, x: int, y: int, text: str, color: Optional[str] = None) -> None:
         """Write text at specific position, automatically centered.
@@ -73,15 +511,415 @@ class Terminal:
             text: Text to write
             color: Optional color name
         """
-        adjusted_x = x + self.x_offset
-        self.move(adjusted_x, y)
-        self.write(text, color)
+        self._prepare_draw()
+        self.framebuffer.put(x + self.x_offset, y, text, color)
+
+    def draw(self, commands: Iterable[DrawCommand]) -> None:
+        """Draw a list of text runs, automatically centered.
+
+        Equivalent to calling write_at() for each entry in order, without
+        the per-call overhead.
+
+        Args:
+            commands: (x, y, text, color) entries in game coordinates
+        """
+        self._prepare_draw()
+        self.framebuffer.draw(commands, self.x_offset)
+
+    def submit(self, commands: Sequence[DrawCommand], z: int = LAYER_PLAYFIELD) -> None:
+        """Queue a draw list at a z-order for this frame.
+
+        Queued lists are resolved top-down by the compositor at flush (or
+        before the next immediate draw, which lands on top of them), so
+        cells hidden by higher lists or the HUD are never written.
+
+        Args:
+            commands: (x, y, text, color) entries in game coordinates
+            z: Z-order (e.g. LAYER_PLAYFIELD or LAYER_EFFECTS)
+        """
+        if not self._frame_open:
+            self._open_frame()
+        self.compositor.submit(commands, z)
 
     def flush(self) -> None:
-        """Flush buffer to terminal."""
-        if self._buffer:
-            print("".join(self._buffer), end="", flush=True)
-            self._buffer.clear()
+        """Finish the frame and send changed cells to the terminal.
+
+        While the output stage is running the frame is handed to the writer
+        thread and this returns immediately; otherwise it is written inline.
+        """
+        fb = self.framebuffer
+        self._prepare_draw()
+        self.compositor.compose_overlay(fb, self.x_offset)
+        self._frame_open = False
+
+        recorder = self.recorder
+        if recorder is not None and recorder.keyframe_wanted:
+            # The recording is starting a new file; repaint so it plays on its own
+            recorder.keyframe_wanted = False
+            self._clear_pending = True
+
+        clear = self._clear_pending
+        self._clear_pending = False
+
+        writer = self.writer
+        if writer.error is not None:
+            error, writer.error = writer.error, None
+            raise error
+        if writer.running:
+            writer.submit(Frame(fb.snapshot(), clear))
+        else:
+            self._write_frame(Frame(fb.back, clear))
+
+    def _write_frame(self, frame: Frame) -> None:
+        """Encode a frame against the front grid and write it.
+
+        Adjacent cells that share a style form one run: an SGR change is only
+        emitted when the style actually changes, and the style is reset once
+        at the end of the frame instead of after every write. Glyphs, moves
+        and style changes are cached as UTF-8 bytes and appended to a reused
+        bytearray, so nothing is encoded per frame.
+
+        Args:
+            frame: Finished frame
+        """
+        arena = self._arena
+        del arena[:]
+        fb = self.framebuffer
+        styles = self.styles
+        is_plain = styles.is_plain
+        transition = styles.encoded_transition
+        glyph_bytes = self._glyph_bytes
+        cursor = self.cursor
+        current: Optional[str] = None
+        cells_written = 0
+
+        if self.sync_output:
+            arena += SYNC_BEGIN
+        start = len(arena)
+
+        width = len(frame.rows[0]) if frame.rows else 0
+        if (width, len(frame.rows)) != (cursor.width, cursor.height):
+            cursor.resize(width, len(frame.rows))
+        if frame.clear:
+            arena += self._clear_bytes
+            fb.reset_front(width, len(frame.rows))
+            cursor.forget()
+
+        rows = frame.rows
+        if self.scroll_acceleration and not frame.clear:
+            self._translate(rows, arena)
+
+        for y, x, cells in fb.diff(rows):
+            arena += cursor.move(x, y, rows[y], current, is_plain, glyph_bytes)
+            cursor.advance(len(cells))
+            cells_written += len(cells)
+            for glyph, style in cells:
+                if style != current:
+                    # A blank looks the same under any foreground color
+                    if not (glyph == " " and is_plain(style) and is_plain(current)):
+                        arena += transition(current, style)
+                        current = style
+                data = glyph_bytes.get(glyph)
+                if data is None:
+                    data = glyph_bytes[glyph] = glyph.encode()
+                arena += data
+
+        if current is not None:
+            arena += transition(current, None)
+
+        self.frames_written += 1
+        self.cells_written += cells_written
+        if len(arena) > start:
+            if self.sync_output:
+                arena += SYNC_END
+            self.bytes_written += len(arena)
+            recorder = self.recorder
+            if recorder is not None:
+                recorder.record(bytes(arena), frame.clear)
+            self._write_bytes(memoryview(arena))
+
+    def _translate(self, rows: List[List[Cell]], arena: bytearray) -> None:
+        """Move blocks that shifted rigidly since the last frame on the terminal.
+
+        A vertical move becomes a scroll region with insert/delete-line, a
+        horizontal one insert/delete-character on each row. The front grid
+        is updated to match, so the diff that follows only patches cells
+        that still differ. Skipped when the device lacks the sequences.
+
+        Args:
+            rows: Next frame
+            arena: Output buffer (no style may be active yet)
+        """
+        fb = self.framebuffer
+        front = fb.front
+        height = len(rows)
+        if not rows or len(front) != height or len(front[0]) != len(rows[0]):
+            return
+        width = len(rows[0])
+        cursor = self.cursor
+        is_plain = self.styles.is_plain
+        glyph_bytes = self._glyph_bytes
+        edit = self._edit
+
+        scroll = plan_scroll(front, rows)
+        if scroll is not None:
+            top, bottom, n = scroll
+            region = edit("region", top, bottom)
+            lines = edit("insert_lines" if n > 0 else "delete_lines", abs(n))
+            reset = edit("reset_region", height)
+            if region and lines and reset:
+                # Setting the region homes the cursor
+                cursor.forget()
+                arena += region
+                arena += cursor.move(0, top, front[top], None, is_plain, glyph_bytes)
+                arena += lines
+                arena += reset
+                cursor.forget()
+                apply_scroll(front, scroll)
+                self.scrolls += 1
+
+        insert = edit("insert_chars", 1)
+        delete = edit("delete_chars", 1)
+        if not (insert and delete):
+            return
+        for y in range(height):
+            shift = plan_shift(y, front[y], rows[y])
+            if shift is None:
+                continue
+            _, start, end, n = shift
+            row = front[y]
+            if n > 0:
+                # Close the gap after the block, then open one before it
+                if end + n < width - 1:
+                    arena += cursor.move(end + 1, y, row, None, is_plain, glyph_bytes)
+                    arena += edit("delete_chars", n)
+                arena += cursor.move(start, y, row, None, is_plain, glyph_bytes)
+                arena += edit("insert_chars", n)
+            else:
+                arena += cursor.move(start + n, y, row, None, is_plain, glyph_bytes)
+                arena += edit("delete_chars", -n)
+                if end < width - 1:
+                    arena += cursor.move(end + n + 1, y, row, None, is_plain, glyph_bytes)
+                    arena += edit("insert_chars", -n)
+            apply_shift(row, shift)
+            self.shifts += 1
+
+    def probe_synchronized_output(self, cache: Optional[CapabilityCache] = None) -> bool:
+        """Detect synchronized-output support and enable frame bracketing.
+
+        Args:
+            cache: Capability cache
+
+        Returns:
+            True if frames will be wrapped in synchronized updates
+        """
+        return self.sync_output
+
+    @contextmanager
+    def output_stage(self) -> Iterator[FrameWriter]:
+        """Run the background writer thread for the duration of the block.
+
+        Yields:
+            The running FrameWriter (for its counters)
+        """
+        if not self.threaded_output:
+            yield self.writer
+            return
+
+        self.writer.start()
+        try:
+            yield self.writer
+        finally:
+            self.writer.stop()
+
+    @contextmanager
+    def recording(self, path: str) -> Iterator[AsciicastRecorder]:
+        """Tee everything flushed to the terminal into an asciicast file.
+
+        Args:
+            path: Recording file ("*.gz" is compressed)
+
+        Yields:
+            The running AsciicastRecorder
+        """
+        recorder = AsciicastRecorder(path, self.width, self.height)
+        recorder.start()
+        self.recorder = recorder
+        self._clear_pending = True  # Start the recording from a full frame
+        try:
+            yield recorder
+        finally:
+            self.recorder = None
+            recorder.stop()
+
+    def fullscreen(self) -> Any:
+        """Return context manager for fullscreen mode."""
+        return nullcontext()
+
+    def cbreak(self) -> Any:
+        """Return context manager for cbreak mode (no line buffering)."""
+        return nullcontext()
+
+    def hidden_cursor(self) -> Any:
+        """Return context manager for hidden cursor."""
+        return nullcontext()
+
+
+class Terminal(TerminalBackend):
+    """Wrapper around blessed Terminal with game-specific functionality."""
+
+    def __init__(self) -> None:
+        """Initialize the terminal."""
+        self.term = BlessedTerminal()
+        super().__init__(StyleRegistry.for_terminal(self.term), self.term.width,
+                         self.term.height, self.term.normal + self.term.clear)
+        # Self-pipe that wakes wait_for_input() from the SIGWINCH handler
+        self._wake_fds: Optional[Tuple[int, int]] = None
+        try:
+            self._out_fd: Optional[int] = self.term.stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            self._out_fd = None
+
+    def _move_sequence(self, x: int, y: int) -> str:
+        """Get the terminfo cursor address sequence.
+
+        Args:
+            x: Column position (0-indexed)
+            y: Row position (0-indexed)
+
+        Returns:
+            Cursor movement sequence
+        """
+        return self.term.move_xy(x, y)
+
+    def _relative_sequence(self, kind: str, n: int) -> str:
+        """Get a relative cursor move from terminfo.
+
+        Args:
+            kind: "up", "down", "left", "right", or "cr" (to column 0)
+            n: Distance in cells (ignored for "cr")
+
+        Returns:
+            Cursor movement sequence
+        """
+        if kind == "cr":
+            return self.term.cr or super()._relative_sequence(kind, n)
+        formatter = getattr(self.term, f"move_{kind}")
+        # cud1 is usually a newline, which the tty may turn into CR LF
+        if n == 1 and kind != "down" and str(formatter):
+            return str(formatter)
+        return formatter(n) or super()._relative_sequence(kind, n)
+
+    def _edit_sequence(self, kind: str, *params: int) -> Optional[str]:
+        """Get a scroll-region or insert/delete sequence from terminfo.
+
+        Args:
+            kind: Sequence kind (see TerminalBackend._edit_sequence)
+            params: Sequence parameters (0-indexed rows)
+
+        Returns:
+            Escape sequence, or None if the terminal lacks the capability
+        """
+        # blessed types capability parameters as str, but tparm() needs ints
+        csr: Callable[..., str] = self.term.csr
+        if kind == "region":
+            return csr(*params) or None
+        if kind == "reset_region":
+            return csr(0, params[0] - 1) or None
+        capname = {"insert_lines": "il", "delete_lines": "dl",
+                   "insert_chars": "ich", "delete_chars": "dch"}[kind]
+        return getattr(self.term, capname)(*params) or None
+
+    def _write_bytes(self, data: memoryview) -> None:
+        """Write bytes to the terminal with os.write, handling partial writes.
+
+        Args:
+            data: Encoded output
+        """
+        fd = self._out_fd
+        if fd is None:
+            # Stream without a file descriptor (e.g. captured output)
+            self.term.stream.write(data.tobytes().decode())
+            self.term.stream.flush()
+            return
+
+        while data:
+            try:
+                written = os.write(fd, data)
+            except BlockingIOError:
+                select.select([], [fd], [])
+                continue
+            data = data[written:]
+
+    def probe_synchronized_output(self, cache: Optional[CapabilityCache] = None) -> bool:
+        """Detect synchronized-output support and enable frame bracketing.
+
+        The result is cached per terminal identity, so only the first launch
+        in a given terminal pays for the round-trip. A probe that gets no
+        reply in time is not cached, so the next launch probes again. Must
+        be called in cbreak mode, before the first frame is flushed.
+
+        Args:
+            cache: Capability cache (defaults to the cache file)
+
+        Returns:
+            True if frames will be wrapped in synchronized updates
+        """
+        cache = cache if cache is not None else CapabilityCache()
+        identity = terminal_identity()
+        supported = cache.get(identity, "synchronized_output")
+
+        if supported is None:
+            status = self._query_private_mode(SYNC_OUTPUT_MODE, SYNC_PROBE_TIMEOUT)
+            if status is None:
+                return self.sync_output  # Not a tty or no reply; don't cache
+            supported = status in (1, 2)
+            cache.set(identity, "synchronized_output", supported)
+            cache.save()
+
+        self.sync_output = bool(supported)
+        return self.sync_output
+
+    def _query_private_mode(self, mode: int, timeout: float) -> Optional[int]:
+        """Ask the terminal for the state of a DEC private mode (DECRQM).
+
+        A DA1 request follows the query as a sentinel: reading up to its
+        reply tells a terminal that ignores DECRQM from a slow one, and
+        consumes a DECRPM reply that arrives late instead of leaving it in
+        the keyboard input.
+
+        Args:
+            mode: DEC private mode number
+            timeout: Seconds to wait for the replies
+
+        Returns:
+            DECRPM status (0 if the mode is not recognized), or None if the
+            terminal did not reply in time
+        """
+        stdin = sys.__stdin__
+        if stdin is None or not self.term.is_a_tty or not stdin.isatty():
+            return None
+
+        fd = stdin.fileno()
+        self._write_bytes(memoryview(decrqm_query(mode) + DA1_QUERY))
+
+        data = leftover = b""
+        deadline = time.monotonic() + timeout
+        status = None
+        while status is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                break
+            chunk = os.read(fd, 64)
+            if not chunk:
+                break
+            data += chunk
+            status, leftover = split_probe_reply(data, mode)
+
+        # Keep any keys typed during the probe
+        if leftover:
+            self.term.ungetch(leftover.decode(errors="ignore"))
+        return status
 
     def inkey(self, timeout: float = 0) -> Any:
         """Read a keystroke with optional timeout.
@@ -114,15 +952,72 @@ class Terminal:
         """Return context manager for hidden cursor."""
         return self.term.hidden_cursor()
 
-    @property
-    def width(self) -> int:
-        """Get terminal width."""
-        return self.term.width
+    def _query_size(self) -> Tuple[int, int]:
+        """Ask the terminal for its current size.
 
-    @property
-    def height(self) -> int:
-        """Get terminal height."""
-        return self.term.height
+        Returns:
+            Tuple of (width, height)
+        """
+        size = self.term.width, self.term.height
+        if not hasattr(signal, "SIGWINCH"):
+            self._resize_pending = True  # Nothing will tell us; poll again
+        return size
+
+    @contextmanager
+    def watch_resize(self) -> Iterator[None]:
+        """Flag a resize from SIGWINCH for the next poll_resize().
+
+        Without SIGWINCH (e.g. on Windows) the size is queried on every poll.
+        """
+        if not hasattr(signal, "SIGWINCH"):
+            self._resize_pending = True
+            yield
+            return
+
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_w, False)
+        self._wake_fds = (wake_r, wake_w)
+
+        def on_resize(signum: int, frame: Any) -> None:
+            self._resize_pending = True
+            try:
+                os.write(wake_w, b"\0")
+            except OSError:
+                pass  # Pipe full; a wakeup is already pending
+
+        previous = signal.signal(signal.SIGWINCH, on_resize)
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGWINCH, previous)
+            self._wake_fds = None
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def wait_for_input(self, timeout: Optional[float] = None) -> bool:
+        """Block until a key is available, the terminal resizes, or timeout.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a key may be available
+        """
+        # Keys already read into blessed's buffer don't show up in select()
+        if self.term.kbhit(timeout=0):
+            return True
+
+        stdin = sys.__stdin__
+        if stdin is None or not stdin.isatty():
+            return self.term.kbhit(timeout=timeout)
+
+        fds = [stdin.fileno()]
+        if self._wake_fds is not None:
+            fds.append(self._wake_fds[0])
+        ready = select.select(fds, [], [], timeout)[0]
+        if self._wake_fds is not None and self._wake_fds[0] in ready:
+            os.read(self._wake_fds[0], 64)
+        return stdin.fileno() in ready
 
     def get_color(self, color_name: str) -> Any:
         """Get blessed color formatter.
@@ -133,4 +1028,4 @@ class Terminal:
         Returns:
             Blessed color formatter
         """
-        return getattr(self.term, color_name, self.term.normal)
+        return self.styles.formatter(color_name)
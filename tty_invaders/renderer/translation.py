@@ -0,0 +1,196 @@
+"""Detection of rigid translations between the screen and the next frame.
+
+When a large block of cells moves by a row or a column (e.g. the alien
+formation marching or descending), the terminal can move it with a scroll
+region plus insert/delete-line, or insert/delete-character, and only the
+cells that still differ need to be rewritten.
+"""
+from typing import List, NamedTuple, Optional, Sequence
+
+from .framebuffer import BLANK, Cell
+
+# Largest vertical and horizontal translation looked for, in cells
+MAX_SCROLL = 2
+MAX_SHIFT = 2
+
+# Minimum number of rewritten cells a translation must save to be used;
+# covers the escape sequences that express it
+MIN_SCROLL_SAVING = 24
+MIN_SHIFT_SAVING = 6
+
+Grid = Sequence[Sequence[Cell]]
+
+
+class Scroll(NamedTuple):
+    """Rows top..bottom (inclusive) move down by n (up if n is negative)."""
+
+    top: int
+    bottom: int
+    n: int
+
+
+class Shift(NamedTuple):
+    """Cells start..end (inclusive, screen columns) of row y move right by n."""
+
+    y: int
+    start: int
+    end: int
+    n: int
+
+
+def _mismatches(a: Sequence[Cell], b: Sequence[Cell]) -> int:
+    """Count cells that differ between two rows.
+
+    Args:
+        a: First row
+        b: Second row
+
+    Returns:
+        Number of differing cells
+    """
+    if a == b:
+        return 0
+    return sum(1 for x, y in zip(a, b) if x != y)
+
+
+def _blank_mismatches(row: Sequence[Cell]) -> int:
+    """Count cells of a row that are not blank.
+
+    Args:
+        row: Row of cells
+
+    Returns:
+        Number of non-blank cells
+    """
+    return sum(1 for cell in row if cell != BLANK)
+
+
+def plan_scroll(front: Grid, rows: Grid) -> Optional[Scroll]:
+    """Find the vertical translation that saves the most rewritten cells.
+
+    Args:
+        front: Cells currently on screen
+        rows: Cells of the next frame
+
+    Returns:
+        Scroll to apply before diffing, or None if no translation pays off
+    """
+    height = len(rows)
+    if height != len(front) or height < 2:
+        return None
+
+    changed = [_mismatches(rows[y], front[y]) for y in range(height)]
+    if sum(changed) < MIN_SCROLL_SAVING:
+        return None
+
+    best: Optional[Scroll] = None
+    best_saving = MIN_SCROLL_SAVING - 1
+    for n in range(-MAX_SCROLL, MAX_SCROLL + 1):
+        if n == 0:
+            continue
+        # Rows whose new content is the old content n rows away
+        ys = range(n, height) if n > 0 else range(0, height + n)
+        run_start: Optional[int] = None
+        for y in list(ys) + [None]:
+            if y is not None and rows[y] == front[y - n]:
+                if run_start is None:
+                    run_start = y
+                continue
+            if run_start is not None:
+                run_end = (y if y is not None else ys[-1] + 1) - 1
+                saving = sum(changed[run_start:run_end + 1])
+                if saving > best_saving:
+                    if n > 0:
+                        top, bottom = run_start - n, run_end
+                        exposed = range(top, run_start)
+                    else:
+                        top, bottom = run_start, run_end - n
+                        exposed = range(run_end + 1, bottom + 1)
+                    # Rows the scroll blanks must be repainted
+                    saving += sum(changed[e] - _blank_mismatches(rows[e]) for e in exposed)
+                    if saving > best_saving:
+                        best_saving = saving
+                        best = Scroll(top, bottom, n)
+                run_start = None
+    return best
+
+
+def apply_scroll(front: List[List[Cell]], scroll: Scroll) -> None:
+    """Update the screen model for a scroll.
+
+    Args:
+        front: Cells currently on screen (modified in place)
+        scroll: Applied scroll
+    """
+    top, bottom, n = scroll
+    width = len(front[0]) if front else 0
+    region = front[top:bottom + 1]
+    blanks = [[BLANK] * width for _ in range(abs(n))]
+    if n > 0:
+        region = blanks + region[:-n]
+    else:
+        region = region[-n:] + blanks
+    front[top:bottom + 1] = region
+
+
+def plan_shift(y: int, old: Sequence[Cell], new: Sequence[Cell]) -> Optional[Shift]:
+    """Find a horizontal translation of a row's changed span.
+
+    Args:
+        y: Row index
+        old: Row currently on screen
+        new: Row of the next frame
+
+    Returns:
+        Shift to apply before diffing, or None if no translation pays off
+    """
+    if old == new:
+        return None
+    width = len(new)
+    first = 0
+    while old[first] == new[first]:
+        first += 1
+    last = width - 1
+    while old[last] == new[last]:
+        last -= 1
+
+    plain = sum(1 for x in range(first, last + 1) if old[x] != new[x])
+    if plain < MIN_SHIFT_SAVING:
+        return None
+
+    best: Optional[Shift] = None
+    best_residual = plain - MIN_SHIFT_SAVING
+    for n in range(-MAX_SHIFT, MAX_SHIFT + 1):
+        if n == 0 or last - first + 1 <= abs(n):
+            continue
+        if n > 0:
+            # Old first..last-n lands on first+n..last; first..first+n-1 go blank
+            start, end = first, last - n
+            residual = sum(1 for x in range(first, first + n) if new[x] != BLANK)
+            residual += sum(1 for x in range(start, end + 1) if new[x + n] != old[x])
+        else:
+            # Old first-n..last lands on first..last+n; last+n+1..last go blank
+            start, end = first - n, last
+            residual = sum(1 for x in range(start, end + 1) if new[x + n] != old[x])
+            residual += sum(1 for x in range(last + n + 1, last + 1) if new[x] != BLANK)
+        if residual < best_residual:
+            best_residual = residual
+            best = Shift(y, start, end, n)
+    return best
+
+
+def apply_shift(row: List[Cell], shift: Shift) -> None:
+    """Update the screen model of a row for a shift.
+
+    Args:
+        row: Row currently on screen (modified in place)
+        shift: Applied shift
+    """
+    _, start, end, n = shift
+    block = row[start:end + 1]
+    if n > 0:
+        row[start:start + n] = [BLANK] * n
+        row[start + n:end + n + 1] = block
+    else:
+        row[start + n:end + n + 1] = block
+        row[end + n + 1:end + 1] = [BLANK] * -n
@@ -1,11 +1,17 @@
 """UI rendering for score, lives, and level display."""
-from .terminal import Terminal
+from typing import Any, List
+
+from .framebuffer import DrawCommand
+from .terminal import TerminalBackend
 from ..config import COLOR_UI, GAME_WIDTH
 
 
-def render_ui(term: Terminal, score: int, lives: int, level: int, high_score: int) -> None:
+def render_ui(term: TerminalBackend, score: int, lives: int, level: int, high_score: int) -> None:
     """Render the game UI (score, lives, level).
 
+    The UI lives in the cached "hud" layer and is only redrawn when one of
+    the displayed values changes.
+
     Args:
         term: Terminal instance
         score: Current score
@@ -13,30 +19,58 @@ def render_ui(term: Terminal, score: int, lives: int, level: int, high_score: in
         level: Current level
         high_score: High score
     """
-    # Top bar
-    term.write_at(0, 0, "=" * GAME_WIDTH, COLOR_UI)
+    hud = term.layer("hud")
+    if not hud.begin((score, lives, level, high_score)):
+        return
 
-    # Score (left side)
     score_text = f"SCORE: {score:06d}"
-    term.write_at(2, 1, score_text, "bright_white")
-
-    # High score (center) - make it stand out with bright yellow
     high_score_text = f"HI-SCORE: {high_score:06d}"
-    x = (GAME_WIDTH - len(high_score_text)) // 2
-    term.write_at(x, 1, high_score_text, "bright_yellow")
+    info_text = f"LIVES: {lives}  LVL: {level}"
+
+    hud.draw([
+        # Top bar
+        (0, 0, "=" * GAME_WIDTH, COLOR_UI),
+        # Score (left side)
+        (2, 1, score_text, "bright_white"),
+        # High score (center) - make it stand out with bright yellow
+        ((GAME_WIDTH - len(high_score_text)) // 2, 1, high_score_text, "bright_yellow"),
+        # Lives and level (right side)
+        (GAME_WIDTH - len(info_text) - 2, 1, info_text, "bright_white"),
+        # Bottom bar
+        (0, 2, "=" * GAME_WIDTH, COLOR_UI),
+    ])
+
 
-    # Lives and level (right side)
-    lives_text = f"LIVES: {lives}"
-    level_text = f"LVL: {level}"
-    info_text = f"{lives_text}  {level_text}"
-    x = GAME_WIDTH - len(info_text) - 2
-    term.write_at(x, 1, info_text, "bright_white")
+def render_border(target: Any, width: int, height: int) -> None:
+    """Render a double-line box around the screen.
+
+    Args:
+        target: Terminal or Layer to draw into
+        width: Box width
+        height: Box height
+    """
+    commands: List[DrawCommand] = [(0, 0, "╔" + "═" * (width - 2) + "╗", COLOR_UI)]
+    for y in range(1, height - 1):
+        commands.append((0, y, "║", COLOR_UI))
+        commands.append((width - 1, y, "║", COLOR_UI))
+    commands.append((0, height - 1, "╚" + "═" * (width - 2) + "╝", COLOR_UI))
+    target.draw(commands)
 
-    # Bottom bar
-    term.write_at(0, 2, "=" * GAME_WIDTH, COLOR_UI)
 
+def render_cached_border(term: TerminalBackend) -> None:
+    """Render the screen border into the cached background layer.
 
-def render_menu(term: Terminal, title: str, options: list[tuple[str, bool]],
+    The border is only recomposed when the terminal height changes.
+
+    Args:
+        term: Terminal instance
+    """
+    background = term.layer("background")
+    if background.begin(("border", term.height)):
+        render_border(background, GAME_WIDTH, term.height)
+
+
+def render_menu(term: TerminalBackend, title: str, options: list[tuple[str, bool]],
                 footer: str = "") -> None:
     """Render a menu screen.
 
@@ -49,18 +83,13 @@ def render_menu(term: Terminal, title: str, options: list[tuple[str, bool]],
     height = term.height
     width = GAME_WIDTH
 
-    # Clear and draw border
-    term.clear()
-    term.write_at(0, 0, "╔" + "═" * (width - 2) + "╗", COLOR_UI)
-    for y in range(1, height - 1):
-        term.write_at(0, y, "║", COLOR_UI)
-        term.write_at(width - 1, y, "║", COLOR_UI)
-    term.write_at(0, height - 1, "╚" + "═" * (width - 2) + "╝", COLOR_UI)
+    # Border (cached)
+    render_cached_border(term)
 
     # Title
     title_y = height // 4
     title_x = (width - len(title)) // 2
-    term.write_at(title_x, title_y, title, "bright_cyan")
+    commands: List[DrawCommand] = [(title_x, title_y, title, "bright_cyan")]
 
     # Options
     start_y = height // 2 - len(options)
@@ -70,16 +99,18 @@ def render_menu(term: Terminal, title: str, options: list[tuple[str, bool]],
         option_text = prefix + option
         x = (width - len(option_text)) // 2
         color = "bright_white" if selected else "white"
-        term.write_at(x, y, option_text, color)
+        commands.append((x, y, option_text, color))
 
     # Footer
     if footer:
         footer_y = height - 3
         footer_x = (width - len(footer)) // 2
-        term.write_at(footer_x, footer_y, footer, "bright_black")
+        commands.append((footer_x, footer_y, footer, "bright_black"))
+
+    term.draw(commands)
 
 
-def render_game_over(term: Terminal, score: int, is_high_score: bool) -> None:
+def render_game_over(term: TerminalBackend, score: int, is_high_score: bool) -> None:
     """Render game over screen.
 
     Args:
@@ -105,7 +136,7 @@ def render_game_over(term: Terminal, score: int, is_high_score: bool) -> None:
         term.write_at((width - len(high_score_msg)) // 2, y, high_score_msg, "yellow")
 
 
-def render_level_complete(term: Terminal, level: int) -> None:
+def render_level_complete(term: TerminalBackend, level: int) -> None:
     """Render level complete screen.
 
     Args:
@@ -123,7 +154,7 @@ def render_level_complete(term: Terminal, level: int) -> None:
     term.write_at((width - len(next_text)) // 2, y + 2, next_text, COLOR_UI)
 
 
-def render_paused(term: Terminal) -> None:
+def render_paused(term: TerminalBackend) -> None:
     """Render paused overlay.
 
     Args:
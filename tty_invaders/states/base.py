@@ -2,11 +2,18 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
-from ..renderer.terminal import Terminal
+from ..renderer.terminal import TerminalBackend
 
 
 class BaseState(ABC):
-    """Abstract base class for game states."""
+    """Abstract base class for game states.
+
+    Animated states are updated and rendered every frame. Static states are
+    only rendered after input, a resize, a state change or request_repaint(),
+    and the game loop sleeps until then (or until next_wakeup()).
+    """
+
+    animated = True
 
     def __init__(self, game: Any) -> None:
         """Initialize the state.
@@ -45,7 +52,7 @@ class BaseState(ABC):
         pass
 
     @abstractmethod
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the state.
 
         Args:
@@ -53,6 +60,30 @@ class BaseState(ABC):
         """
         pass
 
+    def next_wakeup(self) -> Optional[float]:
+        """Get the time until a static state needs an update without input.
+
+        Returns:
+            Seconds until the next scheduled update, or None to wait for input
+        """
+        return None
+
+    def request_repaint(self) -> None:
+        """Ask for the state to be rendered on the next frame."""
+        self.game.state_manager.request_repaint()
+
+    def on_resize(self, width: int, height: int) -> None:
+        """Called after the terminal was resized.
+
+        Cached layers have already been invalidated and are redrawn on the
+        next render.
+
+        Args:
+            width: New terminal width
+            height: New terminal height
+        """
+        pass
+
 
 class StateManager:
     """Manages game state transitions."""
@@ -66,6 +97,7 @@ class StateManager:
         self.game = game
         self.current_state: Optional[BaseState] = None
         self.states: dict[str, BaseState] = {}
+        self.repaint_requested = False
 
     def add_state(self, name: str, state: BaseState) -> None:
         """Add a state to the manager.
@@ -88,8 +120,12 @@ class StateManager:
         if self.current_state:
             self.current_state.exit()
 
+        # Cached layers belong to the state that drew them
+        self.game.terminal.compositor.reset()
+
         self.current_state = self.states[name]
         self.current_state.enter()
+        self.repaint_requested = True
 
     def handle_input(self, key: Any) -> None:
         """Delegate input handling to current state.
@@ -98,6 +134,9 @@ class StateManager:
             key: Key object from blessed
         """
         if self.current_state:
+            if key:
+                # Input may change anything a static state shows
+                self.repaint_requested = True
             self.current_state.handle_input(key)
 
     def update(self, dt: float) -> None:
@@ -109,7 +148,48 @@ class StateManager:
         if self.current_state:
             self.current_state.update(dt)
 
-    def render(self, term: Terminal) -> None:
+    def resize(self, width: int, height: int) -> None:
+        """Reflow cached layers and notify the current state of a resize.
+
+        Args:
+            width: New terminal width
+            height: New terminal height
+        """
+        self.game.terminal.compositor.reset()
+        self.repaint_requested = True
+        if self.current_state:
+            self.current_state.on_resize(width, height)
+
+    def request_repaint(self) -> None:
+        """Ask for the current state to be rendered on the next frame."""
+        self.repaint_requested = True
+
+    @property
+    def animated(self) -> bool:
+        """Check if the current state is rendered every frame."""
+        return self.current_state is not None and self.current_state.animated
+
+    def needs_render(self) -> bool:
+        """Check and reset whether the current state must be rendered.
+
+        Returns:
+            True for animated states, or if a repaint was requested
+        """
+        render = self.animated or self.repaint_requested
+        self.repaint_requested = False
+        return render and self.current_state is not None
+
+    def next_wakeup(self) -> Optional[float]:
+        """Get the time until the current state needs an update without input.
+
+        Returns:
+            Seconds until the next scheduled update, or None to wait for input
+        """
+        if self.current_state:
+            return self.current_state.next_wakeup()
+        return None
+
+    def render(self, term: TerminalBackend) -> None:
         """Delegate rendering to current state.
 
         Args:
@@ -1,15 +1,20 @@
 """Game over state."""
-from typing import Any
+from typing import Any, Optional
 
 from .base import BaseState
-from ..renderer.terminal import Terminal
+from ..renderer.terminal import TerminalBackend
 from ..renderer.ui import render_game_over
 from ..config import GAME_WIDTH
 
+# Seconds before the score screen can be dismissed
+CONTINUE_DELAY = 2.0
+
 
 class GameOverState(BaseState):
     """Game over state with optional name entry."""
 
+    animated = False
+
     def __init__(self, game: Any) -> None:
         """Initialize game over state.
 
@@ -25,13 +30,10 @@ class GameOverState(BaseState):
 
     def enter(self) -> None:
         """Called when entering game over state."""
-        # Check if this is a high score
-        from ..utils.persistence import HighScoreManager
-
         self.sound_manager.play_game_over()
 
-        hsm = HighScoreManager()
-        self.is_high_score = hsm.is_high_score(self.game.score)
+        # Check if this is a high score
+        self.is_high_score = self.game.scores.is_high_score(self.game.score)
 
         if self.is_high_score:
             self.entering_name = True
@@ -67,19 +69,17 @@ class GameOverState(BaseState):
                 self.player_name += key.upper()
         else:
             # Return to menu after showing score
-            if self.wait_time > 2.0:  # Wait at least 2 seconds
+            if self.wait_time > CONTINUE_DELAY:
                 self.game.state_manager.change_state("menu")
 
     def _save_high_score(self) -> None:
         """Save the high score."""
-        from ..utils.persistence import HighScoreManager
-
-        hsm = HighScoreManager()
+        scores = self.game.scores
         game_mode = self.game.settings.get("game_mode", "normal")
-        hsm.add_score(self.player_name, self.game.score, self.game.level, game_mode)
+        scores.add_score(self.player_name, self.game.score, self.game.level, game_mode)
 
         # Update game high score
-        self.game.high_score = hsm.get_top_score()
+        self.game.high_score = scores.get_top_score()
 
     def update(self, dt: float) -> None:
         """Update game over logic.
@@ -87,9 +87,22 @@ class GameOverState(BaseState):
         Args:
             dt: Delta time in seconds
         """
+        was_waiting = self.wait_time <= CONTINUE_DELAY
         self.wait_time += dt
+        if was_waiting and self.wait_time > CONTINUE_DELAY:
+            self.request_repaint()  # Show the continue prompt
+
+    def next_wakeup(self) -> Optional[float]:
+        """Get the time until the continue prompt appears.
+
+        Returns:
+            Seconds until the prompt is due, or None once it is shown
+        """
+        if self.entering_name or self.wait_time > CONTINUE_DELAY:
+            return None
+        return CONTINUE_DELAY - self.wait_time
 
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the game over screen.
 
         Args:
@@ -107,7 +120,7 @@ class GameOverState(BaseState):
             term.write_at((GAME_WIDTH - len(name_display)) // 2, y + 2, name_display, "yellow")
         else:
             # Show continue prompt
-            if self.wait_time > 2.0:
+            if self.wait_time > CONTINUE_DELAY:
                 prompt = "Press any key to continue"
                 y = term.height // 2 + 4
                 term.write_at((GAME_WIDTH - len(prompt)) // 2, y, prompt, "bright_black")
@@ -1,14 +1,18 @@
 """Leaderboard state."""
-from typing import Any
+from typing import Any, List
 
 from .base import BaseState
-from ..renderer.terminal import Terminal
-from ..config import GAME_WIDTH, COLOR_UI
+from ..renderer.terminal import TerminalBackend
+from ..renderer.ui import render_border
+from ..utils.persistence import HighScoreEntry
+from ..config import GAME_WIDTH
 
 
 class LeaderboardState(BaseState):
     """Leaderboard display state."""
 
+    animated = False
+
     def __init__(self, game: Any) -> None:
         """Initialize leaderboard state.
 
@@ -43,47 +47,53 @@ class LeaderboardState(BaseState):
         """
         pass
 
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the leaderboard.
 
+        The whole screen is composed into the cached background layer and
+        only redrawn when the scores or the terminal height change.
+
         Args:
             term: Terminal instance
         """
-        from ..utils.persistence import HighScoreManager
+        scores = self.game.scores
+        scores.refresh()
+        background = term.layer("background")
+        if background.begin(("leaderboard", scores.version, term.height)):
+            self._compose(background, scores.get_entries(), term.height)
+
+    def _compose(self, target: Any, entries: List[HighScoreEntry], height: int) -> None:
+        """Draw the leaderboard screen.
 
-        height = term.height
+        Args:
+            target: Layer to draw into
+            entries: High score entries
+            height: Terminal height
+        """
         width = GAME_WIDTH
 
-        # Clear and draw border
-        term.write_at(0, 0, "╔" + "═" * (width - 2) + "╗", COLOR_UI)
-        for y in range(1, height - 1):
-            term.write_at(0, y, "║", COLOR_UI)
-            term.write_at(width - 1, y, "║", COLOR_UI)
-        term.write_at(0, height - 1, "╚" + "═" * (width - 2) + "╝", COLOR_UI)
+        # Border
+        render_border(target, width, height)
 
         # Title
         title = "HIGH SCORES"
         title_y = 2
         title_x = (width - len(title)) // 2
-        term.write_at(title_x, title_y, title, "bright_cyan")
-
-        # Load and display scores
-        hsm = HighScoreManager()
-        entries = hsm.get_entries()
+        target.write_at(title_x, title_y, title, "bright_cyan")
 
         if not entries:
             no_scores = "No high scores yet!"
             y = height // 2
-            term.write_at((width - len(no_scores)) // 2, y, no_scores, "bright_black")
+            target.write_at((width - len(no_scores)) // 2, y, no_scores, "bright_black")
         else:
             # Table header
             header = "  RANK  NAME   SCORE    LVL  MODE"
             header_y = 5
-            term.write_at((width - len(header)) // 2, header_y, header, "white")
+            target.write_at((width - len(header)) // 2, header_y, header, "white")
 
             # Separator
             separator = "  " + "─" * (len(header) - 2)
-            term.write_at((width - len(separator)) // 2, header_y + 1, separator, "bright_black")
+            target.write_at((width - len(separator)) // 2, header_y + 1, separator, "bright_black")
 
             # Entries
             start_y = header_y + 2
@@ -107,10 +117,10 @@ class LeaderboardState(BaseState):
 
                 color = "yellow" if i == 1 else "white" if i <= 3 else "bright_black"
                 y = start_y + i - 1
-                term.write_at((width - len(line)) // 2, y, line, color)
+                target.write_at((width - len(line)) // 2, y, line, color)
 
         # Footer
         footer = "Press any key to return to menu"
         footer_y = height - 3
         footer_x = (width - len(footer)) // 2
-        term.write_at(footer_x, footer_y, footer, "bright_black")
+        target.write_at(footer_x, footer_y, footer, "bright_black")
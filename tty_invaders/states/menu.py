@@ -2,13 +2,15 @@
 from typing import Any
 
 from .base import BaseState
-from ..renderer.terminal import Terminal
+from ..renderer.terminal import TerminalBackend
 from ..renderer.ui import render_menu
 
 
 class MenuState(BaseState):
     """Main menu state."""
 
+    animated = False
+
     def __init__(self, game: Any) -> None:
         """Initialize menu state.
 
@@ -67,7 +69,7 @@ class MenuState(BaseState):
         # Menu is static, no update needed
         pass
 
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the menu.
 
         Args:
@@ -2,13 +2,15 @@
 from typing import Any, List, Tuple
 
 from .base import BaseState
-from ..renderer.terminal import Terminal
+from ..renderer.terminal import TerminalBackend
 from ..config import GAME_WIDTH
 
 
 class OptionsState(BaseState):
     """Options menu state for game customization."""
 
+    animated = False
+
     def __init__(self, game: Any) -> None:
         """Initialize options state.
 
@@ -138,7 +140,7 @@ class OptionsState(BaseState):
         """
         pass
 
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the options menu.
 
         Args:
@@ -2,13 +2,15 @@
 from typing import Any
 
 from .base import BaseState
-from ..renderer.terminal import Terminal
+from ..renderer.terminal import TerminalBackend
 from ..renderer.ui import render_paused
 
 
 class PausedState(BaseState):
     """Paused game state."""
 
+    animated = False
+
     def __init__(self, game: Any) -> None:
         """Initialize paused state.
 
@@ -53,7 +55,7 @@ class PausedState(BaseState):
         # Paused - no updates
         pass
 
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the paused screen.
 
         Args:
@@ -2,20 +2,22 @@
 from typing import Any, List
 
 from .base import BaseState
-from ..renderer.terminal import Terminal
+from ..renderer.compositor import LAYER_EFFECTS, LAYER_PLAYFIELD
+from ..renderer.framebuffer import DrawCommand
+from ..renderer.sprites import sprite_commands
+from ..renderer.terminal import TerminalBackend
 from ..renderer.ui import render_ui
 from ..renderer.effects import EffectsManager
 from ..entities.player import Player
 from ..entities.bullet import Bullet
-from ..entities.formation import AlienFormation
+from ..entities.array_formation import create_formation
 from ..entities.shield import Shield, create_shields
 from ..entities.mystery_ship import MysteryShip
 from ..systems.input import InputState, process_gameplay_input
 from ..utils.color_effects import ColorEffects
 from ..systems.collision import (
-    check_bullet_alien_collisions, check_bullet_shield_collisions,
-    check_bullet_player_collision, check_alien_player_collision,
-    check_aliens_reached_bottom
+    check_bullet_formation_collisions, check_bullet_shield_collisions,
+    check_bullet_player_collision, check_alien_player_collision
 )
 from ..config import PLAYER_LIVES, PLAY_AREA_BOTTOM
 
@@ -32,7 +34,7 @@ class PlayingState(BaseState):
         super().__init__(game)
         self.sound_manager = game.sound_manager
         self.player = Player()
-        self.formation = AlienFormation(1)
+        self.formation = create_formation(1)
         self.shields: List[Shield] = []
         self.bullets: List[Bullet] = []
         self.input_state = InputState()
@@ -198,7 +200,7 @@ class PlayingState(BaseState):
         alive_aliens = self.formation.get_alive_aliens()
 
         # Bullets vs Aliens
-        for bullet, alien in check_bullet_alien_collisions(self.bullets, alive_aliens):
+        for bullet, alien in check_bullet_formation_collisions(self.bullets, self.formation):
             bullet.alive = False
             alien.alive = False
             self.game.score += alien.get_score_value()
@@ -240,7 +242,7 @@ class PlayingState(BaseState):
             self._player_hit()
 
         # Aliens reached bottom
-        if check_aliens_reached_bottom(alive_aliens, PLAY_AREA_BOTTOM):
+        if self.formation.reached_bottom(PLAY_AREA_BOTTOM):
             self._player_hit()
 
     def _calculate_mystery_ship_score(self) -> int:
@@ -297,7 +299,7 @@ class PlayingState(BaseState):
             self.shields = create_shields()
             self.bullets.clear()
 
-    def render(self, term: Terminal) -> None:
+    def render(self, term: TerminalBackend) -> None:
         """Render the gameplay.
 
         Args:
@@ -306,32 +308,49 @@ class PlayingState(BaseState):
         # Render UI
         render_ui(term, self.game.score, self.game.lives, self.game.level, self.game.high_score)
 
-        # Render shields
-        for i, shield in enumerate(self.shields):
-            if shield.alive:
-                sprite = shield.get_sprite()
-                color = self.color_effects.get_color(shield.color, i + 100)
-                for j, line in enumerate(sprite):
-                    term.write_at(shield.x, shield.y + j, line, color)
-
-        # Render aliens
-        for i, alien in enumerate(self.formation.get_alive_aliens()):
-            color = self.color_effects.get_alien_color(alien.color, i)
-            for j, line in enumerate(alien.sprite):
-                term.write_at(int(alien.x), alien.y + j, line, color)
+        # The playfield is submitted as one draw list, bottom to top
+        commands: List[DrawCommand] = []
+
+        # Render shields (cached in the background layer unless colors cycle)
+        if self.color_effects.mode == "normal":
+            background = term.layer("background")
+            frames = tuple(s.get_frame() if s.alive else -1 for s in self.shields)
+            if background.begin(("shields", frames)):
+                for shield, frame in zip(self.shields, frames):
+                    if shield.alive:
+                        background.draw_sprite(shield.x, shield.y, shield.sprite_id, frame,
+                                               shield.color)
+        else:
+            for i, shield in enumerate(self.shields):
+                if shield.alive:
+                    color = self.color_effects.get_color(shield.color, i + 100)
+                    commands += sprite_commands(shield.x, shield.y, shield.sprite_id,
+                                                shield.get_frame(), color)
+
+        # Render aliens (one run per sprite line unless colors vary per alien)
+        if self.color_effects.mode == "normal":
+            # Truncate like the aliens' bounds do; the origin can be negative
+            # once the left columns are dead
+            x, y = self.formation.origin_x, self.formation.origin_y
+            commands += [(int(x + dx), y + dy, text, color)
+                         for dx, dy, text, color in self.formation.get_row_lines()]
+        else:
+            for i, alien in enumerate(self.formation.get_alive_aliens()):
+                color = self.color_effects.get_alien_color(alien.color, i)
+                commands += sprite_commands(int(alien.x), alien.y, alien.sprite_id,
+                                            alien.frame, color)
 
         # Render mystery ship
         if self.mystery_ship and self.mystery_ship.alive:
             mx, my = self.mystery_ship.get_position()
             color = self.color_effects.get_color(self.mystery_ship.color, 500)
-            for i, line in enumerate(self.mystery_ship.sprite):
-                term.write_at(mx, my + i, line, color)
+            commands += sprite_commands(mx, my, self.mystery_ship.sprite_id, 0, color)
 
         # Render player
         if self.player.alive:
             color = self.color_effects.get_player_color(self.player.color)
-            for i, line in enumerate(self.player.sprite):
-                term.write_at(int(self.player.x), self.player.y + i, line, color)
+            commands += sprite_commands(int(self.player.x), self.player.y,
+                                        self.player.sprite_id, 0, color)
 
         # Render bullets
         for bullet in self.bullets:
@@ -339,11 +358,16 @@ class PlayingState(BaseState):
                 x, y = bullet.get_position()
                 is_player_bullet = bullet.char == "|"
                 color = self.color_effects.get_bullet_color(bullet.color, is_player_bullet)
-                term.write_at(x, y, bullet.char, color)
+                commands.append((x, y, bullet.char, color))
+
+        term.submit(commands, LAYER_PLAYFIELD)
 
         # Render effects
+        effects: List[DrawCommand] = []
         for explosion in self.effects.explosions:
-            sprite = explosion.get_sprite()
-            color = self.color_effects.get_color(explosion.color, self.frame_count)
-            for i, line in enumerate(sprite):
-                term.write_at(explosion.x, explosion.y + i, line, color)
+            if explosion.alive:
+                color = self.color_effects.get_color(explosion.color, self.frame_count)
+                effects += sprite_commands(explosion.x, explosion.y, explosion.sprite_id,
+                                           explosion.frame, color)
+        if effects:
+            term.submit(effects, LAYER_EFFECTS)
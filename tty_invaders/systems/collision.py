@@ -1,5 +1,9 @@
 """Collision detection system."""
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import COLLISION_BUCKET_SIZE
+from ..entities.bullet import Bullet
+from ..entities.shield import Shield
 
 
 def check_aabb_collision(box1: tuple[int, int, int, int],
@@ -22,6 +26,60 @@ def check_aabb_collision(box1: tuple[int, int, int, int],
             y1 + h1 > y2)
 
 
+class SpatialHash:
+    """Uniform grid of buckets over terminal cells for broadphase lookups.
+
+    Each object is added to every bucket its bounds overlap, so looking
+    up a cell only tests the objects in that cell's bucket rather than
+    every object.
+    """
+
+    def __init__(self, bucket_size: int = COLLISION_BUCKET_SIZE) -> None:
+        """Initialize an empty hash.
+
+        Args:
+            bucket_size: Width and height of a bucket in cells
+        """
+        self.bucket_size = bucket_size
+        self._buckets: Dict[Tuple[int, int], List[Tuple[Any, Tuple[int, int, int, int]]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Get the number of inserted objects."""
+        return self._count
+
+    def insert(self, obj: Any, bounds: Tuple[int, int, int, int]) -> None:
+        """Add an object to every bucket its bounds overlap.
+
+        Args:
+            obj: Object to return from lookups
+            bounds: Its bounding box (x, y, width, height)
+        """
+        x, y, w, h = bounds
+        size = self.bucket_size
+        entry = (obj, bounds)
+        for by in range(y // size, (y + max(h, 1) - 1) // size + 1):
+            for bx in range(x // size, (x + max(w, 1) - 1) // size + 1):
+                self._buckets.setdefault((bx, by), []).append(entry)
+        self._count += 1
+
+    def first_at(self, x: int, y: int) -> Optional[Any]:
+        """Find the first inserted object covering a cell.
+
+        Args:
+            x: Cell column
+            y: Cell row
+
+        Returns:
+            Object whose bounds contain the cell, or None
+        """
+        size = self.bucket_size
+        for obj, (ox, oy, ow, oh) in self._buckets.get((x // size, y // size), ()):
+            if ox <= x < ox + ow and oy <= y < oy + oh:
+                return obj
+        return None
+
+
 def check_bullet_alien_collisions(bullets: list[Any], aliens: list[Any]) -> list[tuple[Any, Any]]:
     """Check collisions between bullets and aliens.
 
@@ -53,9 +111,41 @@ def check_bullet_alien_collisions(bullets: list[Any], aliens: list[Any]) -> list
     return collisions
 
 
+def check_bullet_formation_collisions(bullets: list[Any],
+                                     formation: Any) -> list[tuple[Any, Any]]:
+    """Check collisions between bullets and an alien formation.
+
+    Gives the same pairs as check_bullet_alien_collisions() with the
+    formation's alive aliens, but looks each bullet's cell up on the
+    formation lattice instead of testing it against every alien.
+
+    Args:
+        bullets: List of Bullet instances (one cell each)
+        formation: AlienFormation instance
+
+    Returns:
+        List of (bullet, alien) collision pairs
+    """
+    collisions = []
+
+    for bullet in bullets:
+        if not bullet.alive or not bullet.is_player:
+            continue
+
+        x, y, _, _ = bullet.get_bounds()
+        alien = formation.alien_at(x, y)
+        if alien is not None:
+            collisions.append((bullet, alien))
+
+    return collisions
+
+
 def check_bullet_shield_collisions(bullets: list[Any], shields: list[Any]) -> list[tuple[Any, Any]]:
     """Check collisions between bullets and shields.
 
+    The alive shields are put in a SpatialHash once per call, so each
+    bullet (one cell) is only tested against the shields in its bucket.
+
     Args:
         bullets: List of Bullet instances
         shields: List of Shield instances
@@ -63,23 +153,23 @@ def check_bullet_shield_collisions(bullets: list[Any], shields: list[Any]) -> li
     Returns:
         List of (bullet, shield) collision pairs
     """
-    collisions = []
+    collisions: List[Tuple[Bullet, Shield]] = []
+
+    grid = SpatialHash()
+    for shield in shields:
+        if shield.alive:
+            grid.insert(shield, shield.get_bounds())
+    if not len(grid):
+        return collisions
 
     for bullet in bullets:
         if not bullet.alive:
             continue
 
-        bullet_bounds = bullet.get_bounds()
-
-        for shield in shields:
-            if not shield.alive:
-                continue
-
-            shield_bounds = shield.get_bounds()
-
-            if check_aabb_collision(bullet_bounds, shield_bounds):
-                collisions.append((bullet, shield))
-                break  # Bullet can only hit one shield
+        x, y, _, _ = bullet.get_bounds()
+        shield = grid.first_at(x, y)  # Bullet can only hit one shield
+        if shield is not None:
+            collisions.append((bullet, shield))
 
     return collisions
 
@@ -0,0 +1,158 @@
+"""Cached terminal capability probes."""
+import json
+import os
+import re
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ..config import TERMINAL_CAPS_FILE
+
+# Environment variables that identify a terminal emulator and version
+_IDENTITY_VARS = ("TERM", "TERM_PROGRAM", "TERM_PROGRAM_VERSION", "VTE_VERSION", "TMUX")
+
+# Primary Device Attributes request; every VT100-compatible terminal answers it
+DA1_QUERY = b"\x1b[c"
+
+_DA1_REPLY = re.compile(rb"\x1b\[\?[\d;]*c")
+
+
+def terminal_identity(environ: Optional[Mapping[str, str]] = None) -> str:
+    """Build a key identifying the current terminal emulator.
+
+    Args:
+        environ: Environment to read (defaults to os.environ)
+
+    Returns:
+        Identity string used as the cache key
+    """
+    env = os.environ if environ is None else environ
+    parts = []
+    for name in _IDENTITY_VARS:
+        value = env.get(name, "")
+        if name == "TMUX":
+            value = "1" if value else ""  # Socket path differs per session
+        parts.append(f"{name}={value}")
+    return ";".join(parts)
+
+
+def decrqm_query(mode: int) -> bytes:
+    """Build a DECRQM query for a private mode.
+
+    Args:
+        mode: DEC private mode number
+
+    Returns:
+        Encoded query sequence
+    """
+    return f"\x1b[?{mode}$p".encode()
+
+
+def _decrpm_reply(mode: int) -> bytes:
+    """Build the pattern of a DECRPM reply for a private mode.
+
+    Args:
+        mode: DEC private mode number
+
+    Returns:
+        Regular expression capturing the status digit
+    """
+    return rb"\x1b\[\?" + str(mode).encode() + rb";(\d)\$y"
+
+
+def parse_decrqm_reply(data: bytes, mode: int) -> Optional[int]:
+    """Extract the DECRPM status for a mode from terminal input.
+
+    Args:
+        data: Bytes read from the terminal
+        mode: DEC private mode number that was queried
+
+    Returns:
+        Status value (0 unknown, 1 set, 2 reset, 3 permanently set,
+        4 permanently reset), or None if no complete reply was found
+    """
+    match = re.search(_decrpm_reply(mode), data)
+    if match is None:
+        return None
+    return int(match.group(1))
+
+
+def split_probe_reply(data: bytes, mode: int) -> Tuple[Optional[int], bytes]:
+    """Extract the result of a DECRQM query followed by DA1 from terminal input.
+
+    Terminals answer queries in order, so once the DA1 reply has arrived
+    any DECRPM reply has too; a terminal that ignores DECRQM only answers
+    DA1.
+
+    Args:
+        data: Bytes read from the terminal
+        mode: DEC private mode number that was queried
+
+    Returns:
+        Tuple of (status, leftover). status is the DECRPM status, 0 (mode
+        not recognized) if only DA1 was answered, or None while the DA1
+        reply is incomplete; leftover is the input without the replies
+    """
+    da1 = _DA1_REPLY.search(data)
+    if da1 is None:
+        return None, data
+    leftover = data[:da1.start()] + data[da1.end():]
+    status = parse_decrqm_reply(data[:da1.start()], mode)
+    if status is None:
+        return 0, leftover
+    return status, re.sub(_decrpm_reply(mode), b"", leftover, count=1)
+
+
+class CapabilityCache:
+    """Persists probe results per terminal identity."""
+
+    def __init__(self, filename: str = TERMINAL_CAPS_FILE) -> None:
+        """Initialize the cache.
+
+        Args:
+            filename: Path to cache file
+        """
+        self.filename = filename
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load cached probe results from file."""
+        if not os.path.exists(self.filename):
+            self.entries = {}
+            return
+
+        try:
+            with open(self.filename, 'r') as f:
+                data = json.load(f)
+                self.entries = data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, IOError):
+            self.entries = {}
+
+    def save(self) -> None:
+        """Save probe results to file."""
+        try:
+            with open(self.filename, 'w') as f:
+                json.dump(self.entries, f, indent=2)
+        except IOError:
+            pass  # Probing again next launch is harmless
+
+    def get(self, identity: str, name: str) -> Optional[Any]:
+        """Get a cached probe result.
+
+        Args:
+            identity: Terminal identity
+            name: Capability name
+
+        Returns:
+            Cached value, or None if not probed yet
+        """
+        return self.entries.get(identity, {}).get(name)
+
+    def set(self, identity: str, name: str, value: Any) -> None:
+        """Store a probe result.
+
+        Args:
+            identity: Terminal identity
+            name: Capability name
+            value: Probe result
+        """
+        self.entries.setdefault(identity, {})[name] = value
@@ -1,7 +1,7 @@
 """High score persistence."""
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from ..config import HIGH_SCORE_FILE, MAX_HIGH_SCORES
@@ -155,3 +155,98 @@ class HighScoreManager:
             List of high score entries
         """
         return self.entries.copy()
+
+
+class ScoreService:
+    """Long-lived in-memory view of the high score file.
+
+    The file is parsed once and reads are served from memory. It is only
+    reloaded when its mtime, inode or size changes (e.g. another session
+    saved a score); version increments on every change so views such as
+    the leaderboard can cache what they drew.
+    """
+
+    def __init__(self, filename: str = HIGH_SCORE_FILE) -> None:
+        """Initialize the score service.
+
+        Args:
+            filename: Path to high score file
+        """
+        self.filename = filename
+        self._manager = HighScoreManager(filename)
+        self._stamp = self._file_stamp()
+        self.version = 0
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Get what identifies the current contents of the file.
+
+        Returns:
+            Tuple of (mtime_ns, inode, size), or None if the file is missing
+        """
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_ino, st.st_size
+
+    def refresh(self) -> bool:
+        """Reload the scores if the file changed on disk.
+
+        Returns:
+            True if the scores were reloaded
+        """
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return False
+        self._manager.load()
+        self._stamp = stamp
+        self.version += 1
+        return True
+
+    def add_score(self, name: str, score: int, level: int, game_mode: str = "normal") -> int:
+        """Add a new high score and save it.
+
+        Args:
+            name: Player name
+            score: Score achieved
+            level: Level reached
+            game_mode: Game mode used
+
+        Returns:
+            Position in high score table (1-indexed), or 0 if not in top scores
+        """
+        self.refresh()
+        position = self._manager.add_score(name, score, level, game_mode)
+        self._stamp = self._file_stamp()
+        self.version += 1
+        return position
+
+    def is_high_score(self, score: int) -> bool:
+        """Check if a score qualifies as a high score.
+
+        Args:
+            score: Score to check
+
+        Returns:
+            True if score would be in top scores
+        """
+        self.refresh()
+        return self._manager.is_high_score(score)
+
+    def get_top_score(self) -> int:
+        """Get the highest score.
+
+        Returns:
+            Highest score, or 0 if no scores
+        """
+        self.refresh()
+        return self._manager.get_top_score()
+
+    def get_entries(self) -> List[HighScoreEntry]:
+        """Get all high score entries.
+
+        Returns:
+            List of high score entries
+        """
+        self.refresh()
+        return self._manager.get_entries()
@@ -20,6 +20,9 @@ class GameSettings:
         "color_mode": "normal",  # normal, rainbow, disco, matrix, psychedelic
         "show_trails": False,
 
+        # Rendering
+        "render_backend": "blessed",  # blessed, curses
+
         # Gameplay modifiers
         "rapid_fire": False,  # No shoot cooldown
         "bullet_hell": False,  # Aliens shoot way more